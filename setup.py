@@ -25,6 +25,10 @@ setup(
         "packaging": [
             "py2app>=0.28.0",
         ],
+        "speed": [
+            "numba>=0.58.0",
+            "numpy>=1.24.0",
+        ],
     },
     python_requires=">=3.10",
     entry_points={
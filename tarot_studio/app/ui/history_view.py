@@ -6,11 +6,35 @@ import objc
 from Foundation import *
 from AppKit import *
 from Cocoa import *
+from libdispatch import (
+    dispatch_async, dispatch_get_global_queue, dispatch_get_main_queue,
+    DISPATCH_QUEUE_PRIORITY_DEFAULT
+)
+from sqlalchemy import func
+from sqlalchemy.orm import scoped_session, sessionmaker
 import logging
+from collections import defaultdict
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Static fragments of the reading detail text
+DETAIL_READING_PREFIX = "Reading: "
+DETAIL_DATE_PREFIX = "Date: "
+DETAIL_SPREAD_PREFIX = "Spread: "
+DETAIL_CARDS_HEADER = "Cards:\n"
+DETAIL_SUMMARY_HEADER = "\nSummary:\n"
+DETAIL_INTERPRETATION_HEADER = "\nInterpretation:\n"
+
+# Seconds to wait after the last keystroke before filtering
+SEARCH_DEBOUNCE_INTERVAL = 0.2
+
+def _reading_matches(reading, search_term):
+    """Return whether a reading row matches a lowercased search term."""
+    return (search_term in reading['title'].lower() or
+            search_term in reading['spread_id'].lower() or
+            any(search_term in card.lower() for card in reading['cards']))
+
 class HistoryView(NSView):
     """History view for past readings."""
     
@@ -26,7 +50,19 @@ class HistoryView(NSView):
             self.session = None
             self.ollama_client = None
             self.memory_store = None
-            self.readings = []
+            # Visible rows are stored column-wise; the table callback reads
+            # one column across many rows while scrolling
+            self._col_id = []
+            self._col_date_str = []
+            self._col_title = []
+            self._col_spread_str = []
+            self._col_cards_str = []
+            self._details_by_id = {}
+            self._search_timer = None
+            self._search_term = ""
+            self._background_session = None
+            self._all_readings = []
+            self._cache_fingerprint = None
             
             # Create UI components
             self.createUI()
@@ -45,7 +81,19 @@ class HistoryView(NSView):
             self.session = None
             self.ollama_client = None
             self.memory_store = None
-            self.readings = []
+            # Visible rows are stored column-wise; the table callback reads
+            # one column across many rows while scrolling
+            self._col_id = []
+            self._col_date_str = []
+            self._col_title = []
+            self._col_spread_str = []
+            self._col_cards_str = []
+            self._details_by_id = {}
+            self._search_timer = None
+            self._search_term = ""
+            self._background_session = None
+            self._all_readings = []
+            self._cache_fingerprint = None
             
             # Create UI components
             self.createUI()
@@ -70,10 +118,24 @@ class HistoryView(NSView):
         self.search_field.setTarget_(self)
         self.search_field.setAction_('searchReadings:')
         
-        # Readings table
-        self.readings_table = NSTableView.alloc().initWithFrame_(NSMakeRect(20, 200, 960, 480))
+        # Spinner shown while readings load in the background
+        self.loading_indicator = NSProgressIndicator.alloc().initWithFrame_(NSMakeRect(330, 717, 16, 16))
+        self.loading_indicator.setStyle_(NSProgressIndicatorStyleSpinning)
+        self.loading_indicator.setControlSize_(NSControlSizeSmall)
+        self.loading_indicator.setIndeterminate_(True)
+        self.loading_indicator.setDisplayedWhenStopped_(False)
+        
+        # Readings table (the scroll view sizes its document view, so the
+        # table starts with an empty frame)
+        self.readings_table = NSTableView.alloc().initWithFrame_(NSZeroRect)
         self.readings_table.setHeaderView_(None)
         self.readings_table.setRowSizeStyle_(NSTableViewRowSizeStyleDefault)
+        self.readings_table.setColumnAutoresizingStyle_(NSTableViewUniformColumnAutoresizingStyle)
+        self.readings_table.setIntercellSpacing_(NSMakeSize(0, 0))
+        
+        # One shared formatter for all reading dates
+        self._date_fmt = NSDateFormatter.alloc().init()
+        self._date_fmt.setDateFormat_("yyyy-MM-dd HH:mm")
         
         # Date column
         date_column = NSTableColumn.alloc().initWithIdentifier_("date")
@@ -111,6 +173,16 @@ class HistoryView(NSView):
         self.readings_table.setDataSource_(self)
         self.readings_table.setDelegate_(self)
         
+        # Column identifier -> column values, so the data source callback is
+        # a single dict lookup and list index per cell. The column lists are
+        # updated in place, so this mapping stays valid.
+        self._columns = {
+            "date": self._col_date_str,
+            "title": self._col_title,
+            "spread": self._col_spread_str,
+            "cards": self._col_cards_str,
+        }
+        
         # Scroll view for table
         self.table_scroll = NSScrollView.alloc().initWithFrame_(NSMakeRect(20, 200, 960, 480))
         self.table_scroll.setDocumentView_(self.readings_table)
@@ -136,6 +208,7 @@ class HistoryView(NSView):
         # Add subviews
         self.addSubview_(title_label)
         self.addSubview_(self.search_field)
+        self.addSubview_(self.loading_indicator)
         self.addSubview_(self.table_scroll)
         self.addSubview_(self.detail_view)
         
@@ -145,23 +218,97 @@ class HistoryView(NSView):
         self.loadReadings()
     
     def loadReadings(self):
-        """Load readings from database."""
+        """Load readings from database on a background queue."""
         if not self.session:
             return
         
+        if self._background_session is None:
+            # Worker threads get their own session rather than sharing the
+            # main thread's one
+            self._background_session = scoped_session(
+                sessionmaker(bind=self.session.get_bind())
+            )
+        
+        self.loading_indicator.startAnimation_(None)
+        background_session = self._background_session
+        
+        cached_fingerprint = self._cache_fingerprint
+        
+        def fetch():
+            readings = None
+            fingerprint = None
+            try:
+                session = background_session()
+                fingerprint = self.fetchReadingsFingerprint(session)
+                # Only run the full query when the displayed tables changed
+                if fingerprint != cached_fingerprint:
+                    readings = self.fetchReadings(session)
+            except Exception as e:
+                logger.error(f"Failed to load readings: {e}")
+                fingerprint = None
+            finally:
+                background_session.remove()
+            
+            dispatch_async(
+                dispatch_get_main_queue(),
+                lambda: self.applyLoadedReadings(readings, fingerprint)
+            )
+        
+        dispatch_async(dispatch_get_global_queue(DISPATCH_QUEUE_PRIORITY_DEFAULT, 0), fetch)
+    
+    def fetchReadingsFingerprint(self, session):
+        """Return a cheap fingerprint of every table the history rows are built from."""
+        from tarot_studio.db.models import Reading, ReadingCard, Card
+        
+        reading_stats = session.query(func.max(Reading.updated_at), func.count(Reading.id)).one()
+        card_stats = session.query(func.max(Card.updated_at), func.count(Card.id)).one()
+        # Reading cards have no timestamp, so only added and removed rows show
+        # up here; code that edits them in place calls invalidateReadingsCache
+        reading_card_stats = session.query(
+            func.max(ReadingCard.id), func.count(ReadingCard.id)
+        ).one()
+        
+        return tuple(reading_stats) + tuple(card_stats) + tuple(reading_card_stats)
+    
+    def invalidateReadingsCache(self):
+        """Make the next loadReadings run the full query whatever the fingerprint says."""
+        self._cache_fingerprint = None
+    
+    def fetchReadings(self, session):
+        """Query readings and build the plain-Python rows shown in the table."""
         from tarot_studio.db.models import Reading, ReadingCard, Card
         
         # Get all readings
-        readings = self.session.query(Reading).order_by(Reading.created_at.desc()).all()
+        readings = session.query(Reading).order_by(Reading.created_at.desc()).all()
+        
+        # Fetch reading cards and cards in two batch queries instead of
+        # one query per reading and one per card
+        reading_ids = [r.id for r in readings]
+        cards_by_reading = defaultdict(list)
+        cards_by_id = {}
+        if reading_ids:
+            all_rcs = session.query(ReadingCard).filter(
+                ReadingCard.reading_id.in_(reading_ids)
+            ).all()
+            for rc in all_rcs:
+                cards_by_reading[rc.reading_id].append(rc)
+            
+            card_ids = {rc.card_id for rc in all_rcs}
+            if card_ids:
+                cards_by_id = {
+                    c.id: c for c in session.query(Card).filter(Card.id.in_(card_ids)).all()
+                }
         
-        self.readings = []
+        rows = []
+        append = rows.append
+        string_from_date = self._date_fmt.stringFromDate_
         for reading in readings:
             # Get cards for this reading
-            reading_cards = self.session.query(ReadingCard).filter_by(reading_id=reading.id).all()
+            reading_cards = cards_by_reading.get(reading.id, ())
             
             cards_info = []
             for rc in reading_cards:
-                card = self.session.query(Card).filter_by(id=rc.card_id).first()
+                card = cards_by_id.get(rc.card_id)
                 if card:
                     orientation = " (R)" if rc.orientation == "reversed" else ""
                     cards_info.append(f"{card.name}{orientation}")
@@ -173,80 +320,147 @@ class HistoryView(NSView):
                 'created_at': reading.created_at,
                 'cards': cards_info,
                 'interpretation': reading.interpretation,
-                'summary': reading.summary
+                'summary': reading.summary,
+                # Display strings are computed once here rather than per cell
+                'date_str': string_from_date(
+                    NSDate.dateWithTimeIntervalSince1970_(reading.created_at.timestamp())
+                ),
+                'spread_str': reading.spread_id.replace('_', ' ').title(),
+                'cards_str': ", ".join(cards_info)
             }
-            self.readings.append(reading_data)
+            append(reading_data)
+        
+        return rows
+    
+    def applyLoadedReadings(self, readings, fingerprint):
+        """Install freshly loaded readings; runs on the main thread."""
+        self.loading_indicator.stopAnimation_(None)
+        unchanged = readings is None
+        if unchanged:
+            if fingerprint is None or fingerprint != self._cache_fingerprint:
+                return
+            readings = self._all_readings
+        else:
+            self._all_readings = readings
+            self._details_by_id = {reading['id']: reading for reading in readings}
+            self._cache_fingerprint = fingerprint
         
-        # Reload table
+        # Keep the rows in step with whatever query is in the search field
+        search_term = self.search_field.stringValue().lower()
+        self._search_term = search_term
+        if search_term:
+            readings = [reading for reading in readings if _reading_matches(reading, search_term)]
+        
+        if unchanged and [reading['id'] for reading in readings] == list(self._col_id):
+            # Nothing changed in the database and the right rows are showing
+            return
+        
+        self.setVisibleReadings(readings)
         self.readings_table.reloadData()
     
+    def setVisibleReadings(self, readings):
+        """Fill the column arrays from a list of reading rows."""
+        self._col_id[:] = [reading['id'] for reading in readings]
+        self._col_date_str[:] = [reading['date_str'] for reading in readings]
+        self._col_title[:] = [reading['title'] for reading in readings]
+        self._col_spread_str[:] = [reading['spread_str'] for reading in readings]
+        self._col_cards_str[:] = [reading['cards_str'] for reading in readings]
+    
     def searchReadings_(self, sender):
         """Handle search field changes."""
+        # Debounce keystrokes so only the last one in a burst filters the table
+        if self._search_timer:
+            self._search_timer.invalidate()
+        
+        self._search_timer = NSTimer.scheduledTimerWithTimeInterval_target_selector_userInfo_repeats_(
+            SEARCH_DEBOUNCE_INTERVAL, self, '_performSearch:', None, False
+        )
+    
+    def _performSearch_(self, timer):
+        """Filter readings for the current search term."""
+        self._search_timer = None
         search_term = self.search_field.stringValue().lower()
         
         if not search_term:
             self.loadReadings()
             return
         
-        # Filter readings
+        previous_term = self._search_term
+        self._search_term = search_term
+        
+        if not (previous_term and previous_term in search_term):
+            # A new or broader query can match rows an earlier query hid,
+            # so filter the full list again
+            self.setVisibleReadings([
+                reading for reading in self._all_readings
+                if _reading_matches(reading, search_term)
+            ])
+            self.readings_table.reloadData()
+            return
+        
+        # The query narrows the previous one, so its matches are a subset of
+        # the visible rows; remember which rows drop out
         filtered_readings = []
-        for reading in self.readings:
-            if (search_term in reading['title'].lower() or
-                search_term in reading['spread_id'].lower() or
-                any(search_term in card.lower() for card in reading['cards'])):
+        removed_rows = NSMutableIndexSet.indexSet()
+        details_by_id = self._details_by_id
+        for row, reading_id in enumerate(self._col_id):
+            reading = details_by_id[reading_id]
+            if _reading_matches(reading, search_term):
                 filtered_readings.append(reading)
+            else:
+                removed_rows.addIndex_(row)
         
-        self.readings = filtered_readings
-        self.readings_table.reloadData()
+        if removed_rows.count() == 0:
+            return
+        
+        # Only the rows that no longer match need to be removed from the table
+        self.setVisibleReadings(filtered_readings)
+        self.readings_table.beginUpdates()
+        self.readings_table.removeRowsAtIndexes_withAnimation_(removed_rows, NSTableViewAnimationEffectNone)
+        self.readings_table.endUpdates()
     
     # NSTableViewDataSource methods
     def numberOfRowsInTableView_(self, tableView):
         """Return number of rows in table."""
-        return len(self.readings)
+        return len(self._col_id)
     
     def tableView_objectValueForTableColumn_row_(self, tableView, column, row):
         """Return value for table cell."""
-        if row >= len(self.readings):
+        values = self._columns.get(column.identifier())
+        if values is None or row >= len(values):
             return None
         
-        reading = self.readings[row]
-        column_id = column.identifier()
-        
-        if column_id == "date":
-            return reading['created_at'].strftime("%Y-%m-%d %H:%M")
-        elif column_id == "title":
-            return reading['title']
-        elif column_id == "spread":
-            return reading['spread_id'].replace('_', ' ').title()
-        elif column_id == "cards":
-            return ", ".join(reading['cards'])
-        
-        return None
+        return values[row]
     
     # NSTableViewDelegate methods
     def tableViewSelectionDidChange_(self, notification):
         """Handle table selection change."""
         selected_row = self.readings_table.selectedRow()
         
-        if selected_row >= 0 and selected_row < len(self.readings):
-            reading = self.readings[selected_row]
+        if selected_row >= 0 and selected_row < len(self._col_id):
+            reading = self._details_by_id[self._col_id[selected_row]]
             self.displayReadingDetails(reading)
     
     def displayReadingDetails(self, reading):
         """Display reading details."""
-        details = f"Reading: {reading['title']}\n"
-        details += f"Date: {reading['created_at'].strftime('%Y-%m-%d %H:%M')}\n"
-        details += f"Spread: {reading['spread_id'].replace('_', ' ').title()}\n\n"
-        
-        details += "Cards:\n"
-        for card in reading['cards']:
-            details += f"• {card}\n"
-        
-        if reading['summary']:
-            details += f"\nSummary:\n{reading['summary']}\n"
-        
-        if reading['interpretation']:
-            details += f"\nInterpretation:\n{reading['interpretation']}\n"
+        details = reading.get('_details_cache')
+        if details is None:
+            parts = [
+                f"{DETAIL_READING_PREFIX}{reading['title']}\n",
+                f"{DETAIL_DATE_PREFIX}{reading['date_str']}\n",
+                f"{DETAIL_SPREAD_PREFIX}{reading['spread_str']}\n\n",
+                DETAIL_CARDS_HEADER,
+            ]
+            parts.extend(f"• {card}\n" for card in reading['cards'])
+            
+            if reading['summary']:
+                parts.append(f"{DETAIL_SUMMARY_HEADER}{reading['summary']}\n")
+            
+            if reading['interpretation']:
+                parts.append(f"{DETAIL_INTERPRETATION_HEADER}{reading['interpretation']}\n")
+            
+            details = "".join(parts)
+            reading['_details_cache'] = details
         
         self.detail_text.setString_(details)
     
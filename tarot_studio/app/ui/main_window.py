@@ -198,6 +198,10 @@ class MainWindow(NSWindow):
         self.hideAllViews()
         self.history_view.setHidden_(False)
         self.current_view = self.history_view
+        
+        # Cheap when nothing changed: the view compares a table fingerprint
+        # before re-running the full query
+        self.history_view.loadReadings()
         self.sidebar_view.setActiveTab_("history")
     
     def showSettingsView(self):
@@ -205,6 +209,9 @@ class MainWindow(NSWindow):
         self.hideAllViews()
         self.settings_view.setHidden_(False)
         self.current_view = self.settings_view
+        
+        # Sections are only built the first time settings are shown
+        self.settings_view.loadSections()
         self.sidebar_view.setActiveTab_("settings")
     
     def hideAllViews(self):
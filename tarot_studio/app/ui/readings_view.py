@@ -12,6 +12,62 @@ from typing import List, Dict, Any
 
 logger = logging.getLogger(__name__)
 
+# Number of cards drawn for each spread
+_NUM_CARDS = {
+    'single_card': 1,
+    'three_card': 3,
+    'celtic_cross': 10,
+    'relationship_cross': 7
+}
+
+# Display names for spreads, e.g. 'celtic_cross' -> 'Celtic Cross'
+_SPREAD_DISPLAY = {spread_id: spread_id.replace('_', ' ').title() for spread_id in _NUM_CARDS}
+
+# Possible card orientations for a draw
+ORIENTATIONS = ('upright', 'reversed')
+
+# Largest spread (Celtic Cross); the card slot pool is sized to fit it
+MAX_CARD_SLOTS = max(_NUM_CARDS.values())
+
+# Panel geometry used by ReadingsView.layout
+PANEL_MARGIN = 20
+DRAW_PANEL_HEIGHT = 120
+CARD_DISPLAY_HEIGHT = 380
+
+# Fonts and colors shared by every widget in the view. They are filled in
+# by _load_ui_resources on first use rather than at import, since the
+# module can be imported before NSApplication is set up.
+_TITLE_FONT = None
+_SMALL_FONT = None
+_TINY_FONT = None
+_LABEL_COLOR = None
+_SECONDARY_LABEL_COLOR = None
+_TERTIARY_LABEL_COLOR = None
+_CLEAR_COLOR = None
+_BG_COLOR_CG = None
+_SEPARATOR_CG = None
+_ACCENT_CG = None
+
+def _load_ui_resources():
+    """Look up the shared fonts and colors once."""
+    global _TITLE_FONT, _SMALL_FONT, _TINY_FONT
+    global _LABEL_COLOR, _SECONDARY_LABEL_COLOR, _TERTIARY_LABEL_COLOR, _CLEAR_COLOR
+    global _BG_COLOR_CG, _SEPARATOR_CG, _ACCENT_CG
+    
+    if _TITLE_FONT is not None:
+        return
+    
+    _TITLE_FONT = NSFont.systemFontOfSize_(16, NSFontWeightMedium)
+    _SMALL_FONT = NSFont.systemFontOfSize_(12)
+    _TINY_FONT = NSFont.systemFontOfSize_(10)
+    _LABEL_COLOR = NSColor.labelColor()
+    _SECONDARY_LABEL_COLOR = NSColor.secondaryLabelColor()
+    _TERTIARY_LABEL_COLOR = NSColor.tertiaryLabelColor()
+    _CLEAR_COLOR = NSColor.clearColor()
+    _BG_COLOR_CG = NSColor.controlBackgroundColor().CGColor()
+    _SEPARATOR_CG = NSColor.separatorColor().CGColor()
+    _ACCENT_CG = NSColor.controlAccentColor().CGColor()
+
 class ReadingsView(NSView):
     """Main readings view with draw panel and card display."""
     
@@ -20,8 +76,10 @@ class ReadingsView(NSView):
         self = super(ReadingsView, self).init()
         
         if self:
+            _load_ui_resources()
             self.setWantsLayer_(True)
-            self.layer().setBackgroundColor_(NSColor.controlBackgroundColor().CGColor())
+            self.setCanDrawSubviewsIntoLayer_(True)
+            self.layer().setBackgroundColor_(_BG_COLOR_CG)
             
             # Initialize properties
             self.session = None
@@ -29,6 +87,11 @@ class ReadingsView(NSView):
             self.memory_store = None
             self.current_spread = None
             self.drawn_cards = []
+            self._card_snapshots = []
+            self._loop = None
+            self._pending_interpretation = None
+            self._selected_button = None
+            self._reading_counter = 0
             
             # Create UI components
             self.createUI()
@@ -40,8 +103,10 @@ class ReadingsView(NSView):
         self = super(ReadingsView, self).initWithFrame_(frame)
         
         if self:
+            _load_ui_resources()
             self.setWantsLayer_(True)
-            self.layer().setBackgroundColor_(NSColor.controlBackgroundColor().CGColor())
+            self.setCanDrawSubviewsIntoLayer_(True)
+            self.layer().setBackgroundColor_(_BG_COLOR_CG)
             
             # Initialize properties
             self.session = None
@@ -49,6 +114,11 @@ class ReadingsView(NSView):
             self.memory_store = None
             self.current_spread = None
             self.drawn_cards = []
+            self._card_snapshots = []
+            self._loop = None
+            self._pending_interpretation = None
+            self._selected_button = None
+            self._reading_counter = 0
             
             # Create UI components
             self.createUI()
@@ -57,27 +127,20 @@ class ReadingsView(NSView):
     
     def createUI(self):
         """Create the UI components."""
-        # Draw panel
+        # Build all panels before attaching any of them
         self.draw_panel = self.createDrawPanel()
-        self.addSubview_(self.draw_panel)
-        
-        # Card display area
         self.card_display = self.createCardDisplay()
-        self.addSubview_(self.card_display)
-        
-        # Interpretation panel
         self.interpretation_panel = self.createInterpretationPanel()
-        self.addSubview_(self.interpretation_panel)
         
-        # Set up constraints
-        self.setupConstraints()
+        self.addSubview_(self.draw_panel)
+        self.addSubview_(self.card_display)
+        self.addSubview_(self.interpretation_panel)
     
     def createDrawPanel(self):
         """Create the draw panel with spread selection."""
+        # Not layer-backed: it shares the parent's background and draws
+        # into the parent's layer
         panel = NSView.alloc().initWithFrame_(NSMakeRect(20, 600, 960, 120))
-        panel.setWantsLayer_(True)
-        panel.layer().setBackgroundColor_(NSColor.controlBackgroundColor().CGColor())
-        panel.layer().setCornerRadius_(8)
         
         # Title
         title_label = NSTextField.alloc().initWithFrame_(NSMakeRect(20, 90, 200, 20))
@@ -86,8 +149,8 @@ class ReadingsView(NSView):
         title_label.setDrawsBackground_(False)
         title_label.setEditable_(False)
         title_label.setSelectable_(False)
-        title_label.setFont_(NSFont.systemFontOfSize_(16, NSFontWeightMedium))
-        title_label.setTextColor_(NSColor.labelColor())
+        title_label.setFont_(_TITLE_FONT)
+        title_label.setTextColor_(_LABEL_COLOR)
         
         # Spread buttons
         spreads = [
@@ -139,10 +202,9 @@ class ReadingsView(NSView):
     
     def createCardDisplay(self):
         """Create the card display area."""
+        # Not layer-backed: it shares the parent's background and draws
+        # into the parent's layer
         display = NSView.alloc().initWithFrame_(NSMakeRect(20, 200, 960, 380))
-        display.setWantsLayer_(True)
-        display.layer().setBackgroundColor_(NSColor.controlBackgroundColor().CGColor())
-        display.layer().setCornerRadius_(8)
         
         # Title
         title_label = NSTextField.alloc().initWithFrame_(NSMakeRect(20, 350, 200, 20))
@@ -151,11 +213,12 @@ class ReadingsView(NSView):
         title_label.setDrawsBackground_(False)
         title_label.setEditable_(False)
         title_label.setSelectable_(False)
-        title_label.setFont_(NSFont.systemFontOfSize_(16, NSFontWeightMedium))
-        title_label.setTextColor_(NSColor.labelColor())
+        title_label.setFont_(_TITLE_FONT)
+        title_label.setTextColor_(_LABEL_COLOR)
         
         # Card slots
         self.card_slots = []
+        self._slot_pool = []
         card_width = 120
         card_height = 180
         card_spacing = 20
@@ -170,38 +233,52 @@ class ReadingsView(NSView):
         return display
     
     def createCardSlots(self, parent_view, start_x, start_y, card_width, card_height, card_spacing):
-        """Create card slots for the current spread."""
-        # Clear existing slots
-        for slot in self.card_slots:
-            slot.removeFromSuperview()
-        self.card_slots = []
-        
-        # Determine number of cards based on spread
-        num_cards = 1  # Default to single card
-        if self.current_spread == 'three_card':
-            num_cards = 3
-        elif self.current_spread == 'celtic_cross':
-            num_cards = 10
-        elif self.current_spread == 'relationship_cross':
-            num_cards = 7
-        
-        # Create card slots
-        for i in range(num_cards):
-            slot = self.createCardSlot(
-                NSMakeRect(start_x + i * (card_width + card_spacing), start_y, card_width, card_height),
-                i
+        """Lay out card slots for the current spread, reusing pooled slot views."""
+        # Build the slot pool once; afterwards slots are only shown, hidden
+        # and repositioned
+        if not self._slot_pool:
+            self._slot_pool = [self.createCardSlot(NSZeroRect, i) for i in range(MAX_CARD_SLOTS)]
+            for slot in self._slot_pool:
+                slot.setHidden_(True)
+                parent_view.addSubview_(slot)
+        
+        # Determine number of cards based on spread (single card by default)
+        num_cards = _NUM_CARDS.get(self.current_spread, 1)
+        
+        # Show and reset the slots in use; of the rest, only the slots that
+        # were visible before need hiding, so the pool is never walked
+        previous_slots = self.card_slots
+        self.card_slots = self._slot_pool[:num_cards]
+        for i, slot in enumerate(self.card_slots):
+            slot.setFrame_(
+                NSMakeRect(start_x + i * (card_width + card_spacing), start_y, card_width, card_height)
             )
-            parent_view.addSubview_(slot)
-            self.card_slots.append(slot)
+            self.resetCardSlot(slot)
+            slot.setHidden_(False)
+        for slot in previous_slots[num_cards:]:
+            slot.setHidden_(True)
+    
+    def resetCardSlot(self, slot):
+        """Return a pooled card slot to its empty state."""
+        if slot.card_data is None:
+            return
+        
+        slot.layer().setBorderColor_(_SEPARATOR_CG)
+        slot.position_label.setStringValue_(f"Position {slot.slot_index + 1}")
+        slot.position_label.setTextColor_(_SECONDARY_LABEL_COLOR)
+        slot.card_placeholder.setStringValue_("Card will appear here")
+        slot.card_placeholder.setTextColor_(_TERTIARY_LABEL_COLOR)
+        slot.card_data = None
     
     def createCardSlot(self, frame, index):
         """Create a single card slot."""
         slot = NSView.alloc().initWithFrame_(frame)
         slot.setWantsLayer_(True)
-        slot.layer().setBackgroundColor_(NSColor.controlBackgroundColor().CGColor())
-        slot.layer().setBorderWidth_(2)
-        slot.layer().setBorderColor_(NSColor.separatorColor().CGColor())
-        slot.layer().setCornerRadius_(8)
+        layer = slot.layer()
+        layer.setBackgroundColor_(_BG_COLOR_CG)
+        layer.setBorderWidth_(2)
+        layer.setBorderColor_(_SEPARATOR_CG)
+        layer.setCornerRadius_(8)
         
         # Position label
         position_label = NSTextField.alloc().initWithFrame_(NSMakeRect(10, 10, 100, 20))
@@ -210,8 +287,8 @@ class ReadingsView(NSView):
         position_label.setDrawsBackground_(False)
         position_label.setEditable_(False)
         position_label.setSelectable_(False)
-        position_label.setFont_(NSFont.systemFontOfSize_(12))
-        position_label.setTextColor_(NSColor.secondaryLabelColor())
+        position_label.setFont_(_SMALL_FONT)
+        position_label.setTextColor_(_SECONDARY_LABEL_COLOR)
         
         # Card placeholder
         card_placeholder = NSTextField.alloc().initWithFrame_(NSMakeRect(10, 40, 100, 120))
@@ -220,8 +297,8 @@ class ReadingsView(NSView):
         card_placeholder.setDrawsBackground_(False)
         card_placeholder.setEditable_(False)
         card_placeholder.setSelectable_(False)
-        card_placeholder.setFont_(NSFont.systemFontOfSize_(10))
-        card_placeholder.setTextColor_(NSColor.tertiaryLabelColor())
+        card_placeholder.setFont_(_TINY_FONT)
+        card_placeholder.setTextColor_(_TERTIARY_LABEL_COLOR)
         card_placeholder.setAlignment_(NSTextAlignmentCenter)
         
         slot.addSubview_(position_label)
@@ -237,10 +314,9 @@ class ReadingsView(NSView):
     
     def createInterpretationPanel(self):
         """Create the interpretation panel."""
+        # Not layer-backed: it shares the parent's background and draws
+        # into the parent's layer
         panel = NSView.alloc().initWithFrame_(NSMakeRect(20, 20, 960, 160))
-        panel.setWantsLayer_(True)
-        panel.layer().setBackgroundColor_(NSColor.controlBackgroundColor().CGColor())
-        panel.layer().setCornerRadius_(8)
         
         # Title
         title_label = NSTextField.alloc().initWithFrame_(NSMakeRect(20, 130, 200, 20))
@@ -249,65 +325,72 @@ class ReadingsView(NSView):
         title_label.setDrawsBackground_(False)
         title_label.setEditable_(False)
         title_label.setSelectable_(False)
-        title_label.setFont_(NSFont.systemFontOfSize_(16, NSFontWeightMedium))
-        title_label.setTextColor_(NSColor.labelColor())
+        title_label.setFont_(_TITLE_FONT)
+        title_label.setTextColor_(_LABEL_COLOR)
         
         # Interpretation text
         self.interpretation_text = NSTextView.alloc().initWithFrame_(NSMakeRect(20, 20, 920, 100))
         self.interpretation_text.setString_("Draw cards to see your interpretation...")
         self.interpretation_text.setEditable_(False)
         self.interpretation_text.setSelectable_(True)
-        self.interpretation_text.setFont_(NSFont.systemFontOfSize_(12))
-        self.interpretation_text.setTextColor_(NSColor.labelColor())
-        self.interpretation_text.setBackgroundColor_(NSColor.clearColor())
+        self.interpretation_text.setFont_(_SMALL_FONT)
+        self.interpretation_text.setTextColor_(_LABEL_COLOR)
+        self.interpretation_text.setBackgroundColor_(_CLEAR_COLOR)
         
         panel.addSubview_(title_label)
         panel.addSubview_(self.interpretation_text)
         
         return panel
     
-    def setupConstraints(self):
-        """Set up Auto Layout constraints."""
-        self.draw_panel.setTranslatesAutoresizingMaskIntoConstraints_(False)
-        self.card_display.setTranslatesAutoresizingMaskIntoConstraints_(False)
-        self.interpretation_panel.setTranslatesAutoresizingMaskIntoConstraints_(False)
-        
-        NSLayoutConstraint.activateConstraints_([
-            # Draw panel
-            self.draw_panel.leadingAnchor().constraintEqualToAnchor_(self.leadingAnchor(), constant=20),
-            self.draw_panel.trailingAnchor().constraintEqualToAnchor_(self.trailingAnchor(), constant=-20),
-            self.draw_panel.topAnchor().constraintEqualToAnchor_(self.topAnchor(), constant=20),
-            self.draw_panel.heightAnchor().constraintEqualToConstant_(120),
-            
-            # Card display
-            self.card_display.leadingAnchor().constraintEqualToAnchor_(self.leadingAnchor(), constant=20),
-            self.card_display.trailingAnchor().constraintEqualToAnchor_(self.trailingAnchor(), constant=-20),
-            self.card_display.topAnchor().constraintEqualToAnchor_(self.draw_panel.bottomAnchor(), constant=20),
-            self.card_display.heightAnchor().constraintEqualToConstant_(380),
-            
-            # Interpretation panel
-            self.interpretation_panel.leadingAnchor().constraintEqualToAnchor_(self.leadingAnchor(), constant=20),
-            self.interpretation_panel.trailingAnchor().constraintEqualToAnchor_(self.trailingAnchor(), constant=-20),
-            self.interpretation_panel.topAnchor().constraintEqualToAnchor_(self.card_display.bottomAnchor(), constant=20),
-            self.interpretation_panel.bottomAnchor().constraintEqualToAnchor_(self.bottomAnchor(), constant=-20)
-        ])
+    def layout(self):
+        """Position the three panels during AppKit's layout pass."""
+        super(ReadingsView, self).layout()
+        self.layoutPanels()
+    
+    def resizeSubviewsWithOldSize_(self, old_size):
+        """Position the three panels whenever the view is resized."""
+        # The panels have no constraints or autoresizing masks, so a frame
+        # change must not depend on AppKit also running layout()
+        self.layoutPanels()
+    
+    def layoutPanels(self):
+        """Position the three panels from the current bounds."""
+        size = self.bounds().size
+        width = size.width - 2 * PANEL_MARGIN
+        
+        # Stack top to bottom: draw panel, card display, interpretation
+        draw_y = size.height - PANEL_MARGIN - DRAW_PANEL_HEIGHT
+        self.draw_panel.setFrame_(NSMakeRect(PANEL_MARGIN, draw_y, width, DRAW_PANEL_HEIGHT))
+        
+        display_y = draw_y - PANEL_MARGIN - CARD_DISPLAY_HEIGHT
+        self.card_display.setFrame_(NSMakeRect(PANEL_MARGIN, display_y, width, CARD_DISPLAY_HEIGHT))
+        
+        interpretation_height = max(display_y - 2 * PANEL_MARGIN, 0)
+        self.interpretation_panel.setFrame_(
+            NSMakeRect(PANEL_MARGIN, PANEL_MARGIN, width, interpretation_height)
+        )
     
     def selectSpread_(self, sender):
         """Handle spread selection."""
-        # Update button states
-        for button in self.spread_buttons:
-            if button == sender:
-                button.setBordered_(True)
-                button.setBezelStyle_(NSBezelStyleRounded)
-            else:
-                button.setBordered_(False)
-                button.setBezelStyle_(NSBezelStyleRounded)
+        # Update button states; only the previous and new selection change
+        previous = self._selected_button
+        if previous is None:
+            # Every button starts out bordered, so clear the others once
+            for button in self.spread_buttons:
+                if button is not sender:
+                    button.setBordered_(False)
+        elif previous is not sender:
+            previous.setBordered_(False)
+        sender.setBordered_(True)
+        self._selected_button = sender
         
         # Set current spread
+        old_spread = self.current_spread
         self.current_spread = sender.spread_id
         
-        # Update card slots
-        self.createCardSlots(self.card_display, 50, 100, 120, 180, 20)
+        # Update card slots, unless the slot count is unchanged
+        if _NUM_CARDS.get(old_spread) != _NUM_CARDS.get(self.current_spread):
+            self.createCardSlots(self.card_display, 50, 100, 120, 180, 20)
         
         # Enable draw button
         self.draw_button.setEnabled_(True)
@@ -316,7 +399,7 @@ class ReadingsView(NSView):
     
     def drawCards_(self, sender):
         """Handle card drawing."""
-        if not self.current_spread:
+        if self.current_spread not in _NUM_CARDS:
             return
         
         # Clear previous cards
@@ -342,49 +425,27 @@ class ReadingsView(NSView):
         if not self.session:
             return []
         
-        from tarot_studio.db.models import Card
-        
-        # Get all cards
-        all_cards = self.session.query(Card).all()
-        
-        # Select random cards
-        selected_cards = random.sample(all_cards, min(count, len(all_cards)))
-        
-        # Convert to dict format
-        cards = []
-        for card in selected_cards:
-            card_dict = {
-                'id': card.id,
-                'name': card.name,
-                'arcana': card.arcana,
-                'suit': card.suit,
-                'number': card.number,
-                'element': card.element,
-                'keywords': card.keywords,
-                'polarity': card.polarity,
-                'intensity': card.intensity,
-                'upright_meaning': card.upright_meaning,
-                'reversed_meaning': card.reversed_meaning,
-                'influence_rules': card.influence_rules,
-                'orientation': random.choice(['upright', 'reversed'])
-            }
-            cards.append(card_dict)
+        # Sample the precomputed card snapshots; only orientation is decided per draw
+        snapshots = self._card_snapshots
+        picks = random.sample(snapshots, min(count, len(snapshots)))
+        
+        orientations = random.choices(ORIENTATIONS, k=len(picks))
         
-        return cards
+        return [{**card, 'orientation': orientation} for card, orientation in zip(picks, orientations)]
     
     def displayCardInSlot(self, card, slot):
         """Display a card in a slot."""
         # Update slot appearance
-        slot.layer().setBorderColor_(NSColor.controlAccentColor().CGColor())
+        slot.layer().setBorderColor_(_ACCENT_CG)
         
         # Update position label
         slot.position_label.setStringValue_(card['name'])
-        slot.position_label.setTextColor_(NSColor.labelColor())
+        slot.position_label.setTextColor_(_LABEL_COLOR)
         
         # Update card placeholder
         orientation_text = " (Reversed)" if card['orientation'] == 'reversed' else ""
         slot.card_placeholder.setStringValue_(f"{card['name']}{orientation_text}")
-        slot.card_placeholder.setTextColor_(NSColor.labelColor())
+        slot.card_placeholder.setTextColor_(_LABEL_COLOR)
         
         # Store card data
         slot.card_data = card
@@ -395,9 +456,10 @@ class ReadingsView(NSView):
             return
         
         # Create spread data for AI
+        self._reading_counter += 1
         spread_data = {
-            'reading_id': f"reading_{random.randint(1000, 9999)}",
-            'spread_name': self.current_spread.replace('_', ' ').title(),
+            'reading_id': f"reading_{self._reading_counter}",
+            'spread_name': _SPREAD_DISPLAY[self.current_spread],
             'cards': []
         }
         
@@ -422,54 +484,105 @@ class ReadingsView(NSView):
                     logger.error(f"Failed to generate interpretation: {e}")
                     return None
             
-            # Run async function
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                response = loop.run_until_complete(get_interpretation())
-                if response:
-                    self.displayInterpretation(response)
-                else:
-                    self.displayFallbackInterpretation()
-            finally:
-                loop.close()
+            self.setInterpretationText("Generating interpretation…")
+            
+            # Run async function on the long-lived background loop and post
+            # the result back to the main thread when it completes
+            future = asyncio.run_coroutine_threadsafe(get_interpretation(), self.backgroundLoop())
+            self._pending_interpretation = future
+            
+            def on_done(done_future):
+                # A newer draw superseded this request
+                if done_future is not self._pending_interpretation:
+                    return
+                self.performSelectorOnMainThread_withObject_waitUntilDone_(
+                    'interpretationDidFinish:', done_future.result(), False
+                )
+            
+            future.add_done_callback(on_done)
         else:
             self.displayFallbackInterpretation()
     
+    def interpretationDidFinish_(self, response):
+        """Show the AI interpretation once it arrives; runs on the main thread."""
+        self._pending_interpretation = None
+        if response:
+            self.displayInterpretation(response)
+        else:
+            self.displayFallbackInterpretation()
+    
+    def backgroundLoop(self):
+        """Return the event loop used for AI calls, starting it on first use."""
+        if self._loop is None:
+            import asyncio
+            import threading
+            
+            self._loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=self._loop.run_forever, name="ReadingsViewLoop", daemon=True
+            ).start()
+        
+        return self._loop
+    
     def displayInterpretation(self, response):
         """Display AI-generated interpretation."""
-        interpretation_text = f"Summary: {response.summary}\n\n"
+        parts = [f"Summary: {response.summary}\n\n"]
         
         if response.advice:
-            interpretation_text += "Advice:\n"
-            for advice in response.advice:
-                interpretation_text += f"• {advice}\n"
-            interpretation_text += "\n"
+            parts.append("Advice:\n")
+            parts.extend(f"• {advice}\n" for advice in response.advice)
+            parts.append("\n")
         
         if response.follow_up_questions:
-            interpretation_text += "Questions to consider:\n"
-            for question in response.follow_up_questions:
-                interpretation_text += f"• {question}\n"
+            parts.append("Questions to consider:\n")
+            parts.extend(f"• {question}\n" for question in response.follow_up_questions)
         
-        self.interpretation_text.setString_(interpretation_text)
+        self.setInterpretationText("".join(parts))
     
     def displayFallbackInterpretation(self):
         """Display fallback interpretation when AI is not available."""
-        interpretation_text = "Your Reading:\n\n"
+        parts = ["Your Reading:\n"]
         
         for i, card in enumerate(self.drawn_cards):
-            position_name = f"Position {i+1}"
             meaning = card['upright_meaning'] if card['orientation'] == 'upright' else card['reversed_meaning']
-            
-            interpretation_text += f"{position_name}: {card['name']} ({card['orientation']})\n"
-            interpretation_text += f"{meaning}\n\n"
+            parts.append(f"Position {i+1}: {card['name']} ({card['orientation']})\n{meaning}\n")
         
-        interpretation_text += "Consider how these cards work together to tell your story."
+        parts.append("Consider how these cards work together to tell your story.")
         
-        self.interpretation_text.setString_(interpretation_text)
+        self.setInterpretationText("\n".join(parts))
+    
+    def setInterpretationText(self, text):
+        """Replace the interpretation text in place in a single text storage edit."""
+        # Mutating the existing storage keeps its attributes and layout
+        # caches instead of swapping in a new backing store
+        text_storage = self.interpretation_text.textStorage()
+        text_storage.beginEditing()
+        text_storage.mutableString().setString_(text)
+        text_storage.endEditing()
     
     def setSession_ollamaClient_memoryStore_(self, session, ollama_client, memory_store):
         """Set dependencies."""
         self.session = session
         self.ollama_client = ollama_client
-        self.memory_store = memory_store
\ No newline at end of file
+        self.memory_store = memory_store
+        
+        # Card data never changes at runtime, so serialize it once
+        if session:
+            from tarot_studio.db.models import Card
+            self._card_snapshots = [
+                {
+                    'id': card.id,
+                    'name': card.name,
+                    'arcana': card.arcana,
+                    'suit': card.suit,
+                    'number': card.number,
+                    'element': card.element,
+                    'keywords': card.keywords,
+                    'polarity': card.polarity,
+                    'intensity': card.intensity,
+                    'upright_meaning': card.upright_meaning,
+                    'reversed_meaning': card.reversed_meaning,
+                    'influence_rules': card.influence_rules
+                }
+                for card in session.query(Card).all()
+            ]
\ No newline at end of file
@@ -6,28 +6,75 @@ import objc
 from Foundation import *
 from AppKit import *
 from Cocoa import *
+from Quartz import CATransaction
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 
+# How long a successful connection test is reused for the same URL and model
+PROBE_CACHE_SECONDS = 5.0
+
+# Fonts and colors shared by every widget in the view, filled in by
+# _load_ui_resources on first use (the module can be imported before
+# NSApplication is set up). The NSColors are dynamic and follow the
+# appearance on their own; layer CGColors are resolved per view.
+_FONT_12 = None
+_FONT_14_MED = None
+_FONT_16_MED = None
+_LABEL_COLOR = None
+_SEC_LABEL_COLOR = None
+_GREEN_COLOR = None
+_RED_COLOR = None
+_BG_COLOR = None
+
+def _load_ui_resources():
+    """Look up the shared fonts and colors, once."""
+    global _FONT_12, _FONT_14_MED, _FONT_16_MED, _LABEL_COLOR, _SEC_LABEL_COLOR
+    global _GREEN_COLOR, _RED_COLOR, _BG_COLOR
+    
+    if _FONT_12 is not None:
+        return
+    
+    _FONT_12 = NSFont.systemFontOfSize_(12)
+    _FONT_14_MED = NSFont.systemFontOfSize_(14, NSFontWeightMedium)
+    _FONT_16_MED = NSFont.systemFontOfSize_(16, NSFontWeightMedium)
+    _LABEL_COLOR = NSColor.labelColor()
+    _SEC_LABEL_COLOR = NSColor.secondaryLabelColor()
+    _GREEN_COLOR = NSColor.systemGreenColor()
+    _RED_COLOR = NSColor.systemRedColor()
+    _BG_COLOR = NSColor.controlBackgroundColor()
+
+def _cg_color_for_view(color, view):
+    """Resolve a dynamic NSColor to a CGColor under the view's appearance."""
+    previous = NSAppearance.currentAppearance()
+    NSAppearance.setCurrentAppearance_(view.effectiveAppearance())
+    try:
+        return color.CGColor()
+    finally:
+        NSAppearance.setCurrentAppearance_(previous)
+
+class OpaqueLabel(NSTextField):
+    """Static label that reports itself opaque while it paints a solid background."""
+    
+    def isOpaque(self):
+        """Report the label as opaque only when its background covers its bounds."""
+        return bool(self.drawsBackground()
+                    and self.backgroundColor() is not None
+                    and self.backgroundColor().alphaComponent() >= 1.0)
+
 class SettingsView(NSView):
     """Settings view for app configuration."""
     
+    # Event loop for connection tests, created lazily by backgroundLoop
+    _bg_loop = None
+    
     def init(self):
         """Initialize the settings view."""
         self = super(SettingsView, self).init()
         
         if self:
-            self.setWantsLayer_(True)
-            self.layer().setBackgroundColor_(NSColor.controlBackgroundColor().CGColor())
-            
-            # Initialize properties
-            self.session = None
-            self.ollama_client = None
-            self.memory_store = None
-            
-            # Create UI components
-            self.createUI()
+            self._commonInit()
             
         return self
     
@@ -36,93 +83,155 @@ class SettingsView(NSView):
         self = super(SettingsView, self).initWithFrame_(frame)
         
         if self:
-            self.setWantsLayer_(True)
-            self.layer().setBackgroundColor_(NSColor.controlBackgroundColor().CGColor())
-            
-            # Initialize properties
-            self.session = None
-            self.ollama_client = None
-            self.memory_store = None
-            
-            # Create UI components
-            self.createUI()
+            self._commonInit()
             
         return self
     
+    def _commonInit(self):
+        """Set up state shared by both initializers."""
+        _load_ui_resources()
+        self.setWantsLayer_(True)
+        
+        # Initialize properties
+        self.session = None
+        self.ollama_client = None
+        self.memory_store = None
+        self._last_probe = None
+        self._pending_probe = None
+        
+        # Create UI components
+        self.createUI()
+        self.applyLayerColors()
+    
+    def applyLayerColors(self):
+        """Set the layer backgrounds of the view and its sections for the current appearance."""
+        background = _cg_color_for_view(_BG_COLOR, self)
+        self.layer().setBackgroundColor_(background)
+        for section in self._sections.values():
+            section.layer().setBackgroundColor_(background)
+    
+    def viewDidChangeEffectiveAppearance(self):
+        """Re-resolve the layer colors, which do not follow appearance changes."""
+        self.applyLayerColors()
+    
     def createUI(self):
         """Create the UI components."""
         # Title
-        title_label = NSTextField.alloc().initWithFrame_(NSMakeRect(20, 750, 200, 20))
-        title_label.setStringValue_("Settings")
-        title_label.setBordered_(False)
-        title_label.setDrawsBackground_(False)
-        title_label.setEditable_(False)
-        title_label.setSelectable_(False)
-        title_label.setFont_(NSFont.systemFontOfSize_(16, NSFontWeightMedium))
-        title_label.setTextColor_(NSColor.labelColor())
-        
-        # AI Settings section
-        ai_section = self.createAISettingsSection()
-        self.addSubview_(ai_section)
-        
-        # Database Settings section
-        db_section = self.createDatabaseSettingsSection()
-        self.addSubview_(db_section)
+        self.title_label = OpaqueLabel.alloc().initWithFrame_(NSMakeRect(20, 750, 200, 20))
+        self.title_label.setStringValue_("Settings")
+        self.title_label.setBordered_(False)
+        self.title_label.setDrawsBackground_(True)
+        self.title_label.setBackgroundColor_(_BG_COLOR)
+        self.title_label.setEditable_(False)
+        self.title_label.setSelectable_(False)
+        self.title_label.setFont_(_FONT_16_MED)
+        self.title_label.setTextColor_(_LABEL_COLOR)
+        
+        # Sections are built by loadSections the first time the view is shown
+        self._section_builders = {
+            'ai': self.createAISettingsSection,
+            'database': self.createDatabaseSettingsSection,
+            'appearance': self.createAppearanceSettingsSection
+        }
+        self._sections = {}
+        
+        self.setSubviews_([self.title_label])
+    
+    def loadSections(self):
+        """Build any settings sections that have not been created yet."""
+        if len(self._sections) == len(self._section_builders):
+            return
         
-        # Appearance Settings section
-        appearance_section = self.createAppearanceSettingsSection()
-        self.addSubview_(appearance_section)
+        # Section layers are configured without implicit animations
+        CATransaction.begin()
+        CATransaction.setDisableActions_(True)
+        try:
+            for name, builder in self._section_builders.items():
+                if name not in self._sections:
+                    self._sections[name] = builder()
+            self.applyLayerColors()
+        finally:
+            CATransaction.commit()
         
-        # Add title
-        self.addSubview_(title_label)
+        # Add sections and title in one call
+        self.setSubviews_(list(self._sections.values()) + [self.title_label])
+    
+    def layoutSection_rows_widths_(self, section, rows, widths):
+        """Stack a section's rows vertically and fix the widths of its controls."""
+        stack = NSStackView.stackViewWithViews_(rows)
+        stack.setOrientation_(NSUserInterfaceLayoutOrientationVertical)
+        stack.setAlignment_(NSLayoutAttributeLeading)
+        stack.setSpacing_(10)
+        stack.setEdgeInsets_(NSEdgeInsetsMake(10, 20, 10, 20))
+        stack.setTranslatesAutoresizingMaskIntoConstraints_(False)
+        
+        section.setSubviews_([stack])
+        
+        # Activate every constraint for the section in one call
+        constraints = [
+            stack.leadingAnchor().constraintEqualToAnchor_(section.leadingAnchor()),
+            stack.trailingAnchor().constraintEqualToAnchor_(section.trailingAnchor()),
+            stack.topAnchor().constraintEqualToAnchor_(section.topAnchor())
+        ]
+        for view, width in widths:
+            constraints.append(view.widthAnchor().constraintEqualToConstant_(width))
+        NSLayoutConstraint.activateConstraints_(constraints)
     
     def createAISettingsSection(self):
         """Create AI settings section."""
         section = NSView.alloc().initWithFrame_(NSMakeRect(20, 600, 960, 120))
         section.setWantsLayer_(True)
-        section.layer().setBackgroundColor_(NSColor.controlBackgroundColor().CGColor())
         section.layer().setCornerRadius_(8)
         
         # Section title
-        title_label = NSTextField.alloc().initWithFrame_(NSMakeRect(20, 90, 200, 20))
+        title_label = OpaqueLabel.alloc().init()
         title_label.setStringValue_("AI Settings")
         title_label.setBordered_(False)
-        title_label.setDrawsBackground_(False)
+        title_label.setDrawsBackground_(True)
+        title_label.setBackgroundColor_(_BG_COLOR)
         title_label.setEditable_(False)
         title_label.setSelectable_(False)
-        title_label.setFont_(NSFont.systemFontOfSize_(14, NSFontWeightMedium))
-        title_label.setTextColor_(NSColor.labelColor())
+        title_label.setFont_(_FONT_14_MED)
+        title_label.setTextColor_(_LABEL_COLOR)
         
         # Ollama URL
-        url_label = NSTextField.alloc().initWithFrame_(NSMakeRect(20, 60, 100, 20))
+        url_label = OpaqueLabel.alloc().init()
         url_label.setStringValue_("Ollama URL:")
         url_label.setBordered_(False)
-        url_label.setDrawsBackground_(False)
+        url_label.setDrawsBackground_(True)
+        url_label.setBackgroundColor_(_BG_COLOR)
         url_label.setEditable_(False)
         url_label.setSelectable_(False)
-        url_label.setFont_(NSFont.systemFontOfSize_(12))
-        url_label.setTextColor_(NSColor.labelColor())
+        url_label.setFont_(_FONT_12)
+        url_label.setTextColor_(_LABEL_COLOR)
         
-        self.ollama_url_field = NSTextField.alloc().initWithFrame_(NSMakeRect(130, 60, 300, 20))
+        self.ollama_url_field = NSTextField.alloc().init()
         self.ollama_url_field.setStringValue_("http://localhost:11434")
         self.ollama_url_field.setPlaceholderString_("http://localhost:11434")
+        self.ollama_url_field.setDelegate_(self)
         
         # Model selection
-        model_label = NSTextField.alloc().initWithFrame_(NSMakeRect(20, 30, 100, 20))
+        model_label = OpaqueLabel.alloc().init()
         model_label.setStringValue_("Model:")
         model_label.setBordered_(False)
-        model_label.setDrawsBackground_(False)
+        model_label.setDrawsBackground_(True)
+        model_label.setBackgroundColor_(_BG_COLOR)
         model_label.setEditable_(False)
         model_label.setSelectable_(False)
-        model_label.setFont_(NSFont.systemFontOfSize_(12))
-        model_label.setTextColor_(NSColor.labelColor())
+        model_label.setFont_(_FONT_12)
+        model_label.setTextColor_(_LABEL_COLOR)
         
-        self.model_field = NSTextField.alloc().initWithFrame_(NSMakeRect(130, 30, 300, 20))
+        self.model_field = NSTextField.alloc().init()
         self.model_field.setStringValue_("llama3.2")
         self.model_field.setPlaceholderString_("llama3.2")
+        self.model_field.setDelegate_(self)
+        
+        # Python copies of the field values, kept current by controlTextDidChange_
+        self._ollama_url_str = "http://localhost:11434"
+        self._model_str = "llama3.2"
         
         # Test connection button
-        self.test_button = NSButton.alloc().initWithFrame_(NSMakeRect(450, 45, 120, 30))
+        self.test_button = NSButton.alloc().init()
         self.test_button.setTitle_("Test Connection")
         self.test_button.setTarget_(self)
         self.test_button.setAction_('testConnection:')
@@ -130,22 +239,32 @@ class SettingsView(NSView):
         self.test_button.setBezelStyle_(NSBezelStyleRounded)
         
         # Status label
-        self.status_label = NSTextField.alloc().initWithFrame_(NSMakeRect(600, 45, 200, 20))
+        self.status_label = OpaqueLabel.alloc().init()
         self.status_label.setStringValue_("Not connected")
         self.status_label.setBordered_(False)
-        self.status_label.setDrawsBackground_(False)
+        self.status_label.setDrawsBackground_(True)
+        self.status_label.setBackgroundColor_(_BG_COLOR)
         self.status_label.setEditable_(False)
         self.status_label.setSelectable_(False)
-        self.status_label.setFont_(NSFont.systemFontOfSize_(12))
-        self.status_label.setTextColor_(NSColor.secondaryLabelColor())
-        
-        section.addSubview_(title_label)
-        section.addSubview_(url_label)
-        section.addSubview_(self.ollama_url_field)
-        section.addSubview_(model_label)
-        section.addSubview_(self.model_field)
-        section.addSubview_(self.test_button)
-        section.addSubview_(self.status_label)
+        self.status_label.setFont_(_FONT_12)
+        self.status_label.setTextColor_(_SEC_LABEL_COLOR)
+        
+        url_row = NSStackView.stackViewWithViews_([url_label, self.ollama_url_field])
+        model_row = NSStackView.stackViewWithViews_([
+            model_label,
+            self.model_field,
+            self.test_button,
+            self.status_label
+        ])
+        
+        self.layoutSection_rows_widths_(section, [title_label, url_row, model_row], [
+            (url_label, 100),
+            (self.ollama_url_field, 300),
+            (model_label, 100),
+            (self.model_field, 300),
+            (self.test_button, 120),
+            (self.status_label, 200)
+        ])
         
         return section
     
@@ -153,21 +272,21 @@ class SettingsView(NSView):
         """Create database settings section."""
         section = NSView.alloc().initWithFrame_(NSMakeRect(20, 450, 960, 120))
         section.setWantsLayer_(True)
-        section.layer().setBackgroundColor_(NSColor.controlBackgroundColor().CGColor())
         section.layer().setCornerRadius_(8)
         
         # Section title
-        title_label = NSTextField.alloc().initWithFrame_(NSMakeRect(20, 90, 200, 20))
+        title_label = OpaqueLabel.alloc().init()
         title_label.setStringValue_("Database Settings")
         title_label.setBordered_(False)
-        title_label.setDrawsBackground_(False)
+        title_label.setDrawsBackground_(True)
+        title_label.setBackgroundColor_(_BG_COLOR)
         title_label.setEditable_(False)
         title_label.setSelectable_(False)
-        title_label.setFont_(NSFont.systemFontOfSize_(14, NSFontWeightMedium))
-        title_label.setTextColor_(NSColor.labelColor())
+        title_label.setFont_(_FONT_14_MED)
+        title_label.setTextColor_(_LABEL_COLOR)
         
         # Export button
-        self.export_button = NSButton.alloc().initWithFrame_(NSMakeRect(20, 50, 120, 30))
+        self.export_button = NSButton.alloc().init()
         self.export_button.setTitle_("Export Data")
         self.export_button.setTarget_(self)
         self.export_button.setAction_('exportData:')
@@ -175,7 +294,7 @@ class SettingsView(NSView):
         self.export_button.setBezelStyle_(NSBezelStyleRounded)
         
         # Import button
-        self.import_button = NSButton.alloc().initWithFrame_(NSMakeRect(160, 50, 120, 30))
+        self.import_button = NSButton.alloc().init()
         self.import_button.setTitle_("Import Data")
         self.import_button.setTarget_(self)
         self.import_button.setAction_('importData:')
@@ -183,7 +302,7 @@ class SettingsView(NSView):
         self.import_button.setBezelStyle_(NSBezelStyleRounded)
         
         # Clear data button
-        self.clear_button = NSButton.alloc().initWithFrame_(NSMakeRect(300, 50, 120, 30))
+        self.clear_button = NSButton.alloc().init()
         self.clear_button.setTitle_("Clear All Data")
         self.clear_button.setTarget_(self)
         self.clear_button.setAction_('clearData:')
@@ -191,20 +310,28 @@ class SettingsView(NSView):
         self.clear_button.setBezelStyle_(NSBezelStyleRounded)
         
         # Database info
-        self.db_info_label = NSTextField.alloc().initWithFrame_(NSMakeRect(20, 20, 400, 20))
+        self.db_info_label = OpaqueLabel.alloc().init()
         self.db_info_label.setStringValue_("Database: tarot_studio.db")
         self.db_info_label.setBordered_(False)
-        self.db_info_label.setDrawsBackground_(False)
+        self.db_info_label.setDrawsBackground_(True)
+        self.db_info_label.setBackgroundColor_(_BG_COLOR)
         self.db_info_label.setEditable_(False)
         self.db_info_label.setSelectable_(False)
-        self.db_info_label.setFont_(NSFont.systemFontOfSize_(12))
-        self.db_info_label.setTextColor_(NSColor.secondaryLabelColor())
-        
-        section.addSubview_(title_label)
-        section.addSubview_(self.export_button)
-        section.addSubview_(self.import_button)
-        section.addSubview_(self.clear_button)
-        section.addSubview_(self.db_info_label)
+        self.db_info_label.setFont_(_FONT_12)
+        self.db_info_label.setTextColor_(_SEC_LABEL_COLOR)
+        
+        button_row = NSStackView.stackViewWithViews_([
+            self.export_button,
+            self.import_button,
+            self.clear_button
+        ])
+        
+        self.layoutSection_rows_widths_(section, [title_label, button_row, self.db_info_label], [
+            (self.export_button, 120),
+            (self.import_button, 120),
+            (self.clear_button, 120),
+            (self.db_info_label, 400)
+        ])
         
         return section
     
@@ -212,67 +339,78 @@ class SettingsView(NSView):
         """Create appearance settings section."""
         section = NSView.alloc().initWithFrame_(NSMakeRect(20, 300, 960, 120))
         section.setWantsLayer_(True)
-        section.layer().setBackgroundColor_(NSColor.controlBackgroundColor().CGColor())
         section.layer().setCornerRadius_(8)
         
         # Section title
-        title_label = NSTextField.alloc().initWithFrame_(NSMakeRect(20, 90, 200, 20))
+        title_label = OpaqueLabel.alloc().init()
         title_label.setStringValue_("Appearance")
         title_label.setBordered_(False)
-        title_label.setDrawsBackground_(False)
+        title_label.setDrawsBackground_(True)
+        title_label.setBackgroundColor_(_BG_COLOR)
         title_label.setEditable_(False)
         title_label.setSelectable_(False)
-        title_label.setFont_(NSFont.systemFontOfSize_(14, NSFontWeightMedium))
-        title_label.setTextColor_(NSColor.labelColor())
+        title_label.setFont_(_FONT_14_MED)
+        title_label.setTextColor_(_LABEL_COLOR)
         
         # Theme selection
-        theme_label = NSTextField.alloc().initWithFrame_(NSMakeRect(20, 60, 100, 20))
+        theme_label = OpaqueLabel.alloc().init()
         theme_label.setStringValue_("Theme:")
         theme_label.setBordered_(False)
-        theme_label.setDrawsBackground_(False)
+        theme_label.setDrawsBackground_(True)
+        theme_label.setBackgroundColor_(_BG_COLOR)
         theme_label.setEditable_(False)
         theme_label.setSelectable_(False)
-        theme_label.setFont_(NSFont.systemFontOfSize_(12))
-        theme_label.setTextColor_(NSColor.labelColor())
+        theme_label.setFont_(_FONT_12)
+        theme_label.setTextColor_(_LABEL_COLOR)
         
-        self.theme_popup = NSPopUpButton.alloc().initWithFrame_(NSMakeRect(130, 60, 200, 20))
+        self.theme_popup = NSPopUpButton.alloc().init()
         self.theme_popup.addItemWithTitle_("Dark")
         self.theme_popup.addItemWithTitle_("Light")
         self.theme_popup.addItemWithTitle_("Auto")
         self.theme_popup.selectItemWithTitle_("Dark")
         
         # Font size
-        font_label = NSTextField.alloc().initWithFrame_(NSMakeRect(20, 30, 100, 20))
+        font_label = OpaqueLabel.alloc().init()
         font_label.setStringValue_("Font Size:")
         font_label.setBordered_(False)
-        font_label.setDrawsBackground_(False)
+        font_label.setDrawsBackground_(True)
+        font_label.setBackgroundColor_(_BG_COLOR)
         font_label.setEditable_(False)
         font_label.setSelectable_(False)
-        font_label.setFont_(NSFont.systemFontOfSize_(12))
-        font_label.setTextColor_(NSColor.labelColor())
+        font_label.setFont_(_FONT_12)
+        font_label.setTextColor_(_LABEL_COLOR)
         
-        self.font_slider = NSSlider.alloc().initWithFrame_(NSMakeRect(130, 30, 200, 20))
+        self.font_slider = NSSlider.alloc().init()
         self.font_slider.setMinValue_(10)
         self.font_slider.setMaxValue_(20)
         self.font_slider.setDoubleValue_(12)
         self.font_slider.setTarget_(self)
         self.font_slider.setAction_('fontSizeChanged:')
         
-        self.font_size_label = NSTextField.alloc().initWithFrame_(NSMakeRect(340, 30, 50, 20))
+        self.font_size_label = OpaqueLabel.alloc().init()
         self.font_size_label.setStringValue_("12")
         self.font_size_label.setBordered_(False)
-        self.font_size_label.setDrawsBackground_(False)
+        self.font_size_label.setDrawsBackground_(True)
+        self.font_size_label.setBackgroundColor_(_BG_COLOR)
         self.font_size_label.setEditable_(False)
         self.font_size_label.setSelectable_(False)
-        self.font_size_label.setFont_(NSFont.systemFontOfSize_(12))
-        self.font_size_label.setTextColor_(NSColor.labelColor())
-        
-        section.addSubview_(title_label)
-        section.addSubview_(theme_label)
-        section.addSubview_(self.theme_popup)
-        section.addSubview_(font_label)
-        section.addSubview_(self.font_slider)
-        section.addSubview_(self.font_size_label)
+        self.font_size_label.setFont_(_FONT_12)
+        self.font_size_label.setTextColor_(_LABEL_COLOR)
+        
+        theme_row = NSStackView.stackViewWithViews_([theme_label, self.theme_popup])
+        font_row = NSStackView.stackViewWithViews_([
+            font_label,
+            self.font_slider,
+            self.font_size_label
+        ])
+        
+        self.layoutSection_rows_widths_(section, [title_label, theme_row, font_row], [
+            (theme_label, 100),
+            (self.theme_popup, 200),
+            (font_label, 100),
+            (self.font_slider, 200),
+            (self.font_size_label, 50)
+        ])
         
         return section
     
@@ -282,11 +420,26 @@ class SettingsView(NSView):
             self.status_label.setStringValue_("No client available")
             return
         
+        url = self._ollama_url_str
+        model = self._model_str
+        
+        # Results of earlier probes for other settings are dropped from now on
+        self._pending_probe = (url, model)
+        
+        # Reuse a recent successful probe of the same server and model
+        if self._last_probe:
+            last_url, last_model, last_ok, last_time = self._last_probe
+            if (last_ok and (last_url, last_model) == (url, model)
+                    and time.monotonic() - last_time < PROBE_CACHE_SECONDS):
+                self.showConnectionStatus(True)
+                return
+        
         # Update client settings
-        self.ollama_client.base_url = self.ollama_url_field.stringValue()
-        self.ollama_client.model_name = self.model_field.stringValue()
+        self.ollama_client.base_url = url
+        self.ollama_client.model_name = model
         
-        # Test connection
+        # Test connection on the shared background loop so the main thread
+        # never waits for the probe
         import asyncio
         
         async def test():
@@ -297,18 +450,56 @@ class SettingsView(NSView):
                 logger.error(f"Connection test failed: {e}")
                 return False
         
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            connected = loop.run_until_complete(test())
-            if connected:
-                self.status_label.setStringValue_("Connected")
-                self.status_label.setTextColor_(NSColor.systemGreenColor())
-            else:
-                self.status_label.setStringValue_("Connection failed")
-                self.status_label.setTextColor_(NSColor.systemRedColor())
-        finally:
-            loop.close()
+        future = asyncio.run_coroutine_threadsafe(test(), SettingsView.backgroundLoop())
+        future.add_done_callback(
+            lambda done: self.performSelectorOnMainThread_withObject_waitUntilDone_(
+                'connectionTestDidFinish:', (url, model, done.result()), False
+            )
+        )
+    
+    def controlTextDidChange_(self, notification):
+        """Keep the Python copies of the AI settings fields up to date."""
+        field = notification.object()
+        
+        if field is self.ollama_url_field:
+            self._ollama_url_str = str(field.stringValue())
+        elif field is self.model_field:
+            self._model_str = str(field.stringValue())
+    
+    def connectionTestDidFinish_(self, result):
+        """Record and show a (url, model, connected) test result; runs on the main thread."""
+        url, model, connected = result
+        
+        # A late result for settings the user has since changed would be
+        # shown and cached under the wrong URL or model
+        if (url, model) != self._pending_probe:
+            return
+        
+        self._last_probe = (url, model, bool(connected), time.monotonic())
+        self.showConnectionStatus(connected)
+    
+    def showConnectionStatus(self, connected):
+        """Update the status label for a connection result."""
+        if connected:
+            self.status_label.setStringValue_("Connected")
+            self.status_label.setTextColor_(_GREEN_COLOR)
+        else:
+            self.status_label.setStringValue_("Connection failed")
+            self.status_label.setTextColor_(_RED_COLOR)
+    
+    @classmethod
+    def backgroundLoop(cls):
+        """Return the event loop shared by settings views, starting it on first use."""
+        if cls._bg_loop is None:
+            import asyncio
+            import threading
+            
+            cls._bg_loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=cls._bg_loop.run_forever, name="SettingsViewLoop", daemon=True
+            ).start()
+        
+        return cls._bg_loop
     
     def exportData_(self, sender):
         """Export application data."""
@@ -6,10 +6,125 @@ import objc
 from Foundation import *
 from AppKit import *
 from Cocoa import *
+from Quartz import CALayer, CATransaction, kCAGravityResizeAspect
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Fonts and colors shared by every widget in the view, filled in by
+# _load_ui_resources on first use (the module can be imported before
+# NSApplication is set up). The NSColors are dynamic and follow the
+# appearance on their own; layer CGColors and icons are resolved per view.
+_FONT_20 = None
+_FONT_14_MED = None
+_FONT_10 = None
+_LABEL_COLOR = None
+_SEC_LABEL_COLOR = None
+_SELECTED_TEXT_COLOR = None
+_BG_COLOR = None
+_SELECTED_COLOR = None
+_HOVER_COLOR = None
+_CLEAR_CG = None
+
+# Point size of the SF Symbols tab icons
+ICON_POINT_SIZE = 18
+
+# Tinted tab icons as CGImages, keyed by (symbol name, point size, active, appearance name)
+_ICON_CACHE = {}
+
+def _load_ui_resources():
+    """Look up the shared fonts and colors, once."""
+    global _FONT_20, _FONT_14_MED, _FONT_10, _LABEL_COLOR, _SEC_LABEL_COLOR
+    global _SELECTED_TEXT_COLOR, _BG_COLOR, _SELECTED_COLOR, _HOVER_COLOR, _CLEAR_CG
+    
+    if _FONT_14_MED is not None:
+        return
+    
+    _FONT_20 = NSFont.systemFontOfSize_(20)
+    _FONT_14_MED = NSFont.systemFontOfSize_(14, NSFontWeightMedium)
+    _FONT_10 = NSFont.systemFontOfSize_(10)
+    _LABEL_COLOR = NSColor.labelColor()
+    _SEC_LABEL_COLOR = NSColor.secondaryLabelColor()
+    _SELECTED_TEXT_COLOR = NSColor.alternateSelectedControlTextColor()
+    _BG_COLOR = NSColor.controlBackgroundColor()
+    _SELECTED_COLOR = NSColor.selectedControlColor()
+    _HOVER_COLOR = NSColor.controlHighlightColor()
+    _CLEAR_CG = NSColor.clearColor().CGColor()
+
+def _cg_color_for_view(color, view):
+    """Resolve a dynamic NSColor to a CGColor under the view's appearance."""
+    previous = NSAppearance.currentAppearance()
+    NSAppearance.setCurrentAppearance_(view.effectiveAppearance())
+    try:
+        return color.CGColor()
+    finally:
+        NSAppearance.setCurrentAppearance_(previous)
+
+def _symbols_available():
+    """Return whether SF Symbols can be loaded (macOS 11 and later)."""
+    return bool(NSImage.respondsToSelector_('imageWithSystemSymbolName:accessibilityDescription:'))
+
+def _tab_icon(symbol_name, is_active, appearance):
+    """Return the tab icon for a symbol, rendered and tinted once per appearance."""
+    key = (symbol_name, ICON_POINT_SIZE, is_active, appearance.name())
+    icon = _ICON_CACHE.get(key)
+    
+    if icon is None:
+        configuration = NSImageSymbolConfiguration.configurationWithPointSize_weight_(
+            ICON_POINT_SIZE, NSFontWeightRegular
+        )
+        symbol = NSImage.imageWithSystemSymbolName_accessibilityDescription_(
+            symbol_name, None
+        ).imageWithSymbolConfiguration_(configuration)
+        size = symbol.size()
+        rect = NSMakeRect(0, 0, size.width, size.height)
+        
+        # Symbols are template images, so tint by filling over the glyph in
+        # the color the appearance resolves to
+        previous = NSAppearance.currentAppearance()
+        NSAppearance.setCurrentAppearance_(appearance)
+        tinted = NSImage.alloc().initWithSize_(size)
+        tinted.lockFocus()
+        try:
+            symbol.drawInRect_(rect)
+            (_SELECTED_TEXT_COLOR if is_active else _LABEL_COLOR).set()
+            NSRectFillUsingOperation(rect, NSCompositingOperationSourceAtop)
+        finally:
+            tinted.unlockFocus()
+            NSAppearance.setCurrentAppearance_(previous)
+        
+        icon, _ = tinted.CGImageForProposedRect_context_hints_(None, None, None)
+        _ICON_CACHE[key] = icon
+    
+    return icon
+
+def _utf16_length(text):
+    """Return the length of text as NSString counts it."""
+    return len(text.encode('utf-16-le')) // 2
+
+class SidebarTabView(NSView):
+    """A single sidebar tab that handles its own hover and click events."""
+    
+    def setTarget_(self, target):
+        """Set the object that receives the tab's action."""
+        self.target = target
+    
+    def setAction_(self, action):
+        """Set the selector sent to the target when the tab is clicked."""
+        self.action = action
+    
+    def mouseUp_(self, event):
+        """Send the tab's action to its target."""
+        NSApp.sendAction_to_from_(self.action, self.target, self)
+    
+    def mouseEntered_(self, event):
+        """Handle mouse entered event."""
+        self.sidebar.tabHoverChanged(self, True)
+    
+    def mouseExited_(self, event):
+        """Handle mouse exited event."""
+        self.sidebar.tabHoverChanged(self, False)
+
 class SidebarView(NSView):
     """Sidebar with navigation tabs."""
     
@@ -18,16 +133,7 @@ class SidebarView(NSView):
         self = super(SidebarView, self).init()
         
         if self:
-            self.setWantsLayer_(True)
-            self.layer().setBackgroundColor_(NSColor.controlBackgroundColor().CGColor())
-            
-            # Initialize properties
-            self.delegate = None
-            self.active_tab = "readings"
-            self.tabs = []
-            
-            # Create tabs
-            self.createTabs()
+            self._commonInit()
             
         return self
     
@@ -36,19 +142,52 @@ class SidebarView(NSView):
         self = super(SidebarView, self).initWithFrame_(frame)
         
         if self:
-            self.setWantsLayer_(True)
-            self.layer().setBackgroundColor_(NSColor.controlBackgroundColor().CGColor())
-            
-            # Initialize properties
-            self.delegate = None
-            self.active_tab = "readings"
-            self.tabs = []
-            
-            # Create tabs
-            self.createTabs()
+            self._commonInit()
             
         return self
     
+    def _commonInit(self):
+        """Set up state shared by both initializers."""
+        _load_ui_resources()
+        self.setWantsLayer_(True)
+        
+        # Initialize properties
+        self.delegate = None
+        self.active_tab = "readings"
+        self.tabs = []
+        self._tabs_by_id = {}
+        
+        # Create tabs
+        self.createTabs()
+        self.createHighlightLayer()
+        self.applyAppearance()
+    
+    def applyAppearance(self):
+        """Resolve layer colors, tab icons and tab text for the current appearance."""
+        appearance = self.effectiveAppearance()
+        self._hover_cg = _cg_color_for_view(_HOVER_COLOR, self)
+        
+        CATransaction.begin()
+        CATransaction.setDisableActions_(True)
+        try:
+            self.layer().setBackgroundColor_(_cg_color_for_view(_BG_COLOR, self))
+            self._highlight_layer.setBackgroundColor_(_cg_color_for_view(_SELECTED_COLOR, self))
+            
+            for tab_view in self.tabs:
+                config = tab_view.tab_config
+                tab_view.active_text = self.tabAttributedString(config, True)
+                tab_view.inactive_text = self.tabAttributedString(config, False)
+                if tab_view.icon_layer is not None:
+                    tab_view.active_icon = _tab_icon(config['symbol'], True, appearance)
+                    tab_view.inactive_icon = _tab_icon(config['symbol'], False, appearance)
+                self.updateTabAppearance(tab_view)
+        finally:
+            CATransaction.commit()
+    
+    def viewDidChangeEffectiveAppearance(self):
+        """Re-render the tabs, whose layer colors and icons do not follow appearance changes."""
+        self.applyAppearance()
+    
     def createTabs(self):
         """Create navigation tabs."""
         tab_configs = [
@@ -56,24 +195,28 @@ class SidebarView(NSView):
                 'id': 'readings',
                 'title': 'Readings',
                 'icon': '📖',
+                'symbol': 'book',
                 'description': 'Draw and interpret tarot cards'
             },
             {
                 'id': 'chat',
                 'title': 'Chat',
                 'icon': '💬',
+                'symbol': 'bubble.left.and.bubble.right',
                 'description': 'Chat with AI about readings'
             },
             {
                 'id': 'history',
                 'title': 'History',
                 'icon': '📚',
+                'symbol': 'books.vertical',
                 'description': 'View past readings'
             },
             {
                 'id': 'settings',
                 'title': 'Settings',
                 'icon': '⚙️',
+                'symbol': 'gearshape',
                 'description': 'App preferences and configuration'
             }
         ]
@@ -81,70 +224,91 @@ class SidebarView(NSView):
         y_offset = 20
         tab_height = 60
         
-        for i, config in enumerate(tab_configs):
-            tab_view = self.createTabView(config, NSMakeRect(10, y_offset, 180, tab_height))
-            self.addSubview_(tab_view)
-            self.tabs.append(tab_view)
-            
-            y_offset += tab_height + 10
+        # Build every tab's layer in one transaction without implicit animations
+        CATransaction.begin()
+        CATransaction.setDisableActions_(True)
+        try:
+            for i, config in enumerate(tab_configs):
+                tab_view = self.createTabView(config, NSMakeRect(10, y_offset, 180, tab_height))
+                self.tabs.append(tab_view)
+                self._tabs_by_id[config['id']] = tab_view
+                
+                y_offset += tab_height + 10
+        finally:
+            CATransaction.commit()
+        
+        self.setSubviews_(self.tabs)
+    
+    def createHighlightLayer(self):
+        """Create the layer that marks the active tab."""
+        # One layer slides under whichever tab is active instead of every
+        # tab recoloring its own background
+        self._highlight_layer = CALayer.layer()
+        self._highlight_layer.setCornerRadius_(8)
+        self.layer().insertSublayer_atIndex_(self._highlight_layer, 0)
+        self.moveHighlightToActiveTab()
+    
+    def moveHighlightToActiveTab(self):
+        """Position the highlight layer under the active tab."""
+        tab_view = self._tabs_by_id.get(self.active_tab)
+        
+        CATransaction.begin()
+        CATransaction.setDisableActions_(True)
+        if tab_view is None:
+            self._highlight_layer.setHidden_(True)
+        else:
+            self._highlight_layer.setHidden_(False)
+            self._highlight_layer.setFrame_(tab_view.frame())
+        CATransaction.commit()
     
     def createTabView(self, config, frame):
         """Create a single tab view."""
-        tab_view = NSView.alloc().initWithFrame_(frame)
+        tab_view = SidebarTabView.alloc().initWithFrame_(frame)
         tab_view.setWantsLayer_(True)
         tab_view.layer().setCornerRadius_(8)
-        tab_view.layer().setBackgroundColor_(NSColor.clearColor().CGColor())
+        tab_view.layer().setBackgroundColor_(_CLEAR_CG)
+        tab_view.sidebar = self
         
-        # Set up hover tracking
+        # Set up hover tracking; the area follows the tab's visible rect and
+        # delivers enter/exit events straight to the tab
         tracking_area = NSTrackingArea.alloc().initWithRect_options_owner_userInfo_(
-            frame,
-            NSTrackingMouseEnteredAndExited | NSTrackingActiveInKeyWindow,
+            NSZeroRect,
+            NSTrackingMouseEnteredAndExited | NSTrackingActiveInKeyWindow | NSTrackingInVisibleRect,
             tab_view,
             None
         )
         tab_view.addTrackingArea_(tracking_area)
         
-        # Icon label
-        icon_label = NSTextField.alloc().initWithFrame_(NSMakeRect(15, 35, 30, 20))
-        icon_label.setStringValue_(config['icon'])
-        icon_label.setBordered_(False)
-        icon_label.setDrawsBackground_(False)
-        icon_label.setEditable_(False)
-        icon_label.setSelectable_(False)
-        icon_label.setFont_(NSFont.systemFontOfSize_(20))
-        icon_label.setTextColor_(NSColor.labelColor())
-        
-        # Title label
-        title_label = NSTextField.alloc().initWithFrame_(NSMakeRect(50, 35, 120, 20))
-        title_label.setStringValue_(config['title'])
-        title_label.setBordered_(False)
-        title_label.setDrawsBackground_(False)
-        title_label.setEditable_(False)
-        title_label.setSelectable_(False)
-        title_label.setFont_(NSFont.systemFontOfSize_(14, NSFontWeightMedium))
-        title_label.setTextColor_(NSColor.labelColor())
-        
-        # Description label
-        desc_label = NSTextField.alloc().initWithFrame_(NSMakeRect(15, 15, 155, 15))
-        desc_label.setStringValue_(config['description'])
-        desc_label.setBordered_(False)
-        desc_label.setDrawsBackground_(False)
-        desc_label.setEditable_(False)
-        desc_label.setSelectable_(False)
-        desc_label.setFont_(NSFont.systemFontOfSize_(10))
-        desc_label.setTextColor_(NSColor.secondaryLabelColor())
-        
-        # Add subviews
-        tab_view.addSubview_(icon_label)
-        tab_view.addSubview_(title_label)
-        tab_view.addSubview_(desc_label)
+        # Title and description share one label; both states of the label
+        # and the icon are built up front by applyAppearance so switching
+        # tabs only swaps them. Before macOS 11 there are no SF Symbols and
+        # the label leads with the emoji icon instead.
+        tab_view.active_text = self.tabAttributedString(config, True)
+        tab_view.inactive_text = self.tabAttributedString(config, False)
+        tab_view.active_icon = None
+        tab_view.inactive_icon = None
+        
+        if _symbols_available():
+            icon_layer = CALayer.layer()
+            icon_layer.setFrame_(NSMakeRect(15, 33, 24, 22))
+            icon_layer.setContentsGravity_(kCAGravityResizeAspect)
+            tab_view.layer().addSublayer_(icon_layer)
+        else:
+            icon_layer = None
+        
+        text_label = NSTextField.alloc().initWithFrame_(NSMakeRect(15, 10, 160, 45))
+        text_label.setBordered_(False)
+        text_label.setDrawsBackground_(False)
+        text_label.setEditable_(False)
+        text_label.setSelectable_(False)
+        
+        tab_view.setSubviews_([text_label])
         
         # Store configuration
         tab_view.tab_id = config['id']
         tab_view.tab_config = config
-        tab_view.icon_label = icon_label
-        tab_view.title_label = title_label
-        tab_view.desc_label = desc_label
+        tab_view.text_label = text_label
+        tab_view.icon_layer = icon_layer
         
         # Set up click handling
         tab_view.setTarget_(self)
@@ -155,30 +319,85 @@ class SidebarView(NSView):
         
         return tab_view
     
+    def tabAttributedString(self, config, is_active):
+        """Build the title and description text for a tab."""
+        if _symbols_available():
+            head = config['title']
+            icon_length = 0
+        else:
+            head = f"{config['icon']}  {config['title']}"
+            icon_length = _utf16_length(config['icon'])
+        text = f"{head}\n{config['description']}"
+        
+        # Attribute ranges are in UTF-16 units, which the emoji icons can
+        # span more than one of
+        head_length = _utf16_length(head)
+        desc_length = _utf16_length(text) - head_length
+        
+        primary_color = _SELECTED_TEXT_COLOR if is_active else _LABEL_COLOR
+        secondary_color = _SELECTED_TEXT_COLOR if is_active else _SEC_LABEL_COLOR
+        
+        head_attributes = {
+            NSFontAttributeName: _FONT_14_MED,
+            NSForegroundColorAttributeName: primary_color
+        }
+        if not icon_length:
+            # The title line starts to the right of the icon layer
+            title_style = NSMutableParagraphStyle.alloc().init()
+            title_style.setFirstLineHeadIndent_(35)
+            head_attributes[NSParagraphStyleAttributeName] = title_style
+        
+        attributed = NSMutableAttributedString.alloc().initWithString_(text)
+        attributed.addAttributes_range_(head_attributes, NSMakeRange(0, head_length))
+        if icon_length:
+            attributed.addAttributes_range_(
+                {NSFontAttributeName: _FONT_20},
+                NSMakeRange(0, icon_length)
+            )
+        attributed.addAttributes_range_(
+            {NSFontAttributeName: _FONT_10, NSForegroundColorAttributeName: secondary_color},
+            NSMakeRange(head_length, desc_length)
+        )
+        
+        return attributed
+    
     def updateTabAppearance(self, tab_view):
         """Update tab appearance based on active state."""
         is_active = tab_view.tab_id == self.active_tab
         
+        # The background comes from the shared highlight layer
         if is_active:
             # Active tab styling
-            tab_view.layer().setBackgroundColor_(NSColor.selectedControlColor().CGColor())
-            tab_view.title_label.setTextColor_(NSColor.alternateSelectedControlTextColor())
-            tab_view.icon_label.setTextColor_(NSColor.alternateSelectedControlTextColor())
-            tab_view.desc_label.setTextColor_(NSColor.alternateSelectedControlTextColor())
+            tab_view.text_label.setAttributedStringValue_(tab_view.active_text)
+            if tab_view.icon_layer is not None:
+                tab_view.icon_layer.setContents_(tab_view.active_icon)
         else:
             # Inactive tab styling
-            tab_view.layer().setBackgroundColor_(NSColor.clearColor().CGColor())
-            tab_view.title_label.setTextColor_(NSColor.labelColor())
-            tab_view.icon_label.setTextColor_(NSColor.labelColor())
-            tab_view.desc_label.setTextColor_(NSColor.secondaryLabelColor())
+            tab_view.text_label.setAttributedStringValue_(tab_view.inactive_text)
+            if tab_view.icon_layer is not None:
+                tab_view.icon_layer.setContents_(tab_view.inactive_icon)
     
     def setActiveTab_(self, tab_id):
         """Set the active tab."""
+        previous_tab = self._tabs_by_id.get(self.active_tab)
         self.active_tab = tab_id
         
-        # Update all tab appearances
-        for tab_view in self.tabs:
-            self.updateTabAppearance(tab_view)
+        # Only the outgoing and incoming tabs change
+        CATransaction.begin()
+        CATransaction.setDisableActions_(True)
+        try:
+            if previous_tab is not None:
+                previous_tab.layer().setBackgroundColor_(_CLEAR_CG)
+                self.updateTabAppearance(previous_tab)
+            
+            tab_view = self._tabs_by_id.get(tab_id)
+            if tab_view is not None:
+                tab_view.layer().setBackgroundColor_(_CLEAR_CG)
+                self.updateTabAppearance(tab_view)
+            
+            self.moveHighlightToActiveTab()
+        finally:
+            CATransaction.commit()
     
     def tabClicked_(self, sender):
         """Handle tab click."""
@@ -191,23 +410,12 @@ class SidebarView(NSView):
             if self.delegate and hasattr(self.delegate, 'sidebarDidSelectTab_'):
                 self.delegate.sidebarDidSelectTab_(tab_id)
     
-    def mouseEntered_(self, event):
-        """Handle mouse entered event."""
-        # Find the tab view under the mouse
-        mouse_point = self.convertPoint_fromView_(event.locationInWindow(), None)
-        
-        for tab_view in self.tabs:
-            if NSPointInRect(mouse_point, tab_view.frame()):
-                if tab_view.tab_id != self.active_tab:
-                    # Show hover effect
-                    tab_view.layer().setBackgroundColor_(NSColor.controlHighlightColor().CGColor())
-                break
-    
-    def mouseExited_(self, event):
-        """Handle mouse exited event."""
-        # Reset all tab appearances
-        for tab_view in self.tabs:
-            self.updateTabAppearance(tab_view)
+    def tabHoverChanged(self, tab_view, hovering):
+        """Show or clear the hover effect on a tab."""
+        if hovering and tab_view.tab_id != self.active_tab:
+            tab_view.layer().setBackgroundColor_(self._hover_cg)
+        else:
+            tab_view.layer().setBackgroundColor_(_CLEAR_CG)
     
     def setDelegate_(self, delegate):
         """Set the delegate."""
@@ -0,0 +1,196 @@
+"""
+Numeric kernels for the influence engines.
+
+The kernels are compiled with Numba when it is installed (the "speed" extra)
+and run as plain Python otherwise, so their bodies only use constructs that
+work in both modes.
+"""
+
+from typing import List, Sequence, Tuple
+
+try:
+    import numpy
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that leaves the function as plain Python."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda function: function
+
+# Below this many factors the Numba call overhead outweighs the summation
+POLARITY_KERNEL_MIN_FACTORS = 4
+
+@njit(cache=True)
+def _apply_rules_kernel(
+    base_polarity, base_intensity, polarity, intensity, element_idx, reversed_mask,
+    neighbor_ptr, neighbor_idx, neighbor_weight, affinity, damp_factor, decay,
+    polarity_out, intensity_out
+):
+    """Apply adjacency, elemental, reversal and conflict arithmetic to every card."""
+    for i in range(len(polarity)):
+        p = polarity[i]
+        t = intensity[i]
+        start = neighbor_ptr[i]
+        end = neighbor_ptr[i + 1]
+
+        # Adjacency influence
+        for k in range(start, end):
+            p += base_polarity[neighbor_idx[k]] * neighbor_weight[k]
+
+        # Elemental dignities
+        element = element_idx[i]
+        if element >= 0:
+            for k in range(start, end):
+                neighbor_element = element_idx[neighbor_idx[k]]
+                if neighbor_element >= 0:
+                    p *= affinity[element][neighbor_element]
+
+        # Reversal propagation
+        for k in range(start, end):
+            j = neighbor_idx[k]
+            if reversed_mask[j]:
+                t -= base_intensity[j] * (1.0 - decay)
+
+        # Conflict resolution
+        polarity_out[i] = p * damp_factor
+        intensity_out[i] = t
+
+def apply_rules(
+    base_polarity: Sequence[float],
+    base_intensity: Sequence[float],
+    polarity: Sequence[float],
+    intensity: Sequence[float],
+    element_idx: Sequence[int],
+    reversed_mask: Sequence[int],
+    neighbor_ptr: Sequence[int],
+    neighbor_idx: Sequence[int],
+    neighbor_weight: Sequence[float],
+    affinity: Sequence[Sequence[float]],
+    damp_factor: float,
+    decay: float
+) -> Tuple[List[float], List[float]]:
+    """
+    Run the neighbor-rule kernel over per-card arrays.
+
+    Args:
+        base_polarity: Baseline polarity of each card
+        base_intensity: Baseline intensity of each card
+        polarity: Starting polarity of each card, after the reversal modifier
+        intensity: Starting intensity of each card, after the reversal modifier
+            and any numerical sequence bonus
+        element_idx: Element index of each card, or -1 for none
+        reversed_mask: 1 for reversed cards, 0 otherwise
+        neighbor_ptr: Start of each card's neighbors in neighbor_idx (CSR row pointer)
+        neighbor_idx: Card index of each neighbor
+        neighbor_weight: Adjacency weight of each neighbor
+        affinity: Elemental affinity by element index pair
+        damp_factor: Polarity multiplier from conflict resolution
+        decay: Reversal decay factor
+
+    Returns:
+        Updated polarity and intensity scores
+    """
+    count = len(polarity)
+
+    if NUMBA_AVAILABLE:
+        polarity_out = numpy.empty(count)
+        intensity_out = numpy.empty(count)
+        _apply_rules_kernel(
+            numpy.asarray(base_polarity, dtype=numpy.float64),
+            numpy.asarray(base_intensity, dtype=numpy.float64),
+            numpy.asarray(polarity, dtype=numpy.float64),
+            numpy.asarray(intensity, dtype=numpy.float64),
+            numpy.asarray(element_idx, dtype=numpy.int64),
+            numpy.asarray(reversed_mask, dtype=numpy.int64),
+            numpy.asarray(neighbor_ptr, dtype=numpy.int64),
+            numpy.asarray(neighbor_idx, dtype=numpy.int64),
+            numpy.asarray(neighbor_weight, dtype=numpy.float64),
+            numpy.asarray(affinity, dtype=numpy.float64),
+            damp_factor, decay, polarity_out, intensity_out
+        )
+        return polarity_out.tolist(), intensity_out.tolist()
+
+    polarity_out = [0.0] * count
+    intensity_out = [0.0] * count
+    _apply_rules_kernel(
+        base_polarity, base_intensity, polarity, intensity, element_idx, reversed_mask,
+        neighbor_ptr, neighbor_idx, neighbor_weight, affinity, damp_factor, decay,
+        polarity_out, intensity_out
+    )
+    return polarity_out, intensity_out
+
+@njit(cache=True)
+def _polarity_kernel(base, effects, lo, hi):
+    """Add the summed effects to the base polarity and clamp to [lo, hi]."""
+    total = 0.0
+    for k in range(len(effects)):
+        total += effects[k]
+    return max(lo, min(hi, base + total))
+
+def polarity_score(base: float, effects: Sequence[float], lo: float, hi: float) -> float:
+    """
+    Sum influence effects onto a base polarity and clamp the result.
+
+    Args:
+        base: Base polarity, after any reversal modifier
+        effects: Effect of each influence factor
+        lo: Lowest allowed polarity
+        hi: Highest allowed polarity
+
+    Returns:
+        Clamped polarity score
+    """
+    if NUMBA_AVAILABLE and len(effects) >= POLARITY_KERNEL_MIN_FACTORS:
+        return float(_polarity_kernel(base, numpy.asarray(effects, dtype=numpy.float64), lo, hi))
+
+    return max(lo, min(hi, base + sum(effects)))
+
+@njit(cache=True)
+def _polarity_batch_kernel(base, effects, effect_ptr, lo, hi, out):
+    """Clamp each card's base polarity plus its summed effects into out."""
+    for i in range(len(base)):
+        total = 0.0
+        for k in range(effect_ptr[i], effect_ptr[i + 1]):
+            total += effects[k]
+        out[i] = max(lo, min(hi, base[i] + total))
+
+def polarity_scores(
+    bases: Sequence[float],
+    effect_lists: Sequence[Sequence[float]],
+    lo: float,
+    hi: float
+) -> List[float]:
+    """
+    Compute the clamped polarity scores of a whole spread in one call.
+
+    Args:
+        bases: Base polarity of each card, after any reversal modifier
+        effect_lists: Effects of each card's influence factors
+        lo: Lowest allowed polarity
+        hi: Highest allowed polarity
+
+    Returns:
+        Clamped polarity score of each card
+    """
+    if NUMBA_AVAILABLE:
+        effect_ptr = [0]
+        effects = []
+        for card_effects in effect_lists:
+            effects.extend(card_effects)
+            effect_ptr.append(len(effects))
+
+        if len(effects) >= POLARITY_KERNEL_MIN_FACTORS:
+            out = numpy.empty(len(bases))
+            _polarity_batch_kernel(
+                numpy.asarray(bases, dtype=numpy.float64),
+                numpy.asarray(effects, dtype=numpy.float64),
+                numpy.asarray(effect_ptr, dtype=numpy.int64),
+                lo, hi, out
+            )
+            return out.tolist()
+
+    return [max(lo, min(hi, base + sum(card_effects))) for base, card_effects in zip(bases, effect_lists)]
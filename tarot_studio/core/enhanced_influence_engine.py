@@ -8,11 +8,17 @@ practitioner techniques and academic research.
 
 import json
 import math
+import sys
+from collections import Counter
+from collections.abc import MutableMapping
 from typing import List, Dict, Any, Tuple, Optional, Union
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 import logging
 
+from ._rules_numba import apply_rules
+
 logger = logging.getLogger(__name__)
 
 class Orientation(Enum):
@@ -32,7 +38,104 @@ class Element(Enum):
     AIR = "air"
     EARTH = "earth"
 
-@dataclass
+# Element enum member for each element string in the card database
+_ELEMENT_STR_TO_ENUM = {element.value: element for element in Element}
+
+# Elemental dignity of each Major Arcana card, by card ID
+_ELEMENT_TABLE = {
+    "the_sun": "fire", "the_magician": "fire", "the_emperor": "fire",
+    "strength": "fire", "the_tower": "fire", "judgement": "fire",
+    "the_high_priestess": "water", "the_chariot": "water", "death": "water",
+    "the_moon": "water",
+    "the_fool": "air", "the_hierophant": "air", "the_lovers": "air",
+    "justice": "air", "the_star": "air",
+    "the_empress": "earth", "the_hermit": "earth", "temperance": "earth",
+    "the_world": "earth"
+}
+
+# Elemental dignity of each Minor Arcana suit, matched on the card ID suffix
+_SUIT_ELEMENT = {
+    "wands": "fire",
+    "cups": "water",
+    "swords": "air",
+    "pentacles": "earth"
+}
+
+# Position of each element in the affinity rows handed to the rule kernel
+_ELEMENT_INDEX = {"fire": 0, "water": 1, "air": 2, "earth": 3}
+
+# Elemental affinity by elemental system, as rows/columns in _ELEMENT_INDEX order
+_AFFINITY_ARRAYS = {
+    # Crowley's elemental dignity system
+    "crowley": (
+        (1.2, 0.6, 1.0, 0.8),
+        (0.6, 1.2, 0.8, 1.0),
+        (1.0, 0.8, 1.2, 0.6),
+        (0.8, 1.0, 0.6, 1.2)
+    ),
+    # Simplified elemental system
+    "simplified": (
+        (1.1, 0.7, 1.0, 0.9),
+        (0.7, 1.1, 0.9, 1.0),
+        (1.0, 0.9, 1.1, 0.7),
+        (0.9, 1.0, 0.7, 1.1)
+    ),
+    # Traditional elemental system
+    "traditional": (
+        (1.15, 0.65, 1.0, 0.85),
+        (0.65, 1.15, 0.85, 1.0),
+        (1.0, 0.85, 1.15, 0.65),
+        (0.85, 1.0, 0.65, 1.15)
+    )
+}
+
+# Polarity multiplier applied when a spread holds strongly opposed cards
+CONFLICT_DAMPING_FACTOR = 0.7
+
+# Fields every computed reading and each of its cards must carry
+_REQUIRED_OUTPUT_FIELDS = ("reading_id", "summary", "cards")
+_REQUIRED_CARD_FIELDS = (
+    "position", "card_id", "card_name", "orientation", "base_text", "influenced_text",
+    "polarity_score", "intensity_score", "themes", "influence_factors", "journal_prompt"
+)
+_REQUIRED_CARD_FIELD_SET = frozenset(_REQUIRED_CARD_FIELDS)
+
+# Theme-specific guidance: (theme, weight threshold, advice, follow-up question)
+_THEME_GUIDANCE = (
+    ("love", 0.5, "Nurture your relationships", "What relationships are most important to you?"),
+    ("career", 0.5, "Focus on your professional development", "What professional goals are you working toward?"),
+    ("creativity", 0.5, "Express your creative side", "How can you express your creativity more fully?")
+)
+
+# Major Arcana card IDs that do not start with "the_"
+_MAJOR_WHITELIST = frozenset({"strength", "justice", "temperance", "judgement"})
+
+@lru_cache(maxsize=4096)
+def _format_effect_cached(template: str, value: float) -> str:
+    """Format a non-zero effect value with the given template."""
+    return template.format(value)
+
+def _format_effect(template: str, value: float) -> str:
+    """Format an influence factor's effect, reusing the text of recently seen values."""
+    if value == 0.0:
+        # 0.0 and -0.0 share a cache key but format differently
+        return template.format(value)
+    return _format_effect_cached(template, value)
+
+def _is_major_card_id(card_id: str) -> bool:
+    """Return True if the card ID names a Major Arcana card."""
+    return card_id.startswith("the_") or card_id in _MAJOR_WHITELIST
+
+def _element_of(card_id: str) -> Optional[str]:
+    """Return the element used for elemental dignities, or None if the card has none."""
+    element = _ELEMENT_TABLE.get(card_id)
+    if element is None:
+        _, separator, suit = card_id.rpartition("_")
+        if separator:
+            element = _SUIT_ELEMENT.get(suit)
+    return element
+
+@dataclass(slots=True)
 class CardMetadata:
     """Card metadata with all required attributes."""
     card_id: str
@@ -47,22 +150,85 @@ class CardMetadata:
     themes: Dict[str, float] = None
     base_upright_text: str = ""
     base_reversed_text: str = ""
+    dignity_element: Optional[str] = field(init=False, default=None)
+    element_idx: int = field(init=False, default=-1)  # _ELEMENT_INDEX of dignity_element, -1 for none
+    is_major: bool = field(init=False, default=False)
     
     def __post_init__(self):
         if self.keywords is None:
             self.keywords = []
         if self.themes is None:
             self.themes = {}
+        self.dignity_element = _element_of(self.card_id)
+        self.element_idx = _ELEMENT_INDEX.get(self.dignity_element, -1)
+        self.is_major = self.arcana is Arcana.MAJOR or _is_major_card_id(self.card_id)
 
-@dataclass
+@dataclass(slots=True)
 class CardPosition:
     """Represents a card in a specific position within a spread."""
     position_id: str
     card_id: str
     orientation: Orientation
     card_metadata: CardMetadata
+    idx: int = -1  # Order within the spread, used to address per-card arrays
+    reversed: bool = field(init=False, default=False)
+    
+    def __post_init__(self):
+        self.reversed = self.orientation is Orientation.REVERSED
+
+class _LazyThemes(MutableMapping):
+    """Theme weights that share the card's base dict until first modified."""
+    
+    __slots__ = ("_data", "_owned")
+    
+    def __init__(self, base: Dict[str, float]):
+        self._data = base
+        self._owned = False
+    
+    def _own(self):
+        """Copy the shared base dict before the first write."""
+        if not self._owned:
+            self._data = dict(self._data)
+            self._owned = True
+    
+    def __getitem__(self, key):
+        return self._data[key]
+    
+    def __setitem__(self, key, value):
+        self._own()
+        self._data[key] = value
+    
+    def __delitem__(self, key):
+        self._own()
+        del self._data[key]
+    
+    def __contains__(self, key):
+        return key in self._data
+    
+    def __iter__(self):
+        return iter(self._data)
+    
+    def __len__(self):
+        return len(self._data)
+    
+    def __repr__(self):
+        return repr(self._data)
+    
+    def get(self, key, default=None):
+        return self._data.get(key, default)
+    
+    def items(self):
+        return self._data.items()
+    
+    def copy(self) -> Dict[str, float]:
+        """Return the themes as a new plain dict, like dict.copy()."""
+        return dict(self._data)
+    
+    def to_dict(self) -> Dict[str, float]:
+        """Return the themes as a new plain dict."""
+        return dict(self._data)
 
-@dataclass
+@dataclass(slots=True)
 class InfluenceFactor:
     """Represents how one card influences another."""
     source_position: str
@@ -70,8 +236,19 @@ class InfluenceFactor:
     effect: str  # String format like "+0.40" or "-0.20"
     explain: str
     confidence: str = "high"  # high, medium, low
+    value: float = 0.0  # Raw number behind effect, for comparisons
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert factor to dictionary."""
+        return {
+            "source_position": self.source_position,
+            "source_card_id": self.source_card_id,
+            "effect": self.effect,
+            "explain": self.explain,
+            "confidence": self.confidence
+        }
 
-@dataclass
+@dataclass(slots=True)
 class InfluencedCard:
     """A card with computed influence modifications."""
     position: str
@@ -85,8 +262,32 @@ class InfluencedCard:
     themes: Dict[str, float]
     influence_factors: List[InfluenceFactor]
     journal_prompt: str
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert influenced card to dictionary."""
+        return {
+            "position": self.position,
+            "card_id": self.card_id,
+            "card_name": self.card_name,
+            "orientation": self.orientation,
+            "base_text": self.base_text,
+            "influenced_text": self.influenced_text,
+            "polarity_score": self.polarity_score,
+            "intensity_score": self.intensity_score,
+            "themes": dict(self.themes),
+            "influence_factors": [factor.to_dict() for factor in self.influence_factors],
+            "journal_prompt": self.journal_prompt
+        }
+
+@dataclass(slots=True)
+class CompiledAdjacency:
+    """Adjacency matrix in CSR form, addressed by integer position indices."""
+    position_index: Dict[str, int]
+    indptr: List[int]  # Row i's entries are indices/weights[indptr[i]:indptr[i + 1]]
+    indices: List[int]  # Neighbor position index of each entry, in matrix order
+    weights: List[float]  # Non-zero weight of each entry
 
-@dataclass
+@dataclass(slots=True)
 class EngineConfig:
     """Configuration for the influence engine."""
     dominance_multiplier: float = 1.5
@@ -106,38 +307,26 @@ class EnhancedInfluenceEngine:
     def __init__(self, config: EngineConfig = None):
         self.config = config or EngineConfig()
         self.card_metadata_cache: Dict[str, CardMetadata] = {}
+        self._card_metadata_sources: Dict[str, Dict[str, Any]] = {}
         self.adjacency_matrices: Dict[str, Dict[str, Dict[str, float]]] = {}
+        self._affinity_rows = _AFFINITY_ARRAYS.get(self.config.elemental_system, _AFFINITY_ARRAYS["traditional"])
         self.elemental_affinity_matrix = self._build_elemental_affinity_matrix()
         
         # Load canonical adjacency matrices
         self._load_canonical_adjacency_matrices()
+        
+        # Index-addressed form of each canonical matrix, used by the rule pipeline
+        self._compiled_adjacency: Dict[str, CompiledAdjacency] = {
+            spread_type: self._compile_adjacency_matrix(matrix)
+            for spread_type, matrix in self.adjacency_matrices.items()
+        }
     
     def _build_elemental_affinity_matrix(self) -> Dict[str, Dict[str, float]]:
         """Build elemental affinity matrix based on research."""
-        if self.config.elemental_system == "crowley":
-            # Crowley's elemental dignity system
-            return {
-                "fire": {"fire": 1.2, "water": 0.6, "air": 1.0, "earth": 0.8},
-                "water": {"fire": 0.6, "water": 1.2, "air": 0.8, "earth": 1.0},
-                "air": {"fire": 1.0, "water": 0.8, "air": 1.2, "earth": 0.6},
-                "earth": {"fire": 0.8, "water": 1.0, "air": 0.6, "earth": 1.2}
-            }
-        elif self.config.elemental_system == "simplified":
-            # Simplified elemental system
-            return {
-                "fire": {"fire": 1.1, "water": 0.7, "air": 1.0, "earth": 0.9},
-                "water": {"fire": 0.7, "water": 1.1, "air": 0.9, "earth": 1.0},
-                "air": {"fire": 1.0, "water": 0.9, "air": 1.1, "earth": 0.7},
-                "earth": {"fire": 0.9, "water": 1.0, "air": 0.7, "earth": 1.1}
-            }
-        else:  # traditional
-            # Traditional elemental system
-            return {
-                "fire": {"fire": 1.15, "water": 0.65, "air": 1.0, "earth": 0.85},
-                "water": {"fire": 0.65, "water": 1.15, "air": 0.85, "earth": 1.0},
-                "air": {"fire": 1.0, "water": 0.85, "air": 1.15, "earth": 0.65},
-                "earth": {"fire": 0.85, "water": 1.0, "air": 0.65, "earth": 1.15}
-            }
+        return {
+            element: {other: row[column] for other, column in _ELEMENT_INDEX.items()}
+            for element, row in zip(_ELEMENT_INDEX, self._affinity_rows)
+        }
     
     def _load_canonical_adjacency_matrices(self):
         """Load canonical adjacency matrices for standard spreads."""
@@ -192,22 +381,67 @@ class EnhancedInfluenceEngine:
             elif month == "december":
                 self.adjacency_matrices["year_ahead"][month]["january"] = 0.5
     
+    def _compile_adjacency_matrix(self, adjacency_matrix: Dict[str, Dict[str, float]]) -> CompiledAdjacency:
+        """Convert a dict-of-dicts adjacency matrix into CSR arrays."""
+        position_index = {}
+        for position_id, row in adjacency_matrix.items():
+            position_index.setdefault(position_id, len(position_index))
+            for neighbor_id in row:
+                position_index.setdefault(neighbor_id, len(position_index))
+        
+        indptr = [0]
+        indices = []
+        weights = []
+        for position_id in position_index:
+            for neighbor_id, weight in adjacency_matrix.get(position_id, {}).items():
+                if weight > 0:
+                    indices.append(position_index[neighbor_id])
+                    weights.append(weight)
+            indptr.append(len(indices))
+        
+        return CompiledAdjacency(position_index, indptr, indices, weights)
+    
     def load_card_metadata(self, card_data: Dict[str, Any]) -> CardMetadata:
-        """Load card metadata from dictionary."""
-        return CardMetadata(
-            card_id=card_data["card_id"],
+        """
+        Load card metadata from dictionary, reusing it for the same card data dict.
+        
+        The cache is keyed on the dict object, so call clear_card_metadata_cache()
+        after editing a card's data in place.
+        """
+        card_id = card_data["card_id"]
+        
+        # Only reuse metadata built from this same card data dict
+        if self._card_metadata_sources.get(card_id) is card_data:
+            return self.card_metadata_cache[card_id]
+        
+        card_metadata = CardMetadata(
+            card_id=card_id,
             name=card_data["name"],
             arcana=Arcana(card_data["arcana"]),
             suit=card_data.get("suit"),
             number=card_data.get("number"),
-            element=Element(card_data["element"]) if card_data.get("element") else None,
+            element=_ELEMENT_STR_TO_ENUM[card_data["element"]] if card_data.get("element") else None,
             baseline_polarity=card_data["polarity"],
             baseline_intensity=card_data["intensity"],
             keywords=card_data.get("keywords", []),
-            themes=card_data.get("themes", {}),
+            # Interned theme names let the per-spread theme lookups match by identity
+            themes={sys.intern(theme): weight for theme, weight in card_data.get("themes", {}).items()},
             base_upright_text=card_data["upright_meaning"],
             base_reversed_text=card_data["reversed_meaning"]
         )
+        
+        self.card_metadata_cache[card_id] = card_metadata
+        self._card_metadata_sources[card_id] = card_data
+        return card_metadata
+    
+    def clear_card_metadata_cache(self, card_id: Optional[str] = None):
+        """Forget cached metadata for one card, or for every card if no ID is given."""
+        if card_id is None:
+            self.card_metadata_cache.clear()
+            self._card_metadata_sources.clear()
+        else:
+            self.card_metadata_cache.pop(card_id, None)
+            self._card_metadata_sources.pop(card_id, None)
     
     def compute_influenced_meanings(
         self, 
@@ -243,15 +477,16 @@ class EnhancedInfluenceEngine:
             influenced_cards = self._generate_natural_language(influenced_cards)
             
             # Create summary and advice
-            summary = self._generate_summary(influenced_cards)
-            advice = self._generate_advice(influenced_cards)
-            follow_up_questions = self._generate_follow_up_questions(influenced_cards)
+            aggregates = self._aggregate_readings(influenced_cards)
+            summary = self._generate_summary(influenced_cards, aggregates)
+            advice = self._generate_advice(influenced_cards, aggregates)
+            follow_up_questions = self._generate_follow_up_questions(influenced_cards, aggregates)
             
             # Build result
             result = {
                 "reading_id": spread_data["reading_id"],
                 "summary": summary,
-                "cards": [asdict(card) for card in influenced_cards],
+                "cards": [card.to_dict() for card in influenced_cards],
                 "advice": advice,
                 "follow_up_questions": follow_up_questions
             }
@@ -283,7 +518,7 @@ class EnhancedInfluenceEngine:
         """Load card positions with metadata."""
         card_positions = []
         
-        for position_data in spread_data["positions"]:
+        for idx, position_data in enumerate(spread_data["positions"]):
             card_data = card_database[position_data["card_id"]]
             card_metadata = self.load_card_metadata(card_data)
             
@@ -291,46 +526,115 @@ class EnhancedInfluenceEngine:
                 position_id=position_data["position_id"],
                 card_id=position_data["card_id"],
                 orientation=Orientation(position_data["orientation"]),
-                card_metadata=card_metadata
+                card_metadata=card_metadata,
+                idx=idx
             )
             
             card_positions.append(card_position)
         
         return card_positions
     
-    def _get_adjacency_matrix(self, spread_type: str, card_positions: List[CardPosition]) -> Dict[str, Dict[str, float]]:
+    def _get_adjacency_matrix(self, spread_type: str, card_positions: List[CardPosition]) -> CompiledAdjacency:
         """Get adjacency matrix for the spread."""
-        if spread_type in self.adjacency_matrices:
-            return self.adjacency_matrices[spread_type]
+        if spread_type in self._compiled_adjacency:
+            return self._compiled_adjacency[spread_type]
         else:
             # Compute dynamic adjacency matrix
             return self._compute_dynamic_adjacency_matrix(card_positions)
     
-    def _compute_dynamic_adjacency_matrix(self, card_positions: List[CardPosition]) -> Dict[str, Dict[str, float]]:
+    def _compute_dynamic_adjacency_matrix(self, card_positions: List[CardPosition]) -> CompiledAdjacency:
         """Compute adjacency matrix for custom spreads."""
-        adjacency_matrix = {}
+        position_index = {}
+        for card_pos in card_positions:
+            position_index.setdefault(card_pos.position_id, len(position_index))
         
-        for card1 in card_positions:
-            adjacency_matrix[card1.position_id] = {}
-            
-            for card2 in card_positions:
-                if card1.position_id != card2.position_id:
-                    # Use distance-based weighting
-                    distance = 1.0  # Default distance
-                    weight = 1.0 / (1.0 + distance * self.config.adjacency_decay_factor)
-                    adjacency_matrix[card1.position_id][card2.position_id] = weight
+        # Every position is at the default distance from every other one
+        distance = 1.0
+        weight = 1.0 / (1.0 + distance * self.config.adjacency_decay_factor)
+        
+        size = len(position_index)
+        indptr = [0]
+        indices = []
+        for i in range(size):
+            indices.extend(j for j in range(size) if j != i)
+            indptr.append(len(indices))
         
-        return adjacency_matrix
+        return CompiledAdjacency(position_index, indptr, indices, [weight] * len(indices))
     
     def _apply_rule_pipeline(
         self, 
         card_positions: List[CardPosition], 
-        adjacency_matrix: Dict[str, Dict[str, float]],
+        adjacency_matrix: CompiledAdjacency,
         rule_overrides: List[Dict[str, Any]] = None
     ) -> List[InfluencedCard]:
         """Apply the complete rule pipeline."""
         influenced_cards = []
         
+        position_index = adjacency_matrix.position_index
+        if len(card_positions) == len(position_index) and all(
+            position_index.get(card_pos.position_id) == i for i, card_pos in enumerate(card_positions)
+        ):
+            # Cards fill the matrix positions in order (canonical spreads such as
+            # three_card), so the matrix rows already are the neighbor arrays
+            neighbor_ptr = adjacency_matrix.indptr
+            neighbor_idx = adjacency_matrix.indices
+            neighbor_weight = adjacency_matrix.weights
+        else:
+            # Card index owning each matrix slot; the first card wins a shared slot
+            slot_owner = [-1] * len(position_index)
+            card_slots = []
+            for card_pos in card_positions:
+                slot = position_index.get(card_pos.position_id)
+                card_slots.append(slot)
+                if slot is not None and slot_owner[slot] < 0:
+                    slot_owner[slot] = card_pos.idx
+            
+            # Neighbors of every card as card indices and weights, in matrix order
+            neighbor_ptr = [0]
+            neighbor_idx = []
+            neighbor_weight = []
+            for slot in card_slots:
+                if slot is not None:
+                    for k in range(adjacency_matrix.indptr[slot], adjacency_matrix.indptr[slot + 1]):
+                        owner = slot_owner[adjacency_matrix.indices[k]]
+                        if owner >= 0:
+                            neighbor_idx.append(owner)
+                            neighbor_weight.append(adjacency_matrix.weights[k])
+                neighbor_ptr.append(len(neighbor_idx))
+        
+        # Per-card fields as flat arrays for the rule kernel
+        base_polarity = [c.card_metadata.baseline_polarity for c in card_positions]
+        base_intensity = [c.card_metadata.baseline_intensity for c in card_positions]
+        reversed_mask = [1 if c.reversed else 0 for c in card_positions]
+        element_idx = [c.card_metadata.element_idx for c in card_positions]
+        
+        # Apply reversal modifier
+        polarity = [p * -0.8 if r else p for p, r in zip(base_polarity, reversed_mask)]
+        intensity = [t * 0.9 if r else t for t, r in zip(base_intensity, reversed_mask)]
+        
+        # Opposing polarities are a property of the whole spread
+        conflict_active = self._has_polarity_conflict(card_positions)
+        damp_factor = CONFLICT_DAMPING_FACTOR if conflict_active else 1.0
+        
+        # Shared themes and suit sequences are the same for every card in the spread
+        boost_map = self._build_narrative_boost_map(card_positions)
+        sequence_suits = self._find_sequence_suits(card_positions)
+        
+        # Sequence intensity comes before reversal propagation, as in the rule order.
+        # The bonus is added once per suit so the rounding matches the per-rule engine.
+        if sequence_suits:
+            suit_count = len(sequence_suits)
+            for i in range(len(intensity)):
+                for _ in range(suit_count):
+                    intensity[i] += 0.1
+        
+        # Adjacency, elemental, reversal and conflict arithmetic for all cards at once
+        polarity_scores, intensity_scores = apply_rules(
+            base_polarity, base_intensity, polarity, intensity, element_idx, reversed_mask,
+            neighbor_ptr, neighbor_idx, neighbor_weight, self._affinity_rows,
+            damp_factor, self.config.reversal_decay_factor
+        )
+        
         for card_pos in card_positions:
             # Initialize influenced card
             influenced_card = InfluencedCard(
@@ -340,29 +644,26 @@ class EnhancedInfluenceEngine:
                 orientation=card_pos.orientation.value,
                 base_text=self._get_base_text(card_pos),
                 influenced_text="",  # Will be filled later
-                polarity_score=card_pos.card_metadata.baseline_polarity,
-                intensity_score=card_pos.card_metadata.baseline_intensity,
-                themes=card_pos.card_metadata.themes.copy(),
+                polarity_score=polarity_scores[card_pos.idx],
+                intensity_score=intensity_scores[card_pos.idx],
+                themes=_LazyThemes(card_pos.card_metadata.themes),
                 influence_factors=[],
                 journal_prompt=""
             )
             
-            # Apply reversal modifier
-            if card_pos.orientation == Orientation.REVERSED:
-                influenced_card.polarity_score *= -0.8
-                influenced_card.intensity_score *= 0.9
-            
             # Get neighbors
-            neighbors = self._get_neighbors(card_pos, card_positions, adjacency_matrix)
+            weighted_neighbors = self._get_neighbors(card_pos, card_positions, neighbor_ptr, neighbor_idx, neighbor_weight)
             
-            # Apply rules in order
-            self._apply_major_dominance(influenced_card, neighbors)
-            self._apply_adjacency_influence(influenced_card, neighbors, adjacency_matrix)
-            self._apply_elemental_dignities(influenced_card, neighbors)
-            self._apply_numerical_sequences(influenced_card, card_positions)
-            self._apply_reversal_propagation(influenced_card, neighbors)
-            self._apply_conflict_resolution(influenced_card, card_positions)
-            self._apply_narrative_boost(influenced_card, card_positions)
+            # Record factors in rule order; the scores of the neighbor, sequence
+            # and conflict rules were already applied above
+            reversal_factors = []
+            if weighted_neighbors:
+                reversal_factors = self._record_neighbor_factors(influenced_card, weighted_neighbors, card_pos.card_metadata)
+            self._record_sequence_factors(influenced_card, sequence_suits)
+            influenced_card.influence_factors.extend(reversal_factors)
+            if conflict_active:
+                self._record_conflict_factor(influenced_card)
+            self._apply_narrative_boost(influenced_card, card_positions, boost_map)
             self._apply_local_overrides(influenced_card, rule_overrides)
             
             # Normalize scores
@@ -378,214 +679,196 @@ class EnhancedInfluenceEngine:
     
     def _get_base_text(self, card_pos: CardPosition) -> str:
         """Get base text for the card orientation."""
-        if card_pos.orientation == Orientation.UPRIGHT:
-            return card_pos.card_metadata.base_upright_text
-        else:
+        if card_pos.reversed:
             return card_pos.card_metadata.base_reversed_text
+        else:
+            return card_pos.card_metadata.base_upright_text
     
-    def _get_neighbors(self, card_pos: CardPosition, all_cards: List[CardPosition], adjacency_matrix: Dict[str, Dict[str, float]]) -> List[CardPosition]:
-        """Get neighboring cards based on adjacency matrix."""
-        neighbors = []
-        
-        if card_pos.position_id in adjacency_matrix:
-            for neighbor_pos_id, weight in adjacency_matrix[card_pos.position_id].items():
-                if weight > 0:
-                    neighbor = next((c for c in all_cards if c.position_id == neighbor_pos_id), None)
-                    if neighbor:
-                        neighbors.append(neighbor)
-        
-        return neighbors
-    
-    def _apply_major_dominance(self, influenced_card: InfluencedCard, neighbors: List[CardPosition]):
-        """Apply Major Arcana dominance rule."""
-        if influenced_card.card_id.startswith("the_") or influenced_card.card_id in ["strength", "justice", "temperance", "judgement"]:
-            # This is a Major Arcana card
-            for neighbor in neighbors:
-                if not (neighbor.card_metadata.card_id.startswith("the_") or neighbor.card_metadata.card_id in ["strength", "justice", "temperance", "judgement"]):
-                    # Neighbor is Minor Arcana
-                    enhanced_influence = neighbor.card_metadata.baseline_polarity * self.config.dominance_multiplier
-                    
-                    influenced_card.influence_factors.append(InfluenceFactor(
-                        source_position=neighbor.position_id,
-                        source_card_id=neighbor.card_id,
-                        effect=f"{enhanced_influence:+.2f}",
-                        explain=f"Major Arcana dominance ({self.config.dominance_multiplier}x)",
-                        confidence="high"
-                    ))
+    def _get_neighbors(
+        self,
+        card_pos: CardPosition,
+        all_cards: List[CardPosition],
+        neighbor_ptr: List[int],
+        neighbor_idx: List[int],
+        neighbor_weight: List[float]
+    ) -> List[Tuple[CardPosition, float]]:
+        """Get neighboring cards and their weights based on adjacency matrix."""
+        return [
+            (all_cards[neighbor_idx[k]], neighbor_weight[k])
+            for k in range(neighbor_ptr[card_pos.idx], neighbor_ptr[card_pos.idx + 1])
+        ]
     
-    def _apply_adjacency_influence(self, influenced_card: InfluencedCard, neighbors: List[CardPosition], adjacency_matrix: Dict[str, Dict[str, float]]):
-        """Apply adjacency influence rule."""
-        for neighbor in neighbors:
-            weight = adjacency_matrix.get(influenced_card.position, {}).get(neighbor.position_id, 0.0)
-            if weight > 0:
-                influence = neighbor.card_metadata.baseline_polarity * weight
-                influenced_card.polarity_score += influence
-                
-                influenced_card.influence_factors.append(InfluenceFactor(
+    def _record_neighbor_factors(
+        self,
+        influenced_card: InfluencedCard,
+        weighted_neighbors: List[Tuple[CardPosition, float]],
+        card_metadata: CardMetadata
+    ) -> List[InfluenceFactor]:
+        """
+        Record the neighbor rules' factors in a single pass over the neighbors.
+        
+        Major dominance, adjacency and elemental factors are appended to the card
+        in that order. Reversal factors come after the numerical sequence rule, so
+        they are returned for the caller to append.
+        """
+        dominance_factors = []
+        adjacency_factors = []
+        elemental_factors = []
+        reversal_factors = []
+        
+        dominance_multiplier = self.config.dominance_multiplier
+        decay_factor = self.config.reversal_decay_factor
+        card_element_idx = card_metadata.element_idx
+        affinities = self._affinity_rows[card_element_idx] if card_element_idx >= 0 else None
+        
+        for neighbor, weight in weighted_neighbors:
+            neighbor_metadata = neighbor.card_metadata
+            
+            # Major Arcana dominance over Minor Arcana neighbors
+            if card_metadata.is_major and not neighbor_metadata.is_major:
+                enhanced_influence = neighbor_metadata.baseline_polarity * dominance_multiplier
+                dominance_factors.append(InfluenceFactor(
                     source_position=neighbor.position_id,
                     source_card_id=neighbor.card_id,
-                    effect=f"{influence:+.2f}",
-                    explain=f"Adjacency influence (weight: {weight:.2f})",
+                    effect=_format_effect("{:+.2f}", enhanced_influence),
+                    value=enhanced_influence,
+                    explain=f"Major Arcana dominance ({dominance_multiplier}x)",
                     confidence="high"
                 ))
-    
-    def _apply_elemental_dignities(self, influenced_card: InfluencedCard, neighbors: List[CardPosition]):
-        """Apply elemental dignities rule."""
-        if influenced_card.card_id in ["the_sun", "the_magician", "the_emperor", "strength", "the_tower", "judgement"]:
-            card_element = "fire"
-        elif influenced_card.card_id in ["the_high_priestess", "the_chariot", "death", "the_moon"]:
-            card_element = "water"
-        elif influenced_card.card_id in ["the_fool", "the_hierophant", "the_lovers", "justice", "the_star"]:
-            card_element = "air"
-        elif influenced_card.card_id in ["the_empress", "the_hermit", "temperance", "the_world"]:
-            card_element = "earth"
-        else:
-            # Minor Arcana elemental assignment
-            if influenced_card.card_id.endswith("_wands"):
-                card_element = "fire"
-            elif influenced_card.card_id.endswith("_cups"):
-                card_element = "water"
-            elif influenced_card.card_id.endswith("_swords"):
-                card_element = "air"
-            elif influenced_card.card_id.endswith("_pentacles"):
-                card_element = "earth"
-            else:
-                return  # No element assigned
-        
-        for neighbor in neighbors:
-            # Determine neighbor element
-            if neighbor.card_id in ["the_sun", "the_magician", "the_emperor", "strength", "the_tower", "judgement"]:
-                neighbor_element = "fire"
-            elif neighbor.card_id in ["the_high_priestess", "the_chariot", "death", "the_moon"]:
-                neighbor_element = "water"
-            elif neighbor.card_id in ["the_fool", "the_hierophant", "the_lovers", "justice", "the_star"]:
-                neighbor_element = "air"
-            elif neighbor.card_id in ["the_empress", "the_hermit", "temperance", "the_world"]:
-                neighbor_element = "earth"
-            else:
-                if neighbor.card_id.endswith("_wands"):
-                    neighbor_element = "fire"
-                elif neighbor.card_id.endswith("_cups"):
-                    neighbor_element = "water"
-                elif neighbor.card_id.endswith("_swords"):
-                    neighbor_element = "air"
-                elif neighbor.card_id.endswith("_pentacles"):
-                    neighbor_element = "earth"
-                else:
-                    continue
             
-            # Apply elemental affinity
-            if card_element in self.elemental_affinity_matrix and neighbor_element in self.elemental_affinity_matrix[card_element]:
-                affinity = self.elemental_affinity_matrix[card_element][neighbor_element]
-                
+            # Adjacency influence
+            influence = neighbor_metadata.baseline_polarity * weight
+            adjacency_factors.append(InfluenceFactor(
+                source_position=neighbor.position_id,
+                source_card_id=neighbor.card_id,
+                effect=_format_effect("{:+.2f}", influence),
+                value=influence,
+                explain=f"Adjacency influence (weight: {weight:.2f})",
+                confidence="high"
+            ))
+            
+            # Elemental dignities
+            if affinities is not None and neighbor_metadata.element_idx >= 0:
+                affinity = affinities[neighbor_metadata.element_idx]
                 if affinity != 1.0:
-                    influenced_card.polarity_score *= affinity
-                    
-                    influenced_card.influence_factors.append(InfluenceFactor(
+                    elemental_factors.append(InfluenceFactor(
                         source_position=neighbor.position_id,
                         source_card_id=neighbor.card_id,
-                        effect=f"{affinity:.2f}x",
-                        explain=f"Elemental affinity: {card_element} + {neighbor_element}",
+                        effect=_format_effect("{:.2f}x", affinity),
+                        value=affinity,
+                        explain=f"Elemental affinity: {card_metadata.dignity_element} + {neighbor_metadata.dignity_element}",
                         confidence="high"
                     ))
-    
-    def _apply_numerical_sequences(self, influenced_card: InfluencedCard, all_cards: List[CardPosition]):
-        """Apply numerical sequence detection rule."""
-        # Group cards by suit
-        suit_groups = {}
-        for card in all_cards:
-            if card.card_metadata.suit:
-                if card.card_metadata.suit not in suit_groups:
-                    suit_groups[card.card_metadata.suit] = []
-                suit_groups[card.card_metadata.suit].append(card)
-        
-        # Check for sequences in the same suit
-        for suit, suit_cards in suit_groups.items():
-            if len(suit_cards) >= 2:
-                numbers = [card.card_metadata.number for card in suit_cards if card.card_metadata.number is not None]
-                numbers.sort()
-                
-                # Check for ascending sequence
-                for i in range(len(numbers) - 1):
-                    if numbers[i+1] == numbers[i] + 1:
-                        # Found a sequence
-                        influenced_card.themes["continuity"] = influenced_card.themes.get("continuity", 0.0) + 0.3
-                        influenced_card.intensity_score += 0.1
-                        
-                        influenced_card.influence_factors.append(InfluenceFactor(
-                            source_position="numerical_sequence",
-                            source_card_id="system",
-                            effect="+0.10",
-                            explain=f"Numerical sequence detected in {suit} suit",
-                            confidence="medium"
-                        ))
-                        break
-    
-    def _apply_reversal_propagation(self, influenced_card: InfluencedCard, neighbors: List[CardPosition]):
-        """Apply reversal propagation rule."""
-        reversed_neighbors = [n for n in neighbors if n.orientation == Orientation.REVERSED]
-        
-        if reversed_neighbors:
-            decay_factor = self.config.reversal_decay_factor
             
-            for neighbor in reversed_neighbors:
-                stability_reduction = neighbor.card_metadata.baseline_intensity * (1.0 - decay_factor)
-                influenced_card.intensity_score -= stability_reduction
-                
-                influenced_card.influence_factors.append(InfluenceFactor(
+            # Reversal propagation
+            if neighbor.reversed:
+                stability_reduction = neighbor_metadata.baseline_intensity * (1.0 - decay_factor)
+                reversal_factors.append(InfluenceFactor(
                     source_position=neighbor.position_id,
                     source_card_id=neighbor.card_id,
-                    effect=f"-{stability_reduction:.2f}",
+                    effect=_format_effect("-{:.2f}", stability_reduction),
+                    value=-stability_reduction,
                     explain=f"Reversal propagation (decay: {decay_factor})",
                     confidence="high"
                 ))
+        
+        influenced_card.influence_factors.extend(dominance_factors)
+        influenced_card.influence_factors.extend(adjacency_factors)
+        influenced_card.influence_factors.extend(elemental_factors)
+        return reversal_factors
     
-    def _apply_conflict_resolution(self, influenced_card: InfluencedCard, all_cards: List[CardPosition]):
-        """Apply conflict resolution rule."""
-        if self.config.conflict_resolution == "damping":
-            # Check for opposing polarities
-            positive_cards = [c for c in all_cards if c.card_metadata.baseline_polarity > self.config.conflict_threshold]
-            negative_cards = [c for c in all_cards if c.card_metadata.baseline_polarity < -self.config.conflict_threshold]
+    def _find_sequence_suits(self, all_cards: List[CardPosition]) -> List[str]:
+        """Return the suits holding consecutive numbers, in order of first appearance."""
+        # Group card numbers by suit
+        suit_numbers: Dict[str, set] = {}
+        for card in all_cards:
+            if card.card_metadata.suit:
+                numbers = suit_numbers.setdefault(card.card_metadata.suit, set())
+                if card.card_metadata.number is not None:
+                    numbers.add(card.card_metadata.number)
+        
+        # A suit has a sequence when some number's successor is also present
+        return [
+            suit for suit, numbers in suit_numbers.items()
+            if any(number + 1 in numbers for number in numbers)
+        ]
+    
+    def _record_sequence_factors(self, influenced_card: InfluencedCard, sequence_suits: List[str]):
+        """Record the continuity theme and a factor for each suit holding a numerical sequence."""
+        for suit in sequence_suits:
+            influenced_card.themes["continuity"] = influenced_card.themes.get("continuity", 0.0) + 0.3
             
-            if positive_cards and negative_cards:
-                # Apply damping factor
-                damping_factor = 0.7
-                influenced_card.polarity_score *= damping_factor
+            influenced_card.influence_factors.append(InfluenceFactor(
+                source_position="numerical_sequence",
+                source_card_id="system",
+                effect="+0.10",
+                value=0.1,
+                explain=f"Numerical sequence detected in {suit} suit",
+                confidence="medium"
+            ))
+    
+    def _has_polarity_conflict(self, all_cards: List[CardPosition]) -> bool:
+        """Return True if damping applies because the spread holds opposing polarities."""
+        if self.config.conflict_resolution != "damping":
+            return False
+        
+        # Check for opposing polarities
+        threshold = self.config.conflict_threshold
+        has_positive = any(c.card_metadata.baseline_polarity > threshold for c in all_cards)
+        has_negative = any(c.card_metadata.baseline_polarity < -threshold for c in all_cards)
+        return has_positive and has_negative
+    
+    def _record_conflict_factor(self, influenced_card: InfluencedCard):
+        """Record the conflict resolution damping factor."""
+        influenced_card.influence_factors.append(InfluenceFactor(
+            source_position="conflict_resolution",
+            source_card_id="system",
+            effect=_format_effect("{:.2f}x", CONFLICT_DAMPING_FACTOR),
+            value=CONFLICT_DAMPING_FACTOR,
+            explain="Conflict resolution damping",
+            confidence="medium"
+        ))
+    
+    def _build_narrative_boost_map(self, all_cards: List[CardPosition]) -> Dict[str, float]:
+        """Map each theme shared by several cards to its narrative boost factor."""
+        # Find shared themes across cards
+        theme_counts = Counter()
+        for card in all_cards:
+            theme_counts.update(
+                theme for theme, weight in card.card_metadata.themes.items()
+                if weight >= self.config.theme_threshold
+            )
+        
+        # Boost themes that appear in at least 2 cards, 20% per additional card
+        return {
+            theme: 1.0 + (count - 1) * 0.2
+            for theme, count in theme_counts.items()
+            if count >= 2
+        }
+    
+    def _apply_narrative_boost(
+        self,
+        influenced_card: InfluencedCard,
+        all_cards: List[CardPosition],
+        boost_map: Optional[Dict[str, float]] = None
+    ):
+        """Apply narrative boost rule."""
+        if boost_map is None:
+            boost_map = self._build_narrative_boost_map(all_cards)
+        
+        for theme, boost_factor in boost_map.items():
+            if theme in influenced_card.themes:
+                influenced_card.themes[theme] *= boost_factor
                 
                 influenced_card.influence_factors.append(InfluenceFactor(
-                    source_position="conflict_resolution",
+                    source_position="narrative_boost",
                     source_card_id="system",
-                    effect=f"{damping_factor:.2f}x",
-                    explain="Conflict resolution damping",
+                    effect=_format_effect("{:.2f}x", boost_factor),
+                    value=boost_factor,
+                    explain=f"Narrative boost: {theme} theme",
                     confidence="medium"
                 ))
     
-    def _apply_narrative_boost(self, influenced_card: InfluencedCard, all_cards: List[CardPosition]):
-        """Apply narrative boost rule."""
-        # Find shared themes across cards
-        theme_counts = {}
-        
-        for card in all_cards:
-            for theme, weight in card.card_metadata.themes.items():
-                if weight >= self.config.theme_threshold:
-                    theme_counts[theme] = theme_counts.get(theme, 0) + 1
-        
-        # Boost themes that appear in multiple cards
-        for theme, count in theme_counts.items():
-            if count >= 2:  # Theme appears in at least 2 cards
-                boost_factor = 1.0 + (count - 1) * 0.2  # 20% boost per additional card
-                
-                if theme in influenced_card.themes:
-                    influenced_card.themes[theme] *= boost_factor
-                    
-                    influenced_card.influence_factors.append(InfluenceFactor(
-                        source_position="narrative_boost",
-                        source_card_id="system",
-                        effect=f"{boost_factor:.2f}x",
-                        explain=f"Narrative boost: {theme} theme",
-                        confidence="medium"
-                    ))
-    
     def _apply_local_overrides(self, influenced_card: InfluencedCard, rule_overrides: List[Dict[str, Any]]):
         """Apply local rule overrides."""
         if not rule_overrides:
@@ -600,7 +883,8 @@ class EnhancedInfluenceEngine:
                     influenced_card.influence_factors.append(InfluenceFactor(
                         source_position="local_override",
                         source_card_id="system",
-                        effect=f"{multiplier:.2f}x",
+                        effect=_format_effect("{:.2f}x", multiplier),
+                        value=multiplier,
                         explain="Local polarity override",
                         confidence="high"
                     ))
@@ -614,7 +898,8 @@ class EnhancedInfluenceEngine:
                     influenced_card.influence_factors.append(InfluenceFactor(
                         source_position="local_override",
                         source_card_id="system",
-                        effect=f"{boost_factor:.2f}x",
+                        effect=_format_effect("{:.2f}x", boost_factor),
+                        value=boost_factor,
                         explain=f"Local theme boost: {theme}",
                         confidence="high"
                     ))
@@ -645,21 +930,26 @@ class EnhancedInfluenceEngine:
         if not card.influence_factors:
             return base_text
         
-        # Generate influence summary
-        positive_factors = [f for f in card.influence_factors if float(f.effect.replace("x", "")) > 0]
-        negative_factors = [f for f in card.influence_factors if float(f.effect.replace("x", "")) < 0]
+        # Generate influence summary from the source cards of each sign
+        positive_sources = []
+        negative_sources = []
+        for factor in card.influence_factors:
+            # Classify by the value shown in the effect text, so "-0.00" counts as neither
+            shown_value = round(factor.value, 2)
+            if shown_value > 0:
+                positive_sources.append(factor.source_card_id)
+            elif shown_value < 0:
+                negative_sources.append(factor.source_card_id)
         
-        influence_summary = ""
+        parts = [base_text]
         
-        if positive_factors:
-            sources = [f.source_card_id for f in positive_factors]
-            influence_summary += f" This meaning is enhanced by {', '.join(sources)}. "
+        if positive_sources:
+            parts.append(f" This meaning is enhanced by {', '.join(positive_sources)}. ")
         
-        if negative_factors:
-            sources = [f.source_card_id for f in negative_factors]
-            influence_summary += f" This meaning is tempered by {', '.join(sources)}. "
+        if negative_sources:
+            parts.append(f" This meaning is tempered by {', '.join(negative_sources)}. ")
         
-        return base_text + influence_summary
+        return "".join(parts)
     
     def _generate_llm_interpretation(self, card: InfluencedCard) -> str:
         """Generate interpretation using LLM (placeholder for now)."""
@@ -667,10 +957,27 @@ class EnhancedInfluenceEngine:
         # For now, fall back to template generation
         return self._generate_template_interpretation(card)
     
-    def _generate_summary(self, influenced_cards: List[InfluencedCard]) -> str:
+    def _aggregate_readings(self, influenced_cards: List[InfluencedCard]) -> Tuple[float, Counter]:
+        """Return the total polarity and per-theme weight totals of the cards."""
+        total_polarity = sum(card.polarity_score for card in influenced_cards)
+        
+        all_themes = Counter()
+        for card in influenced_cards:
+            all_themes.update(card.themes)
+        
+        return total_polarity, all_themes
+    
+    def _generate_summary(
+        self,
+        influenced_cards: List[InfluencedCard],
+        aggregates: Optional[Tuple[float, Counter]] = None
+    ) -> str:
         """Generate overall reading summary."""
+        if aggregates is None:
+            aggregates = self._aggregate_readings(influenced_cards)
+        total_polarity, all_themes = aggregates
+        
         # Simple summary based on dominant themes and polarities
-        total_polarity = sum(card.polarity_score for card in influenced_cards)
         avg_polarity = total_polarity / len(influenced_cards)
         
         if avg_polarity > 0.5:
@@ -681,12 +988,7 @@ class EnhancedInfluenceEngine:
             sentiment = "balanced and nuanced"
         
         # Find dominant themes
-        all_themes = {}
-        for card in influenced_cards:
-            for theme, weight in card.themes.items():
-                all_themes[theme] = all_themes.get(theme, 0) + weight
-        
-        dominant_themes = sorted(all_themes.items(), key=lambda x: x[1], reverse=True)[:3]
+        dominant_themes = all_themes.most_common(3)
         theme_names = [theme for theme, _ in dominant_themes]
         
         if theme_names:
@@ -694,13 +996,19 @@ class EnhancedInfluenceEngine:
         else:
             return f"A reading that is {sentiment}."
     
-    def _generate_advice(self, influenced_cards: List[InfluencedCard]) -> List[str]:
+    def _generate_advice(
+        self,
+        influenced_cards: List[InfluencedCard],
+        aggregates: Optional[Tuple[float, Counter]] = None
+    ) -> List[str]:
         """Generate practical advice based on the reading."""
+        if aggregates is None:
+            aggregates = self._aggregate_readings(influenced_cards)
+        total_polarity, all_themes = aggregates
+        
         advice = []
         
         # Analyze overall polarity
-        total_polarity = sum(card.polarity_score for card in influenced_cards)
-        
         if total_polarity > 0:
             advice.append("Embrace the positive energy around you")
             advice.append("Take action on your goals")
@@ -712,24 +1020,22 @@ class EnhancedInfluenceEngine:
             advice.append("Trust your intuition")
         
         # Add theme-specific advice
-        all_themes = {}
-        for card in influenced_cards:
-            for theme, weight in card.themes.items():
-                all_themes[theme] = all_themes.get(theme, 0) + weight
-        
-        if "love" in all_themes and all_themes["love"] > 0.5:
-            advice.append("Nurture your relationships")
-        
-        if "career" in all_themes and all_themes["career"] > 0.5:
-            advice.append("Focus on your professional development")
-        
-        if "creativity" in all_themes and all_themes["creativity"] > 0.5:
-            advice.append("Express your creative side")
+        for theme, threshold, theme_advice, _ in _THEME_GUIDANCE:
+            if all_themes.get(theme, 0.0) > threshold:
+                advice.append(theme_advice)
         
         return advice[:5]  # Limit to 5 pieces of advice
     
-    def _generate_follow_up_questions(self, influenced_cards: List[InfluencedCard]) -> List[str]:
+    def _generate_follow_up_questions(
+        self,
+        influenced_cards: List[InfluencedCard],
+        aggregates: Optional[Tuple[float, Counter]] = None
+    ) -> List[str]:
         """Generate follow-up questions for reflection."""
+        if aggregates is None:
+            aggregates = self._aggregate_readings(influenced_cards)
+        _, all_themes = aggregates
+        
         questions = []
         
         # General reflection questions
@@ -737,19 +1043,9 @@ class EnhancedInfluenceEngine:
         questions.append("How can you apply these insights to your life?")
         
         # Theme-specific questions
-        all_themes = {}
-        for card in influenced_cards:
-            for theme, weight in card.themes.items():
-                all_themes[theme] = all_themes.get(theme, 0) + weight
-        
-        if "love" in all_themes and all_themes["love"] > 0.5:
-            questions.append("What relationships are most important to you?")
-        
-        if "career" in all_themes and all_themes["career"] > 0.5:
-            questions.append("What professional goals are you working toward?")
-        
-        if "creativity" in all_themes and all_themes["creativity"] > 0.5:
-            questions.append("How can you express your creativity more fully?")
+        for theme, threshold, _, question in _THEME_GUIDANCE:
+            if all_themes.get(theme, 0.0) > threshold:
+                questions.append(question)
         
         return questions[:5]  # Limit to 5 questions
     
@@ -768,17 +1064,16 @@ class EnhancedInfluenceEngine:
     def _validate_output(self, result: Dict[str, Any]):
         """Validate output against schema."""
         # Check required fields
-        required_fields = ["reading_id", "summary", "cards"]
-        for field in required_fields:
+        for field in _REQUIRED_OUTPUT_FIELDS:
             if field not in result:
                 raise ValueError(f"Missing required output field: {field}")
         
         # Validate card structure
         for card in result["cards"]:
-            required_card_fields = ["position", "card_id", "card_name", "orientation", "base_text", "influenced_text", "polarity_score", "intensity_score", "themes", "influence_factors", "journal_prompt"]
-            for field in required_card_fields:
-                if field not in card:
-                    raise ValueError(f"Missing required card field: {field}")
+            # One set comparison per card; only look for the culprit on failure
+            if not card.keys() >= _REQUIRED_CARD_FIELD_SET:
+                field = next(field for field in _REQUIRED_CARD_FIELDS if field not in card)
+                raise ValueError(f"Missing required card field: {field}")
             
             # Validate numeric ranges
             if not (-2.0 <= card["polarity_score"] <= 2.0):
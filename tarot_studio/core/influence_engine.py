@@ -5,12 +5,44 @@ This module implements the rule-based system that computes how neighboring cards
 modify meanings in tarot spreads.
 """
 
-from typing import List, Dict, Any, Tuple, Optional
+from typing import List, Dict, Any, Tuple, Optional, Mapping
 from dataclasses import dataclass
+from types import MappingProxyType
 import json
 import math
 
-@dataclass
+from ._rules_numba import polarity_score, polarity_scores
+
+# Shared read-only stand-in for missing influence rule tables
+_EMPTY_RULES: Mapping[str, Any] = MappingProxyType({})
+
+# Specific influence modifier of each Major Arcana card
+_MAJOR_ARCANA_MODIFIERS = {
+    'the_sun': 1.2,      # The Sun brightens everything
+    'the_moon': 0.8,      # The Moon adds mystery
+    'the_tower': 0.6,     # The Tower destabilizes
+    'the_devil': 0.7,     # The Devil adds shadow
+    'the_star': 1.1,      # The Star brings hope
+    'the_empress': 1.1,   # The Empress nurtures
+    'the_emperor': 1.0,   # The Emperor provides structure
+    'the_magician': 1.1,  # The Magician amplifies
+    'the_high_priestess': 0.9,  # The High Priestess adds depth
+    'the_hierophant': 0.9,      # The Hierophant adds tradition
+    'the_lovers': 1.1,           # The Lovers harmonizes
+    'the_chariot': 1.0,          # The Chariot drives forward
+    'strength': 1.1,              # Strength empowers
+    'the_hermit': 0.9,            # The Hermit adds introspection
+    'wheel_of_fortune': 1.0,     # Wheel brings change
+    'justice': 1.0,               # Justice balances
+    'the_hanged_man': 0.8,       # Hanged Man slows down
+    'death': 0.9,                 # Death transforms
+    'temperance': 1.0,            # Temperance moderates
+    'judgement': 1.1,             # Judgement awakens
+    'the_world': 1.1,             # The World completes
+    'the_fool': 1.0               # The Fool brings newness
+}
+
+@dataclass(slots=True)
 class CardPosition:
     """Represents a card in a specific position within a spread."""
     card_id: str
@@ -18,7 +50,7 @@ class CardPosition:
     orientation: str  # 'upright' or 'reversed'
     card_data: Dict[str, Any]
 
-@dataclass
+@dataclass(slots=True)
 class InfluenceFactor:
     """Represents how one card influences another."""
     source_card: str
@@ -26,7 +58,7 @@ class InfluenceFactor:
     explanation: str
     influence_type: str  # 'adjacency', 'major_arcana', 'suit_interaction', etc.
 
-@dataclass
+@dataclass(slots=True)
 class InfluencedCard:
     """A card with computed influence modifications."""
     card_id: str
@@ -38,6 +70,19 @@ class InfluencedCard:
     influence_factors: List[InfluenceFactor]
     journal_prompt: str
 
+@dataclass(slots=True)
+class _CardView:
+    """The card data fields read by the influence rules, resolved once per spread."""
+    card_id: str
+    position: str
+    arcana: Optional[str]
+    suit: Optional[str]
+    number: Optional[int]
+    polarity: float
+    adjacency_bonus: float
+    major_arcana_multiplier: float
+    suit_interaction: Mapping[str, float]
+
 class InfluenceEngine:
     """Core engine for computing card influences in tarot spreads."""
     
@@ -63,23 +108,33 @@ class InfluenceEngine:
         """
         influenced_cards = []
         
-        for card_pos in spread_positions:
+        # Resolve card data and adjacency information for every card once
+        card_views = [self._make_card_view(card_pos) for card_pos in spread_positions]
+        adjacency_index = self._build_adjacency_index(card_views, spread_layout)
+        
+        # Compute influence factors
+        factor_lists = [
+            self._compute_influence_factors(
+                card_pos, spread_positions, spread_layout, adjacency_index[card_pos.position], card_view
+            )
+            for card_pos, card_view in zip(spread_positions, card_views)
+        ]
+        
+        # Calculate final polarity scores for the whole spread at once
+        card_polarities = polarity_scores(
+            [self._get_base_polarity(card_pos) for card_pos in spread_positions],
+            [[factor.effect for factor in influence_factors] for influence_factors in factor_lists],
+            self.min_polarity_range,
+            self.max_polarity_range
+        )
+        
+        for card_pos, influence_factors, polarity_score in zip(spread_positions, factor_lists, card_polarities):
             # Get base meaning
             base_meaning = self._get_base_meaning(card_pos)
             
-            # Compute influence factors
-            influence_factors = self._compute_influence_factors(
-                card_pos, spread_positions, spread_layout
-            )
-            
-            # Calculate final polarity score
-            polarity_score = self._calculate_polarity_score(
-                card_pos, influence_factors
-            )
-            
             # Generate influenced meaning (placeholder for now)
             influenced_meaning = self._generate_influenced_meaning(
-                card_pos, influence_factors, polarity_score
+                card_pos, influence_factors, polarity_score, base_meaning
             )
             
             # Generate journal prompt
@@ -109,91 +164,113 @@ class InfluenceEngine:
         else:
             return card_pos.card_data['reversed_meaning']
     
+    def _make_card_view(self, card_pos: CardPosition) -> _CardView:
+        """Resolve the card data fields read by the influence rules."""
+        card_data = card_pos.card_data
+        influence_rules = card_data.get('influence_rules', _EMPTY_RULES)
+        
+        return _CardView(
+            card_id=card_pos.card_id,
+            position=card_pos.position,
+            arcana=card_data.get('arcana'),
+            suit=card_data.get('suit'),
+            number=card_data.get('number'),
+            polarity=card_data['polarity'],
+            adjacency_bonus=influence_rules.get('adjacency_bonus', 0.0),
+            major_arcana_multiplier=influence_rules.get('major_arcana_multiplier', self.major_arcana_multiplier),
+            suit_interaction=influence_rules.get('suit_interaction', _EMPTY_RULES)
+        )
+    
     def _compute_influence_factors(
         self, 
         target_card: CardPosition,
         all_cards: List[CardPosition],
-        spread_layout: Dict[str, Any]
+        spread_layout: Dict[str, Any],
+        neighbors: Optional[List[Tuple[_CardView, float]]] = None,
+        target_view: Optional[_CardView] = None
     ) -> List[InfluenceFactor]:
         """Compute all influence factors affecting a target card."""
         influence_factors = []
         
+        if target_view is None:
+            target_view = self._make_card_view(target_card)
+        
         # Get adjacency information
-        adjacency_map = self._get_adjacency_map(target_card, spread_layout)
+        if neighbors is None:
+            card_views = [self._make_card_view(card_pos) for card_pos in all_cards]
+            neighbors = self._build_adjacency_index(card_views, spread_layout)[target_card.position]
+        
+        target_is_minor = target_view.arcana == 'minor'
         
-        for other_card in all_cards:
-            if other_card.card_id == target_card.card_id:
+        for other_view, adjacency_weight in neighbors:
+            if other_view.card_id == target_view.card_id:
                 continue
-                
-            # Check if cards are adjacent
-            if other_card.position in adjacency_map:
-                adjacency_weight = adjacency_map[other_card.position]
-                
+            
+            if other_view.arcana == 'major':
                 # Major Arcana influence
-                if other_card.card_data['arcana'] == 'major':
-                    influence_factor = self._compute_major_arcana_influence(
-                        target_card, other_card, adjacency_weight
-                    )
-                    if influence_factor:
-                        influence_factors.append(influence_factor)
-                
+                influence_factor = self._compute_major_arcana_influence(
+                    target_view, other_view, adjacency_weight
+                )
+                if influence_factor:
+                    influence_factors.append(influence_factor)
+            
+            elif target_is_minor and other_view.arcana == 'minor':
                 # Suit interaction influence
-                if (target_card.card_data['arcana'] == 'minor' and 
-                    other_card.card_data['arcana'] == 'minor'):
-                    influence_factor = self._compute_suit_interaction_influence(
-                        target_card, other_card, adjacency_weight
-                    )
-                    if influence_factor:
-                        influence_factors.append(influence_factor)
+                influence_factor = self._compute_suit_interaction_influence(
+                    target_view, other_view, adjacency_weight
+                )
+                if influence_factor:
+                    influence_factors.append(influence_factor)
                 
                 # Numeric progression influence
-                if (target_card.card_data['arcana'] == 'minor' and 
-                    other_card.card_data['arcana'] == 'minor' and
-                    target_card.card_data['suit'] == other_card.card_data['suit']):
+                if target_view.suit == other_view.suit:
                     influence_factor = self._compute_numeric_progression_influence(
-                        target_card, other_card, adjacency_weight
+                        target_view, other_view, adjacency_weight
                     )
                     if influence_factor:
                         influence_factors.append(influence_factor)
-                
-                # General adjacency influence
-                influence_factor = self._compute_adjacency_influence(
-                    target_card, other_card, adjacency_weight
-                )
-                if influence_factor:
-                    influence_factors.append(influence_factor)
+            
+            # General adjacency influence
+            influence_factor = self._compute_adjacency_influence(
+                target_view, other_view, adjacency_weight
+            )
+            if influence_factor:
+                influence_factors.append(influence_factor)
         
         return influence_factors
     
-    def _get_adjacency_map(
-        self, 
-        target_card: CardPosition, 
+    def _build_adjacency_index(
+        self,
+        card_views: List[_CardView],
         spread_layout: Dict[str, Any]
-    ) -> Dict[str, float]:
-        """Get adjacency weights for neighboring positions."""
+    ) -> Dict[str, List[Tuple[_CardView, float]]]:
+        """Map each position in the spread to its adjacent cards and adjacency weights."""
         # This is a simplified adjacency model
         # In a real implementation, this would be based on the spread layout
-        adjacency_map = {}
+        layout_positions = {position_info['name'] for position_info in spread_layout.get('positions', [])}
+        placed_cards = [card_view for card_view in card_views if card_view.position in layout_positions]
         
         # For now, assume all other positions are adjacent with weight 1.0
         # This would be replaced with actual layout-specific adjacency rules
-        for position_info in spread_layout.get('positions', []):
-            if position_info['name'] != target_card.position:
-                adjacency_map[position_info['name']] = 1.0
-        
-        return adjacency_map
+        adjacency_index = {}
+        for card_view in card_views:
+            if card_view.position not in adjacency_index:
+                adjacency_index[card_view.position] = [
+                    (other_view, 1.0) for other_view in placed_cards
+                    if other_view.position != card_view.position
+                ]
+        
+        return adjacency_index
     
     def _compute_major_arcana_influence(
         self, 
-        target_card: CardPosition,
-        major_card: CardPosition,
+        target_card: _CardView,
+        major_card: _CardView,
         adjacency_weight: float
     ) -> Optional[InfluenceFactor]:
         """Compute influence from Major Arcana cards."""
-        base_effect = major_card.card_data['polarity'] * adjacency_weight
-        major_multiplier = major_card.card_data.get('influence_rules', {}).get('major_arcana_multiplier', self.major_arcana_multiplier)
-        
-        final_effect = base_effect * major_multiplier
+        base_effect = major_card.polarity * adjacency_weight
+        final_effect = base_effect * major_card.major_arcana_multiplier
         
         # Apply specific Major Arcana rules
         effect_modifier = self._get_major_arcana_modifier(major_card.card_id)
@@ -211,20 +288,18 @@ class InfluenceEngine:
     
     def _compute_suit_interaction_influence(
         self, 
-        target_card: CardPosition,
-        other_card: CardPosition,
+        target_card: _CardView,
+        other_card: _CardView,
         adjacency_weight: float
     ) -> Optional[InfluenceFactor]:
         """Compute influence from suit interactions."""
-        target_suit = target_card.card_data['suit']
-        other_suit = other_card.card_data['suit']
+        target_suit = target_card.suit
         
         # Get suit interaction modifier
-        suit_interactions = other_card.card_data.get('influence_rules', {}).get('suit_interaction', {})
-        suit_modifier = suit_interactions.get(target_suit, 0.0)
+        suit_modifier = other_card.suit_interaction.get(target_suit, 0.0)
         
         if abs(suit_modifier) > 0.05:  # Only include significant interactions
-            base_effect = other_card.card_data['polarity'] * adjacency_weight * suit_modifier
+            base_effect = other_card.polarity * adjacency_weight * suit_modifier
             
             return InfluenceFactor(
                 source_card=other_card.card_id,
@@ -237,13 +312,13 @@ class InfluenceEngine:
     
     def _compute_numeric_progression_influence(
         self, 
-        target_card: CardPosition,
-        other_card: CardPosition,
+        target_card: _CardView,
+        other_card: _CardView,
         adjacency_weight: float
     ) -> Optional[InfluenceFactor]:
         """Compute influence from numeric progressions within the same suit."""
-        target_number = target_card.card_data['number']
-        other_number = other_card.card_data['number']
+        target_number = target_card.number
+        other_number = other_card.number
         
         # Check for sequential progression
         if abs(target_number - other_number) == 1:
@@ -264,15 +339,15 @@ class InfluenceEngine:
     
     def _compute_adjacency_influence(
         self, 
-        target_card: CardPosition,
-        other_card: CardPosition,
+        target_card: _CardView,
+        other_card: _CardView,
         adjacency_weight: float
     ) -> Optional[InfluenceFactor]:
         """Compute general adjacency influence."""
-        adjacency_bonus = other_card.card_data.get('influence_rules', {}).get('adjacency_bonus', 0.0)
+        adjacency_bonus = other_card.adjacency_bonus
         
         if abs(adjacency_bonus) > 0.05:
-            base_effect = other_card.card_data['polarity'] * adjacency_weight * adjacency_bonus
+            base_effect = other_card.polarity * adjacency_weight * adjacency_bonus
             
             return InfluenceFactor(
                 source_card=other_card.card_id,
@@ -283,54 +358,62 @@ class InfluenceEngine:
         
         return None
     
-    def _calculate_polarity_score(
-        self, 
-        card_pos: CardPosition,
-        influence_factors: List[InfluenceFactor]
-    ) -> float:
-        """Calculate the final polarity score after applying influences."""
+    def _get_base_polarity(self, card_pos: CardPosition) -> float:
+        """Get the card's polarity before influences are applied."""
         base_polarity = card_pos.card_data['polarity']
         
         # Apply reversal modifier
         if card_pos.orientation == 'reversed':
             base_polarity *= -0.8  # Reversed cards have reduced polarity
         
-        # Sum all influence effects
-        total_influence = sum(factor.effect for factor in influence_factors)
-        
-        # Calculate final polarity
-        final_polarity = base_polarity + total_influence
-        
-        # Clamp to valid range
-        final_polarity = max(self.min_polarity_range, min(self.max_polarity_range, final_polarity))
-        
-        return final_polarity
+        return base_polarity
+    
+    def _calculate_polarity_score(
+        self, 
+        card_pos: CardPosition,
+        influence_factors: List[InfluenceFactor]
+    ) -> float:
+        """Calculate the final polarity score after applying influences."""
+        # Sum all influence effects and clamp to valid range
+        return polarity_score(
+            self._get_base_polarity(card_pos),
+            [factor.effect for factor in influence_factors],
+            self.min_polarity_range,
+            self.max_polarity_range
+        )
     
     def _generate_influenced_meaning(
         self, 
         card_pos: CardPosition,
         influence_factors: List[InfluenceFactor],
-        polarity_score: float
+        polarity_score: float,
+        base_meaning: Optional[str] = None
     ) -> str:
         """Generate influenced meaning text."""
-        base_meaning = self._get_base_meaning(card_pos)
+        if base_meaning is None:
+            base_meaning = self._get_base_meaning(card_pos)
         
         if not influence_factors:
             return base_meaning
         
-        # Create influence summary
-        positive_influences = [f for f in influence_factors if f.effect > 0]
-        negative_influences = [f for f in influence_factors if f.effect < 0]
+        # Create influence summary from the source cards of each sign
+        positive_sources = []
+        negative_sources = []
+        for factor in influence_factors:
+            if factor.effect > 0:
+                positive_sources.append(factor.source_card)
+            elif factor.effect < 0:
+                negative_sources.append(factor.source_card)
         
-        influence_text = ""
+        parts = [base_meaning]
         
-        if positive_influences:
-            influence_text += f" This meaning is enhanced by {', '.join([f.source_card for f in positive_influences])}. "
+        if positive_sources:
+            parts.append(f" This meaning is enhanced by {', '.join(positive_sources)}. ")
         
-        if negative_influences:
-            influence_text += f" This meaning is tempered by {', '.join([f.source_card for f in negative_influences])}. "
+        if negative_sources:
+            parts.append(f" This meaning is tempered by {', '.join(negative_sources)}. ")
         
-        return base_meaning + influence_text
+        return "".join(parts)
     
     def _generate_journal_prompt(
         self, 
@@ -350,32 +433,7 @@ class InfluenceEngine:
     
     def _get_major_arcana_modifier(self, card_id: str) -> float:
         """Get specific modifier for Major Arcana cards."""
-        modifiers = {
-            'the_sun': 1.2,      # The Sun brightens everything
-            'the_moon': 0.8,      # The Moon adds mystery
-            'the_tower': 0.6,     # The Tower destabilizes
-            'the_devil': 0.7,     # The Devil adds shadow
-            'the_star': 1.1,      # The Star brings hope
-            'the_empress': 1.1,   # The Empress nurtures
-            'the_emperor': 1.0,   # The Emperor provides structure
-            'the_magician': 1.1,  # The Magician amplifies
-            'the_high_priestess': 0.9,  # The High Priestess adds depth
-            'the_hierophant': 0.9,      # The Hierophant adds tradition
-            'the_lovers': 1.1,           # The Lovers harmonizes
-            'the_chariot': 1.0,          # The Chariot drives forward
-            'strength': 1.1,              # Strength empowers
-            'the_hermit': 0.9,            # The Hermit adds introspection
-            'wheel_of_fortune': 1.0,     # Wheel brings change
-            'justice': 1.0,               # Justice balances
-            'the_hanged_man': 0.8,       # Hanged Man slows down
-            'death': 0.9,                 # Death transforms
-            'temperance': 1.0,            # Temperance moderates
-            'judgement': 1.1,             # Judgement awakens
-            'the_world': 1.1,             # The World completes
-            'the_fool': 1.0               # The Fool brings newness
-        }
-        
-        return modifiers.get(card_id, 1.0)
+        return _MAJOR_ARCANA_MODIFIERS.get(card_id, 1.0)
 
 # Example usage and testing
 def create_test_spread() -> Tuple[List[CardPosition], Dict[str, Any]]:
@@ -99,8 +99,8 @@ def main():
         }
     ]
     
+    db.store_memories(memories)
     for memory_data in memories:
-        memory_id = db.store_memory(**memory_data)
         print(f"✅ Stored memory: {memory_data['entity_name']}")
     
     # Search memories
@@ -127,8 +127,8 @@ def main():
         ("assistant", "The cards suggest trusting your intuition and being open to new experiences. Focus on developing your skills and maintaining a positive mindset.")
     ]
     
+    db.add_messages(conversation_id, messages)
     for role, content in messages:
-        db.add_message(conversation_id, role, content)
         print(f"💬 Added {role} message")
     
     # Retrieve conversation
@@ -147,8 +147,8 @@ def main():
         ("notifications", False)
     ]
     
+    db.set_settings(dict(settings))
     for key, value in settings:
-        db.set_setting(key, value)
         print(f"⚙️  Set {key} = {value}")
     
     # Retrieve settings
@@ -194,10 +194,10 @@ def main():
     print("🔄 Database reopened")
     
     # Verify data persistence
-    assert len(db2.get_all_cards()) == len(cards)
-    assert len(db2.get_all_spreads()) == len(all_spreads)
-    assert len(db2.get_all_readings()) == 1
-    assert len(db2.get_all_conversations()) == 1
+    assert db2.count_cards() == len(cards)
+    assert db2.count_spreads() == len(all_spreads)
+    assert db2.count_readings() == 1
+    assert db2.count_conversations() == 1
     assert db2.get_setting("ai_model") == "llama2"
     
     print("✅ All data persisted correctly")
@@ -205,10 +205,10 @@ def main():
     # Summary
     print("\n" + "=" * 50)
     print("📊 Database Summary:")
-    print(f"   Cards: {len(db2.get_all_cards())}")
-    print(f"   Spreads: {len(db2.get_all_spreads())}")
-    print(f"   Readings: {len(db2.get_all_readings())}")
-    print(f"   Conversations: {len(db2.get_all_conversations())}")
+    print(f"   Cards: {db2.count_cards()}")
+    print(f"   Spreads: {db2.count_spreads()}")
+    print(f"   Readings: {db2.count_readings()}")
+    print(f"   Conversations: {db2.count_conversations()}")
     print(f"   Memories: {len(db2.memories)}")
     print(f"   Settings: {len(db2.settings)}")
     
@@ -6,9 +6,16 @@ Fallback implementation when SQLAlchemy is not available.
 import json
 import os
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
 import uuid
+from collections import defaultdict
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 class SimpleDB:
     """Simple JSON-based database for Tarot Studio."""
@@ -34,13 +41,35 @@ class SimpleDB:
         self.memories = self._load_data(self.memories_file, [])
         self.settings = self._load_data(self.settings_file, {})
         
+        # (source fields, lowercased fields) of each memory, by position in self.memories
+        self._memory_search_text: List[Tuple[Tuple[str, Optional[str], Optional[str]],
+                                             Tuple[str, Optional[str], Optional[str]]]] = []
+        
         # Initialize with default data if empty
         self._initialize_defaults()
+        
+        # Card lookup buckets; the card set is fixed once defaults are loaded
+        self._cards_by_arcana: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self._cards_by_suit: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        for card in self.cards:
+            self._cards_by_arcana[card.get('arcana')].append(card)
+            self._cards_by_suit[card.get('suit')].append(card)
+        
+        # ID lookups into the readings and conversations lists; the first record wins
+        self._readings_by_id: Dict[str, Dict[str, Any]] = {}
+        for reading in self.readings:
+            self._readings_by_id.setdefault(reading['id'], reading)
+        self._conversations_by_id: Dict[str, Dict[str, Any]] = {}
+        for conversation in self.conversations:
+            self._conversations_by_id.setdefault(conversation['id'], conversation)
     
     def _load_data(self, file_path: Path, default_value):
         """Load data from JSON file."""
         if file_path.exists():
             try:
+                if ORJSON_AVAILABLE:
+                    with open(file_path, 'rb') as f:
+                        return orjson.loads(f.read())
                 with open(file_path, 'r', encoding='utf-8') as f:
                     return json.load(f)
             except (json.JSONDecodeError, IOError):
@@ -50,6 +79,12 @@ class SimpleDB:
     def _save_data(self, file_path: Path, data):
         """Save data to JSON file."""
         try:
+            if ORJSON_AVAILABLE:
+                # Same layout as json.dump(indent=2, ensure_ascii=False)
+                encoded = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+                with open(file_path, 'wb') as f:
+                    f.write(encoded)
+                return
             with open(file_path, 'w', encoding='utf-8') as f:
                 json.dump(data, f, indent=2, ensure_ascii=False)
         except IOError as e:
@@ -218,13 +253,17 @@ class SimpleDB:
         """Get all cards."""
         return self.cards.copy()
     
+    def count_cards(self) -> int:
+        """Get the number of cards without copying them."""
+        return len(self.cards)
+    
     def get_cards_by_arcana(self, arcana: str) -> List[Dict[str, Any]]:
         """Get cards by arcana type."""
-        return [card for card in self.cards if card['arcana'] == arcana]
+        return list(self._cards_by_arcana.get(arcana, ()))
     
     def get_cards_by_suit(self, suit: str) -> List[Dict[str, Any]]:
         """Get cards by suit."""
-        return [card for card in self.cards if card.get('suit') == suit]
+        return list(self._cards_by_suit.get(suit, ()))
     
     # Spread operations
     def get_spread(self, spread_id: str) -> Optional[Dict[str, Any]]:
@@ -238,6 +277,10 @@ class SimpleDB:
         """Get all spreads."""
         return self.spreads.copy()
     
+    def count_spreads(self) -> int:
+        """Get the number of spreads without copying them."""
+        return len(self.spreads)
+    
     def create_spread(self, spread_data: Dict[str, Any]) -> str:
         """Create a new spread."""
         spread_id = str(uuid.uuid4())
@@ -255,47 +298,54 @@ class SimpleDB:
         reading_data['created_at'] = datetime.utcnow().isoformat()
         reading_data['updated_at'] = datetime.utcnow().isoformat()
         self.readings.append(reading_data)
+        self._readings_by_id[reading_id] = reading_data
         self._save_data(self.readings_file, self.readings)
         return reading_id
     
     def get_reading(self, reading_id: str) -> Optional[Dict[str, Any]]:
         """Get a reading by ID."""
-        for reading in self.readings:
-            if reading['id'] == reading_id:
-                return reading
-        return None
+        return self._readings_by_id.get(reading_id)
     
     def get_all_readings(self) -> List[Dict[str, Any]]:
         """Get all readings."""
         return self.readings.copy()
     
+    def count_readings(self) -> int:
+        """Get the number of readings without copying them."""
+        return len(self.readings)
+    
     def update_reading(self, reading_id: str, updates: Dict[str, Any]) -> bool:
         """Update a reading."""
-        for i, reading in enumerate(self.readings):
-            if reading['id'] == reading_id:
-                reading.update(updates)
-                reading['updated_at'] = datetime.utcnow().isoformat()
-                self.readings[i] = reading
-                self._save_data(self.readings_file, self.readings)
-                return True
-        return False
+        reading = self._readings_by_id.get(reading_id)
+        if reading is None:
+            return False
+        reading.update(updates)
+        reading['updated_at'] = datetime.utcnow().isoformat()
+        self._save_data(self.readings_file, self.readings)
+        return True
     
     def delete_reading(self, reading_id: str) -> bool:
         """Delete a reading."""
         for i, reading in enumerate(self.readings):
             if reading['id'] == reading_id:
                 del self.readings[i]
+                if self._readings_by_id.get(reading_id) is reading:
+                    # Point the ID at the next duplicate record, if the file held any
+                    del self._readings_by_id[reading_id]
+                    for other in self.readings[i:]:
+                        if other['id'] == reading_id:
+                            self._readings_by_id[reading_id] = other
+                            break
                 self._save_data(self.readings_file, self.readings)
                 return True
         return False
     
     # Memory operations
-    def store_memory(self, entity_type: str, entity_name: str, description: str = None, 
-                    context: str = None, importance_score: float = 1.0) -> str:
-        """Store a memory."""
-        memory_id = str(uuid.uuid4())
-        memory_data = {
-            'id': memory_id,
+    def _new_memory(self, entity_type: str, entity_name: str, description: str = None,
+                    context: str = None, importance_score: float = 1.0) -> Dict[str, Any]:
+        """Build a memory record with a fresh ID."""
+        return {
+            'id': str(uuid.uuid4()),
             'entity_type': entity_type,
             'entity_name': entity_name,
             'description': description,
@@ -304,22 +354,64 @@ class SimpleDB:
             'last_mentioned': datetime.utcnow().isoformat(),
             'created_at': datetime.utcnow().isoformat()
         }
+    
+    def store_memory(self, entity_type: str, entity_name: str, description: str = None, 
+                    context: str = None, importance_score: float = 1.0) -> str:
+        """Store a memory."""
+        memory_data = self._new_memory(entity_type, entity_name, description,
+                                       context, importance_score)
         self.memories.append(memory_data)
         self._save_data(self.memories_file, self.memories)
-        return memory_id
+        return memory_data['id']
+    
+    def store_memories(self, memories: List[Dict[str, Any]]) -> List[str]:
+        """Store several memories, saving the memories file once."""
+        new_memories = [self._new_memory(**memory_data) for memory_data in memories]
+        self.memories.extend(new_memories)
+        self._save_data(self.memories_file, self.memories)
+        return [memory['id'] for memory in new_memories]
+    
+    def _get_memory_search_text(self) -> List[Tuple[str, Optional[str], Optional[str]]]:
+        """Get the lowercased search fields of every memory, lowering only new or changed ones."""
+        search_text = self._memory_search_text
+        del search_text[len(self.memories):]
+        
+        lowered = []
+        for i, memory in enumerate(self.memories):
+            source = (memory['entity_name'], memory['description'], memory['context'])
+            if i < len(search_text):
+                cached_source, cached_text = search_text[i]
+                # The same field objects mean the memory is unchanged since it was lowered
+                if (cached_source[0] is source[0] and cached_source[1] is source[1]
+                        and cached_source[2] is source[2]):
+                    lowered.append(cached_text)
+                    continue
+            
+            name, description, context = source
+            text = (
+                name.lower(),
+                description.lower() if description else None,
+                context.lower() if context else None
+            )
+            if i < len(search_text):
+                search_text[i] = (source, text)
+            else:
+                search_text.append((source, text))
+            lowered.append(text)
+        return lowered
     
     def search_memories(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
         """Search memories by query."""
         query_lower = query.lower()
         results = []
         
-        for memory in self.memories:
+        for memory, (name, description, context) in zip(self.memories, self._get_memory_search_text()):
             score = 0
-            if query_lower in memory['entity_name'].lower():
+            if query_lower in name:
                 score += 2
-            if memory['description'] and query_lower in memory['description'].lower():
+            if description and query_lower in description:
                 score += 1
-            if memory['context'] and query_lower in memory['context'].lower():
+            if context and query_lower in context:
                 score += 1
             
             if score > 0:
@@ -352,6 +444,11 @@ class SimpleDB:
         self.settings[key] = value
         self._save_data(self.settings_file, self.settings)
     
+    def set_settings(self, settings: Dict[str, Any]):
+        """Set several setting values, saving the settings file once."""
+        self.settings.update(settings)
+        self._save_data(self.settings_file, self.settings)
+    
     # Conversation operations
     def create_conversation(self, title: str, reading_id: str = None, 
                           context: str = None) -> str:
@@ -368,36 +465,53 @@ class SimpleDB:
             'messages': []
         }
         self.conversations.append(conversation_data)
+        self._conversations_by_id[conversation_id] = conversation_data
         self._save_data(self.conversations_file, self.conversations)
         return conversation_id
     
     def add_message(self, conversation_id: str, role: str, content: str) -> bool:
         """Add a message to a conversation."""
-        for conversation in self.conversations:
-            if conversation['id'] == conversation_id:
-                message = {
-                    'id': len(conversation['messages']) + 1,
-                    'role': role,
-                    'content': content,
-                    'timestamp': datetime.utcnow().isoformat()
-                }
-                conversation['messages'].append(message)
-                conversation['updated_at'] = datetime.utcnow().isoformat()
-                self._save_data(self.conversations_file, self.conversations)
-                return True
-        return False
+        conversation = self._conversations_by_id.get(conversation_id)
+        if conversation is None:
+            return False
+        message = {
+            'id': len(conversation['messages']) + 1,
+            'role': role,
+            'content': content,
+            'timestamp': datetime.utcnow().isoformat()
+        }
+        conversation['messages'].append(message)
+        conversation['updated_at'] = datetime.utcnow().isoformat()
+        self._save_data(self.conversations_file, self.conversations)
+        return True
+    
+    def add_messages(self, conversation_id: str, messages: List[Tuple[str, str]]) -> bool:
+        """Add several (role, content) messages to a conversation, saving once."""
+        conversation = self._conversations_by_id.get(conversation_id)
+        if conversation is None:
+            return False
+        timestamp = datetime.utcnow().isoformat()
+        first_id = len(conversation['messages']) + 1
+        conversation['messages'].extend(
+            {'id': message_id, 'role': role, 'content': content, 'timestamp': timestamp}
+            for message_id, (role, content) in enumerate(messages, first_id)
+        )
+        conversation['updated_at'] = timestamp
+        self._save_data(self.conversations_file, self.conversations)
+        return True
     
     def get_conversation(self, conversation_id: str) -> Optional[Dict[str, Any]]:
         """Get a conversation by ID."""
-        for conversation in self.conversations:
-            if conversation['id'] == conversation_id:
-                return conversation
-        return None
+        return self._conversations_by_id.get(conversation_id)
     
     def get_all_conversations(self) -> List[Dict[str, Any]]:
         """Get all conversations."""
         return self.conversations.copy()
     
+    def count_conversations(self) -> int:
+        """Get the number of conversations without copying them."""
+        return len(self.conversations)
+    
     def close(self):
         """Close the database connection."""
         # Save all data
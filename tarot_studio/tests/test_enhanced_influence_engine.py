@@ -9,7 +9,7 @@ import json
 from typing import Dict, Any, List
 from tarot_studio.core.enhanced_influence_engine import (
     EnhancedInfluenceEngine, EngineConfig, CardMetadata, CardPosition, 
-    InfluencedCard, InfluenceFactor, Orientation, Arcana, Element
+    InfluencedCard, InfluenceFactor, Orientation, Arcana, Element, _LazyThemes
 )
 
 class TestEnhancedInfluenceEngine:
@@ -118,6 +118,21 @@ class TestEnhancedInfluenceEngine:
             }
         }
     
+    def _run_pipeline(self, cards, adjacency_matrix):
+        """Run the rule pipeline over (position, card_id, orientation) tuples, keyed by position."""
+        card_positions = []
+        for idx, (position_id, card_id, orientation) in enumerate(cards):
+            card_metadata = self.engine.load_card_metadata(self.card_database[card_id])
+            card_positions.append(CardPosition(position_id, card_id, orientation, card_metadata, idx=idx))
+        
+        compiled_matrix = self.engine._compile_adjacency_matrix(adjacency_matrix)
+        influenced_cards = self.engine._apply_rule_pipeline(card_positions, compiled_matrix)
+        return {card.position: card for card in influenced_cards}
+    
+    def _factors(self, influenced_card, prefix):
+        """Return the card's influence factors whose explanation starts with prefix."""
+        return [f for f in influenced_card.influence_factors if f.explain.startswith(prefix)]
+    
     def test_engine_initialization(self):
         """Test engine initialization with default config."""
         engine = EnhancedInfluenceEngine()
@@ -152,6 +167,23 @@ class TestEnhancedInfluenceEngine:
         assert "joy" in card_metadata.keywords
         assert card_metadata.themes["joy"] == 0.9
     
+    def test_load_card_metadata_after_in_place_edit(self):
+        """Test that clearing the cache picks up card data edited in place."""
+        card_data = self.card_database["the_sun"]
+        first = self.engine.load_card_metadata(card_data)
+        
+        assert self.engine.load_card_metadata(card_data) is first
+        
+        card_data["polarity"] = 0.5
+        card_data["themes"]["joy"] = 0.4
+        assert self.engine.load_card_metadata(card_data) is first
+        
+        self.engine.clear_card_metadata_cache("the_sun")
+        card_metadata = self.engine.load_card_metadata(card_data)
+        
+        assert card_metadata.baseline_polarity == 0.5
+        assert card_metadata.themes["joy"] == 0.4
+    
     def test_elemental_affinity_matrix_traditional(self):
         """Test traditional elemental affinity matrix."""
         config = EngineConfig(elemental_system="traditional")
@@ -214,206 +246,152 @@ class TestEnhancedInfluenceEngine:
     
     def test_adjacency_influence_rule(self):
         """Test adjacency influence rule."""
-        # Create test cards
-        card1_metadata = self.engine.load_card_metadata(self.card_database["the_sun"])
-        card2_metadata = self.engine.load_card_metadata(self.card_database["ace_of_wands"])
-        
-        card1_pos = CardPosition("past", "the_sun", Orientation.UPRIGHT, card1_metadata)
-        card2_pos = CardPosition("present", "ace_of_wands", Orientation.UPRIGHT, card2_metadata)
-        
-        # Create influenced card
-        influenced_card = InfluencedCard(
-            position="present",
-            card_id="ace_of_wands",
-            card_name="Ace of Wands",
-            orientation="upright",
-            base_text="Test text",
-            influenced_text="",
-            polarity_score=0.8,
-            intensity_score=0.7,
-            themes={"inspiration": 0.9},
-            influence_factors=[],
-            journal_prompt=""
+        cards = self._run_pipeline(
+            [("past", "the_sun", Orientation.UPRIGHT), ("present", "ace_of_wands", Orientation.UPRIGHT)],
+            {"present": {"past": 1.0}}
         )
-        
-        # Apply adjacency influence
-        adjacency_matrix = {"present": {"past": 1.0}}
-        self.engine._apply_adjacency_influence(influenced_card, [card1_pos], adjacency_matrix)
+        influenced_card = cards["present"]
+        factors = self._factors(influenced_card, "Adjacency influence")
         
         # Check that influence was applied
         assert influenced_card.polarity_score > 0.8  # Should be increased
-        assert len(influenced_card.influence_factors) == 1
-        assert influenced_card.influence_factors[0].source_card_id == "the_sun"
-        assert influenced_card.influence_factors[0].explain.startswith("Adjacency influence")
+        assert len(factors) == 1
+        assert factors[0].source_card_id == "the_sun"
     
     def test_elemental_dignities_rule(self):
         """Test elemental dignities rule."""
         # Create test cards with same element (fire)
-        card1_metadata = self.engine.load_card_metadata(self.card_database["the_sun"])
-        card2_metadata = self.engine.load_card_metadata(self.card_database["ace_of_wands"])
-        
-        card1_pos = CardPosition("past", "the_sun", Orientation.UPRIGHT, card1_metadata)
-        card2_pos = CardPosition("present", "ace_of_wands", Orientation.UPRIGHT, card2_metadata)
-        
-        # Create influenced card
-        influenced_card = InfluencedCard(
-            position="present",
-            card_id="ace_of_wands",
-            card_name="Ace of Wands",
-            orientation="upright",
-            base_text="Test text",
-            influenced_text="",
-            polarity_score=0.8,
-            intensity_score=0.7,
-            themes={"inspiration": 0.9},
-            influence_factors=[],
-            journal_prompt=""
+        cards = self._run_pipeline(
+            [("past", "the_sun", Orientation.UPRIGHT), ("present", "ace_of_wands", Orientation.UPRIGHT)],
+            {"present": {"past": 1.0}}
         )
-        
-        # Apply elemental dignities
-        self.engine._apply_elemental_dignities(influenced_card, [card1_pos])
+        factors = self._factors(cards["present"], "Elemental affinity")
         
         # Check that elemental affinity was applied
-        assert len(influenced_card.influence_factors) == 1
-        assert influenced_card.influence_factors[0].explain.startswith("Elemental affinity")
-        assert "fire" in influenced_card.influence_factors[0].explain
+        assert len(factors) == 1
+        assert "fire" in factors[0].explain
     
     def test_major_dominance_rule(self):
         """Test Major Arcana dominance rule."""
         # Create test cards - Major Arcana influencing Minor Arcana
-        card1_metadata = self.engine.load_card_metadata(self.card_database["the_sun"])
-        card2_metadata = self.engine.load_card_metadata(self.card_database["ace_of_wands"])
-        
-        card1_pos = CardPosition("past", "the_sun", Orientation.UPRIGHT, card1_metadata)
-        card2_pos = CardPosition("present", "ace_of_wands", Orientation.UPRIGHT, card2_metadata)
-        
-        # Create influenced card (Minor Arcana)
-        influenced_card = InfluencedCard(
-            position="present",
-            card_id="ace_of_wands",
-            card_name="Ace of Wands",
-            orientation="upright",
-            base_text="Test text",
-            influenced_text="",
-            polarity_score=0.8,
-            intensity_score=0.7,
-            themes={"inspiration": 0.9},
-            influence_factors=[],
-            journal_prompt=""
+        cards = self._run_pipeline(
+            [("past", "the_sun", Orientation.UPRIGHT), ("present", "ace_of_wands", Orientation.UPRIGHT)],
+            {"present": {"past": 1.0}}
         )
-        
-        # Apply Major dominance
-        self.engine._apply_major_dominance(influenced_card, [card1_pos])
+        factors = self._factors(cards["present"], "Major Arcana dominance")
         
         # Check that Major dominance was applied
-        assert len(influenced_card.influence_factors) == 1
-        assert influenced_card.influence_factors[0].explain.startswith("Major Arcana dominance")
-        assert "1.5x" in influenced_card.influence_factors[0].explain
+        assert len(factors) == 1
+        assert "1.5x" in factors[0].explain
     
     def test_numerical_sequence_detection(self):
         """Test numerical sequence detection rule."""
         # Create test cards with numerical sequence
-        card1_metadata = self.engine.load_card_metadata(self.card_database["ace_of_wands"])
-        card2_metadata = self.engine.load_card_metadata(self.card_database["two_of_wands"])
-        card3_metadata = self.engine.load_card_metadata(self.card_database["three_of_wands"])
-        
-        card1_pos = CardPosition("past", "ace_of_wands", Orientation.UPRIGHT, card1_metadata)
-        card2_pos = CardPosition("present", "two_of_wands", Orientation.UPRIGHT, card2_metadata)
-        card3_pos = CardPosition("future", "three_of_wands", Orientation.UPRIGHT, card3_metadata)
-        
-        all_cards = [card1_pos, card2_pos, card3_pos]
-        
-        # Create influenced card
-        influenced_card = InfluencedCard(
-            position="present",
-            card_id="two_of_wands",
-            card_name="Two of Wands",
-            orientation="upright",
-            base_text="Test text",
-            influenced_text="",
-            polarity_score=0.6,
-            intensity_score=0.6,
-            themes={"planning": 0.8},
-            influence_factors=[],
-            journal_prompt=""
+        cards = self._run_pipeline(
+            [
+                ("past", "ace_of_wands", Orientation.UPRIGHT),
+                ("present", "two_of_wands", Orientation.UPRIGHT),
+                ("future", "three_of_wands", Orientation.UPRIGHT)
+            ],
+            {}
         )
-        
-        # Apply numerical sequence detection
-        self.engine._apply_numerical_sequences(influenced_card, all_cards)
+        influenced_card = cards["present"]
+        factors = self._factors(influenced_card, "Numerical sequence detected")
         
         # Check that sequence was detected
         assert "continuity" in influenced_card.themes
         assert influenced_card.themes["continuity"] > 0
         assert influenced_card.intensity_score > 0.6
-        assert len(influenced_card.influence_factors) == 1
-        assert influenced_card.influence_factors[0].explain.startswith("Numerical sequence detected")
+        assert len(factors) == 1
     
     def test_reversal_propagation_rule(self):
         """Test reversal propagation rule."""
         # Create test cards with reversed neighbor
-        card1_metadata = self.engine.load_card_metadata(self.card_database["the_moon"])
-        card2_metadata = self.engine.load_card_metadata(self.card_database["ace_of_wands"])
-        
-        card1_pos = CardPosition("past", "the_moon", Orientation.REVERSED, card1_metadata)
-        card2_pos = CardPosition("present", "ace_of_wands", Orientation.UPRIGHT, card2_metadata)
-        
-        # Create influenced card
-        influenced_card = InfluencedCard(
-            position="present",
-            card_id="ace_of_wands",
-            card_name="Ace of Wands",
-            orientation="upright",
-            base_text="Test text",
-            influenced_text="",
-            polarity_score=0.8,
-            intensity_score=0.7,
-            themes={"inspiration": 0.9},
-            influence_factors=[],
-            journal_prompt=""
+        cards = self._run_pipeline(
+            [("past", "the_moon", Orientation.REVERSED), ("present", "ace_of_wands", Orientation.UPRIGHT)],
+            {"present": {"past": 1.0}}
         )
-        
-        # Apply reversal propagation
-        self.engine._apply_reversal_propagation(influenced_card, [card1_pos])
+        influenced_card = cards["present"]
+        factors = self._factors(influenced_card, "Reversal propagation")
         
         # Check that reversal propagation was applied
         assert influenced_card.intensity_score < 0.7  # Should be reduced
-        assert len(influenced_card.influence_factors) == 1
-        assert influenced_card.influence_factors[0].explain.startswith("Reversal propagation")
-        assert "decay" in influenced_card.influence_factors[0].explain
+        assert len(factors) == 1
+        assert "decay" in factors[0].explain
     
-    def test_conflict_resolution_rule(self):
-        """Test conflict resolution rule."""
-        # Create test cards with opposing polarities
-        card1_metadata = self.engine.load_card_metadata(self.card_database["the_sun"])
-        card2_metadata = self.engine.load_card_metadata(self.card_database["five_of_swords"])
+    def test_reversal_propagation_after_numerical_sequence(self):
+        """Test that sequence intensity is added before reversal propagation subtracts."""
+        cards = self._run_pipeline(
+            [
+                ("past", "the_moon", Orientation.REVERSED),
+                ("present", "ace_of_wands", Orientation.UPRIGHT),
+                ("future", "two_of_wands", Orientation.UPRIGHT)
+            ],
+            {"present": {"past": 1.0}}
+        )
         
-        card1_pos = CardPosition("past", "the_sun", Orientation.UPRIGHT, card1_metadata)
-        card2_pos = CardPosition("present", "five_of_swords", Orientation.UPRIGHT, card2_metadata)
+        # Same operation order as applying the rules one at a time
+        expected = (0.7 + 0.1) - 0.7 * (1.0 - self.config.reversal_decay_factor)
+        assert cards["present"].intensity_score == expected
+    
+    def test_lazy_themes_copy_on_write(self):
+        """Test that theme writes copy the shared base dict first."""
+        base = {"joy": 0.9}
+        first = _LazyThemes(base)
+        second = _LazyThemes(base)
+        
+        first["continuity"] = 0.3
+        del second["joy"]
+        
+        assert base == {"joy": 0.9}
+        assert first == {"joy": 0.9, "continuity": 0.3}
+        assert second == {}
+    
+    def test_lazy_themes_copy(self):
+        """Test that copy() returns an independent plain dict."""
+        base = {"joy": 0.9}
+        themes = _LazyThemes(base)
         
-        all_cards = [card1_pos, card2_pos]
+        copied = themes.copy()
+        copied["joy"] = 0.1
         
-        # Create influenced card
-        influenced_card = InfluencedCard(
-            position="present",
-            card_id="five_of_swords",
-            card_name="Five of Swords",
-            orientation="upright",
-            base_text="Test text",
-            influenced_text="",
-            polarity_score=-0.6,
-            intensity_score=0.7,
-            themes={"conflict": 0.8},
-            influence_factors=[],
-            journal_prompt=""
+        assert type(copied) is dict
+        assert themes["joy"] == 0.9
+        assert base == {"joy": 0.9}
+    
+    def test_themes_isolated_between_cards(self):
+        """Test that cards sharing metadata do not share theme changes."""
+        cards = self._run_pipeline(
+            [
+                ("past", "ace_of_wands", Orientation.UPRIGHT),
+                ("present", "two_of_wands", Orientation.UPRIGHT),
+                ("future", "ace_of_wands", Orientation.REVERSED)
+            ],
+            {"present": {"past": 1.0, "future": 1.0}}
         )
         
-        # Apply conflict resolution
-        self.engine._apply_conflict_resolution(influenced_card, all_cards)
+        future_themes = cards["future"].themes.copy()
+        cards["past"].themes["inspiration"] = 0.0
+        
+        metadata = self.engine.load_card_metadata(self.card_database["ace_of_wands"])
+        assert metadata.themes == self.card_database["ace_of_wands"]["themes"]
+        assert cards["future"].themes == future_themes
+        assert cards["future"].themes["continuity"] == 0.3
+    
+    def test_conflict_resolution_rule(self):
+        """Test conflict resolution rule."""
+        # Create test cards with opposing polarities
+        cards = self._run_pipeline(
+            [("past", "the_sun", Orientation.UPRIGHT), ("present", "five_of_swords", Orientation.UPRIGHT)],
+            {}
+        )
+        influenced_card = cards["present"]
+        factors = self._factors(influenced_card, "Conflict resolution")
         
         # Check that conflict resolution was applied
-        assert len(influenced_card.influence_factors) == 1
-        assert influenced_card.influence_factors[0].explain.startswith("Conflict resolution")
-        assert "damping" in influenced_card.influence_factors[0].explain
+        assert influenced_card.polarity_score > -0.6  # Should be damped
+        assert len(factors) == 1
+        assert "damping" in factors[0].explain
     
     def test_narrative_boost_rule(self):
         """Test narrative boost rule."""
@@ -679,6 +657,30 @@ class TestEnhancedInfluenceEngine:
             assert card["influenced_text"] != ""
             assert card["base_text"] in card["influenced_text"]  # Should contain base text
     
+    def test_template_ignores_effects_shown_as_zero(self):
+        """Test that factors displayed as zero neither enhance nor temper the meaning."""
+        influenced_card = InfluencedCard(
+            position="present",
+            card_id="ace_of_wands",
+            card_name="Ace of Wands",
+            orientation="upright",
+            base_text="Test text",
+            influenced_text="",
+            polarity_score=0.8,
+            intensity_score=0.7,
+            themes={"inspiration": 0.9},
+            influence_factors=[
+                InfluenceFactor("past", "the_moon", "-0.00", "Reversal propagation (decay: 0.8)", value=-0.004),
+                InfluenceFactor("future", "the_sun", "+1.00", "Adjacency influence (weight: 1.00)", value=1.0)
+            ],
+            journal_prompt=""
+        )
+        
+        text = self.engine._generate_template_interpretation(influenced_card)
+        
+        assert "enhanced by the_sun" in text
+        assert "tempered" not in text
+    
     def test_journal_prompt_generation(self):
         """Test journal prompt generation."""
         card_metadata = self.engine.load_card_metadata(self.card_database["the_sun"])
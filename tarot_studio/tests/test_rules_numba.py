@@ -0,0 +1,222 @@
+"""
+Parity tests for the numeric rule kernels.
+
+Each kernel is compared against a plain Python version of the same rules,
+written in the rule order the engines use, so the results must match exactly.
+"""
+
+import random
+import pytest
+from tarot_studio.core import _rules_numba
+from tarot_studio.core._rules_numba import (
+    apply_rules, polarity_score, polarity_scores, POLARITY_KERNEL_MIN_FACTORS
+)
+from tarot_studio.core.enhanced_influence_engine import (
+    EnhancedInfluenceEngine, EngineConfig, create_test_card_database
+)
+
+AFFINITY = [
+    [1.2, 0.8, 1.0, 0.6],
+    [0.8, 1.2, 0.6, 1.0],
+    [1.0, 0.6, 1.2, 0.8],
+    [0.6, 1.0, 0.8, 1.2]
+]
+
+def reference_rules(cards, neighbors, damp_factor, decay):
+    """Apply the neighbor rules to each card one rule at a time."""
+    polarity_scores_out = []
+    intensity_scores_out = []
+    for i, card in enumerate(cards):
+        polarity = card["polarity"]
+        intensity = card["intensity"]
+
+        for j, weight in neighbors[i]:
+            polarity += cards[j]["base_polarity"] * weight
+
+        if card["element"] >= 0:
+            for j, weight in neighbors[i]:
+                if cards[j]["element"] >= 0:
+                    polarity *= AFFINITY[card["element"]][cards[j]["element"]]
+
+        for j, weight in neighbors[i]:
+            if cards[j]["reversed"]:
+                intensity -= cards[j]["base_intensity"] * (1.0 - decay)
+
+        polarity_scores_out.append(polarity * damp_factor)
+        intensity_scores_out.append(intensity)
+    return polarity_scores_out, intensity_scores_out
+
+def random_spread(rng, count):
+    """Build random cards and a random weighted neighbor list for each card."""
+    cards = []
+    for _ in range(count):
+        base_polarity = rng.uniform(-1.0, 1.0)
+        base_intensity = rng.uniform(0.0, 1.0)
+        is_reversed = rng.random() < 0.4
+        cards.append({
+            "base_polarity": base_polarity,
+            "base_intensity": base_intensity,
+            "polarity": base_polarity * -0.8 if is_reversed else base_polarity,
+            "intensity": (base_intensity * 0.9 if is_reversed else base_intensity) + 0.1 * rng.randint(0, 2),
+            "element": rng.randint(-1, 3),
+            "reversed": is_reversed
+        })
+
+    neighbors = [
+        [(j, rng.choice([1.0, 0.8, 0.5, 1.0 / 3.0])) for j in range(count) if j != i and rng.random() < 0.6]
+        for i in range(count)
+    ]
+    return cards, neighbors
+
+def run_kernel(cards, neighbors, damp_factor, decay):
+    """Flatten the spread into the kernel's arrays and run apply_rules."""
+    neighbor_ptr = [0]
+    neighbor_idx = []
+    neighbor_weight = []
+    for card_neighbors in neighbors:
+        for j, weight in card_neighbors:
+            neighbor_idx.append(j)
+            neighbor_weight.append(weight)
+        neighbor_ptr.append(len(neighbor_idx))
+
+    return apply_rules(
+        [c["base_polarity"] for c in cards],
+        [c["base_intensity"] for c in cards],
+        [c["polarity"] for c in cards],
+        [c["intensity"] for c in cards],
+        [c["element"] for c in cards],
+        [1 if c["reversed"] else 0 for c in cards],
+        neighbor_ptr, neighbor_idx, neighbor_weight, AFFINITY,
+        damp_factor, decay
+    )
+
+class TestRulesKernel:
+    """Parity tests for apply_rules."""
+
+    @pytest.mark.parametrize("seed", range(20))
+    @pytest.mark.parametrize("damp_factor", [1.0, 0.7])
+    def test_apply_rules_matches_reference(self, seed, damp_factor):
+        """Test that the kernel matches the rule-by-rule Python version exactly."""
+        rng = random.Random(seed)
+        cards, neighbors = random_spread(rng, rng.randint(1, 12))
+
+        expected = reference_rules(cards, neighbors, damp_factor, 0.8)
+        polarity, intensity = run_kernel(cards, neighbors, damp_factor, 0.8)
+
+        assert list(polarity) == expected[0]
+        assert list(intensity) == expected[1]
+
+    def test_apply_rules_without_neighbors(self):
+        """Test that cards without neighbors keep their starting scores."""
+        cards = [
+            {"base_polarity": 0.6, "base_intensity": 0.5, "polarity": -0.48,
+             "intensity": 0.45, "element": 0, "reversed": True}
+        ]
+
+        polarity, intensity = run_kernel(cards, [[]], 0.7, 0.8)
+
+        assert list(polarity) == [-0.48 * 0.7]
+        assert list(intensity) == [0.45]
+
+    def test_apply_rules_empty_spread(self):
+        """Test that an empty spread yields empty score lists."""
+        polarity, intensity = run_kernel([], [], 1.0, 0.8)
+
+        assert list(polarity) == []
+        assert list(intensity) == []
+
+class TestPolarityKernels:
+    """Parity tests for polarity_score and polarity_scores."""
+
+    @pytest.mark.parametrize("count", range(POLARITY_KERNEL_MIN_FACTORS * 2 + 1))
+    def test_polarity_score_matches_sum(self, count):
+        """Test polarity_score on both sides of the kernel threshold."""
+        rng = random.Random(count)
+        base = rng.uniform(-1.0, 1.0)
+        effects = [rng.uniform(-0.9, 0.9) for _ in range(count)]
+
+        expected = max(-2.0, min(2.0, base + sum(effects)))
+
+        assert polarity_score(base, effects, -2.0, 2.0) == expected
+
+    def test_polarity_score_clamps(self):
+        """Test that polarity_score clamps to the given range."""
+        assert polarity_score(1.5, [0.6, 0.6, 0.6, 0.6], -2.0, 2.0) == 2.0
+        assert polarity_score(-1.5, [-0.6, -0.6, -0.6, -0.6], -2.0, 2.0) == -2.0
+        assert polarity_score(1.5, [0.6], -2.0, 2.0) == 2.0
+
+    @pytest.mark.parametrize("seed", range(10))
+    def test_polarity_scores_matches_polarity_score(self, seed):
+        """Test that the batch version matches scoring each card on its own."""
+        rng = random.Random(seed)
+        bases = [rng.uniform(-1.0, 1.0) for _ in range(rng.randint(0, 10))]
+        effect_lists = [[rng.uniform(-0.9, 0.9) for _ in range(rng.randint(0, 5))] for _ in bases]
+
+        expected = [max(-2.0, min(2.0, base + sum(effects))) for base, effects in zip(bases, effect_lists)]
+
+        assert polarity_scores(bases, effect_lists, -2.0, 2.0) == expected
+        assert [polarity_score(b, e, -2.0, 2.0) for b, e in zip(bases, effect_lists)] == expected
+
+class TestCompiledKernels:
+    """Parity tests for the Numba-compiled kernels against their Python bodies."""
+
+    def setup_method(self):
+        """Skip unless Numba is installed."""
+        pytest.importorskip("numba")
+
+    def use_python_kernels(self, monkeypatch):
+        """Route every kernel call through the uncompiled Python functions."""
+        monkeypatch.setattr(_rules_numba, "NUMBA_AVAILABLE", False)
+        monkeypatch.setattr(_rules_numba, "_apply_rules_kernel", _rules_numba._apply_rules_kernel.py_func)
+
+    @pytest.mark.parametrize("seed", range(20))
+    def test_compiled_apply_rules_matches_python(self, seed, monkeypatch):
+        """Test that the compiled rule kernel matches its Python body exactly."""
+        rng = random.Random(seed)
+        cards, neighbors = random_spread(rng, rng.randint(1, 12))
+
+        compiled = run_kernel(cards, neighbors, 0.7, 0.8)
+        self.use_python_kernels(monkeypatch)
+        expected = run_kernel(cards, neighbors, 0.7, 0.8)
+
+        assert compiled == expected
+        assert all(type(score) is float for score in compiled[0] + compiled[1])
+
+    @pytest.mark.parametrize("count", [POLARITY_KERNEL_MIN_FACTORS, POLARITY_KERNEL_MIN_FACTORS * 3])
+    def test_compiled_polarity_kernels_match_python(self, count, monkeypatch):
+        """Test that the compiled polarity kernels match the Python sums exactly."""
+        rng = random.Random(count)
+        bases = [rng.uniform(-1.0, 1.0) for _ in range(5)]
+        effect_lists = [[rng.uniform(-0.9, 0.9) for _ in range(count)] for _ in bases]
+
+        compiled_single = polarity_score(bases[0], effect_lists[0], -2.0, 2.0)
+        compiled_batch = polarity_scores(bases, effect_lists, -2.0, 2.0)
+        self.use_python_kernels(monkeypatch)
+
+        assert compiled_single == polarity_score(bases[0], effect_lists[0], -2.0, 2.0)
+        assert compiled_batch == polarity_scores(bases, effect_lists, -2.0, 2.0)
+
+    @pytest.mark.parametrize("elemental_system", ["traditional", "crowley", "simplified"])
+    def test_engine_output_matches_python_kernels(self, elemental_system, monkeypatch):
+        """Test that readings come out the same with the compiled and Python kernels."""
+        engine = EnhancedInfluenceEngine(EngineConfig(elemental_system=elemental_system))
+        card_database = create_test_card_database()
+        card_ids = sorted(card_database)
+        spread_data = {
+            "reading_id": "kernel_parity",
+            "spread_type": "celtic_cross",
+            "positions": [
+                {
+                    "position_id": position_id,
+                    "card_id": card_ids[i % len(card_ids)],
+                    "orientation": "reversed" if i % 3 == 0 else "upright"
+                }
+                for i, position_id in enumerate(engine.adjacency_matrices["celtic_cross"])
+            ]
+        }
+
+        compiled = engine.compute_influenced_meanings(spread_data, card_database)
+        self.use_python_kernels(monkeypatch)
+        expected = engine.compute_influenced_meanings(spread_data, card_database)
+
+        assert compiled == expected
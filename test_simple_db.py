@@ -5,6 +5,7 @@ Test script for SimpleDB implementation.
 
 import sys
 import os
+import tempfile
 sys.path.append('.')
 
 def test_simple_db():
@@ -129,6 +130,180 @@ def test_simple_db():
         traceback.print_exc()
         return False
 
+def test_simple_db_counts():
+    """Test that the count methods track the stored records."""
+    from tarot_studio.db.simple_db import SimpleDB
+    
+    with tempfile.TemporaryDirectory() as db_path:
+        db = SimpleDB(db_path)
+        
+        assert db.count_cards() == len(db.get_all_cards())
+        assert db.count_spreads() == len(db.get_all_spreads())
+        assert db.count_readings() == len(db.get_all_readings()) == 0
+        assert db.count_conversations() == len(db.get_all_conversations()) == 0
+        
+        spread_count = db.count_spreads()
+        db.create_spread({'name': 'Test Spread', 'positions': []})
+        reading_id = db.create_reading({'title': 'Test Reading'})
+        db.create_conversation(title="Test Conversation", reading_id=reading_id)
+        
+        assert db.count_spreads() == spread_count + 1
+        assert db.count_readings() == 1
+        assert db.count_conversations() == 1
+        
+        db.delete_reading(reading_id)
+        assert db.count_readings() == 0
+        db.close()
+    print("✅ Count operations work")
+
+def test_simple_db_store_memories():
+    """Test batch memory storage, its IDs and the memory search cache."""
+    from tarot_studio.db.simple_db import SimpleDB
+    
+    with tempfile.TemporaryDirectory() as db_path:
+        db = SimpleDB(db_path)
+        first_id = db.store_memory(entity_type="person", entity_name="Alice", description="Old friend")
+        
+        # Search once so the search text cache is filled before the batch insert
+        assert [m['id'] for m in db.search_memories("friend")] == [first_id]
+        
+        memory_ids = db.store_memories([
+            {'entity_type': "person", 'entity_name': "Bob", 'description': "New friend"},
+            {'entity_type': "place", 'entity_name': "Garden", 'context': "Where Bob met a friend",
+             'importance_score': 0.5}
+        ])
+        
+        assert len(memory_ids) == 2
+        assert len(set(memory_ids + [first_id])) == 3
+        assert [m['id'] for m in db.memories] == [first_id] + memory_ids
+        assert db.memories[2]['importance_score'] == 0.5
+        
+        # The cached search text covers the new memories too
+        assert {m['id'] for m in db.search_memories("friend")} == {first_id} | set(memory_ids)
+        assert [m['id'] for m in db.search_memories("bob")] == memory_ids
+        db.close()
+        
+        reopened = SimpleDB(db_path)
+        assert [m['id'] for m in reopened.memories] == [first_id] + memory_ids
+        reopened.close()
+    print("✅ Batch memory storage works")
+
+def test_simple_db_set_settings():
+    """Test that settings set together persist after reopening the database."""
+    from tarot_studio.db.simple_db import SimpleDB
+    
+    with tempfile.TemporaryDirectory() as db_path:
+        db = SimpleDB(db_path)
+        db.set_setting("theme", "light")
+        db.set_settings({"theme": "dark", "ollama_model": "llama3", "auto_save": True})
+        assert db.get_setting("theme") == "dark"
+        
+        # Reopen before close() so only set_settings() has written the file
+        reopened = SimpleDB(db_path)
+        assert reopened.get_setting("theme") == "dark"
+        assert reopened.get_setting("ollama_model") == "llama3"
+        assert reopened.get_setting("auto_save") is True
+        reopened.close()
+        db.close()
+    print("✅ Batch settings persist")
+
+def test_simple_db_add_messages():
+    """Test appending several messages to a conversation at once."""
+    from tarot_studio.db.simple_db import SimpleDB
+    
+    with tempfile.TemporaryDirectory() as db_path:
+        db = SimpleDB(db_path)
+        
+        # Unknown conversations are rejected without creating anything
+        assert db.add_messages("no-such-conversation", [("user", "Hello")]) is False
+        assert db.count_conversations() == 0
+        
+        conversation_id = db.create_conversation(title="Test Conversation")
+        assert db.add_message(conversation_id, "user", "First")
+        assert db.add_messages(conversation_id, [("assistant", "Second"), ("user", "Third")])
+        
+        messages = db.get_conversation(conversation_id)['messages']
+        assert [m['id'] for m in messages] == [1, 2, 3]
+        assert [(m['role'], m['content']) for m in messages] == [
+            ("user", "First"), ("assistant", "Second"), ("user", "Third")
+        ]
+        
+        # Reopen before close() so only the add methods have written the file
+        reopened = SimpleDB(db_path)
+        assert reopened.get_conversation(conversation_id)['messages'] == messages
+        reopened.close()
+        db.close()
+    print("✅ Batch messages work")
+
+def test_simple_db_search_after_memory_edits():
+    """Test that memory searches see memories edited after an earlier search."""
+    from tarot_studio.db.simple_db import SimpleDB
+    
+    with tempfile.TemporaryDirectory() as db_path:
+        db = SimpleDB(db_path)
+        first_id, second_id = db.store_memories([
+            {'entity_type': "person", 'entity_name': "Alice", 'description': "Old friend"},
+            {'entity_type': "person", 'entity_name': "Bob", 'description': "Colleague"}
+        ])
+        assert [m['id'] for m in db.search_memories("friend")] == [first_id]
+        
+        # In-place edit of a stored memory
+        db.memories[0]['description'] = "Neighbour"
+        db.memories[1]['description'] = "Close friend"
+        assert [m['id'] for m in db.search_memories("friend")] == [second_id]
+        assert [m['id'] for m in db.search_memories("neighbour")] == [first_id]
+        
+        # Same-length replacement: pop the last memory and store a new one
+        db.memories.pop()
+        third_id = db.store_memory(entity_type="place", entity_name="Garden", context="Quiet place")
+        assert db.search_memories("friend") == []
+        assert [m['id'] for m in db.search_memories("garden")] == [third_id]
+        db.close()
+    print("✅ Memory search follows edits")
+
+def test_simple_db_delete_reading():
+    """Test deleting readings, including IDs duplicated in the readings file."""
+    import json
+    from tarot_studio.db.simple_db import SimpleDB
+    
+    with tempfile.TemporaryDirectory() as db_path:
+        db = SimpleDB(db_path)
+        reading_id = db.create_reading({'title': 'Test Reading'})
+        
+        assert db.delete_reading(reading_id)
+        assert db.get_reading(reading_id) is None
+        assert db.count_readings() == 0
+        assert not db.delete_reading(reading_id)
+        db.close()
+        
+        # Two records sharing an ID, as a hand-edited file might hold
+        with open(os.path.join(db_path, "readings.json"), "w", encoding="utf-8") as f:
+            json.dump([
+                {'id': 'dup', 'title': 'First'},
+                {'id': 'dup', 'title': 'Second'},
+                {'id': 'other', 'title': 'Other'}
+            ], f)
+        
+        db = SimpleDB(db_path)
+        assert db.get_reading('dup')['title'] == 'First'
+        
+        assert db.delete_reading('dup')
+        assert db.get_reading('dup')['title'] == 'Second'
+        assert db.count_readings() == 2
+        
+        assert db.delete_reading('dup')
+        assert db.get_reading('dup') is None
+        assert db.count_readings() == 1
+        assert db.get_reading('other')['title'] == 'Other'
+        db.close()
+    print("✅ Reading deletion works")
+
 if __name__ == "__main__":
     success = test_simple_db()
+    test_simple_db_counts()
+    test_simple_db_delete_reading()
+    test_simple_db_store_memories()
+    test_simple_db_search_after_memory_edits()
+    test_simple_db_set_settings()
+    test_simple_db_add_messages()
     sys.exit(0 if success else 1)
\ No newline at end of file